@@ -0,0 +1,247 @@
+import numpy as np
+import pandas as pd
+from scipy.optimize import linear_sum_assignment
+
+from analytics.skills_index import MAX_SKILL_LEVEL
+
+PROJECT_SKILLS = [
+    "Backend",
+    "Frontend",
+    "Data Engineering",
+    "QA",
+    "DevOps",
+    "Design",
+    "Project Management",
+    "Data Analysis",
+]
+
+# Shortfall slots of at-risk and delayed projects are filled first
+STATUS_PRIORITY = {"on-track": 1.0, "at-risk": 1.5, "delayed": 2.0, "unknown": 1.0}
+
+# Cost of pulling someone off another project rather than the bench, and of
+# each skill level above what a slot needs; both stay small next to the
+# priority of filling a slot so fewer filled slots never wins
+MOVE_COST = 0.1
+OVERQUALIFIED_COST = 0.02
+
+MOVE_COLUMNS = ["employee_id", "from_project", "to_project", "skill", "level"]
+
+
+def generate_project_staffing(projects, bench_share=0.08, seed=0):
+    # Splits each project's required and allocated FTEs over one to three
+    # skills (independently, so some projects end up over-staffed in one
+    # skill and short in another), and adds a bench of unassigned people per
+    # department. Returns requirements, people and their skill levels
+    rng = np.random.default_rng(seed)
+    num_projects, num_skills = len(projects), len(PROJECT_SKILLS)
+    skill_count = rng.integers(1, 4, num_projects)
+    skills = np.argsort(rng.random((num_projects, num_skills)), axis=1)[:, :3]
+    weights = rng.dirichlet(np.ones(3), num_projects) * (
+        np.arange(3) < skill_count[:, None]
+    )
+    weights /= weights.sum(axis=1, keepdims=True)
+    required = rng.multinomial(projects["required_fte"].to_numpy(), weights)
+    drifted = weights * rng.lognormal(0, 0.3, weights.shape)
+    allocated = rng.multinomial(
+        projects["allocated_fte"].to_numpy(),
+        drifted / drifted.sum(axis=1, keepdims=True),
+    )
+
+    project_ids = projects["project_id"].to_numpy()
+    listed = np.arange(3) < skill_count[:, None]
+    rows, slots = np.nonzero(listed)
+    requirements = pd.DataFrame(
+        {
+            "project_id": project_ids[rows],
+            "skill": pd.Categorical.from_codes(skills[rows, slots], PROJECT_SKILLS),
+            "min_level": rng.integers(1, MAX_SKILL_LEVEL, len(rows)).astype(np.int8),
+            "required": required[rows, slots],
+        }
+    )
+
+    # One person per allocated FTE, at or just above the level their role
+    # needs, then the bench
+    min_level = np.zeros((num_projects, 3), np.int64)
+    min_level[rows, slots] = requirements["min_level"]
+    counts = allocated.ravel()
+    member_rows = np.repeat(np.repeat(np.arange(num_projects), 3), counts)
+    member_slots = np.repeat(np.tile(np.arange(3), num_projects), counts)
+    departments = projects["department"].to_numpy()
+    bench_departments = rng.choice(departments, int(bench_share * len(member_rows)))
+    num_people = len(member_rows) + len(bench_departments)
+    employee_ids = np.asarray([f"EMP{i:06d}" for i in range(1, num_people + 1)])
+    people = pd.DataFrame(
+        {
+            "employee_id": employee_ids,
+            "department": pd.Categorical(
+                np.concatenate([departments[member_rows], bench_departments]),
+                categories=projects["department"].cat.categories,
+            ),
+            "project_id": np.concatenate(
+                [project_ids[member_rows], np.full(len(bench_departments), -1)]
+            ),
+            "skill": pd.Categorical.from_codes(
+                np.concatenate(
+                    [
+                        skills[member_rows, member_slots],
+                        np.full(len(bench_departments), -1),
+                    ]
+                ),
+                PROJECT_SKILLS,
+            ),
+        }
+    )
+
+    role_levels = np.minimum(
+        min_level[member_rows, member_slots] + rng.integers(0, 2, len(member_rows)),
+        MAX_SKILL_LEVEL,
+    )
+    extra = rng.integers(1, 3, num_people)
+    extra_people = np.repeat(np.arange(num_people), extra)
+    extra_skills = rng.integers(0, num_skills, len(extra_people))
+    levels = pd.DataFrame(
+        {
+            "person": np.concatenate([np.arange(len(member_rows)), extra_people]),
+            "skill": np.concatenate([skills[member_rows, member_slots], extra_skills]),
+            "level": np.concatenate(
+                [role_levels, rng.integers(1, MAX_SKILL_LEVEL + 1, len(extra_people))]
+            ),
+        }
+    ).drop_duplicates(["person", "skill"])
+    skill_levels = pd.DataFrame(
+        {
+            "employee_id": employee_ids[levels["person"].to_numpy()],
+            "skill": pd.Categorical.from_codes(levels["skill"], PROJECT_SKILLS),
+            "level": levels["level"].to_numpy(np.int8),
+        }
+    )
+    return requirements, people, skill_levels
+
+
+def _codes(values):
+    return pd.Categorical(values, categories=PROJECT_SKILLS).codes.astype(np.int64)
+
+
+def staffing_gaps(requirements, people):
+    # Required and allocated people per project and skill, including skills
+    # staffed on a project that no longer needs them
+    allocated = (
+        people[people["project_id"] >= 0]
+        .groupby(["project_id", "skill"], observed=True)
+        .size()
+        .rename("allocated")
+    )
+    gaps = (
+        requirements.set_index(["project_id", "skill"])[["min_level", "required"]]
+        .join(allocated, how="outer")
+        .fillna({"min_level": 1, "required": 0, "allocated": 0})
+        .astype({"min_level": np.int64, "required": np.int64, "allocated": np.int64})
+        .reset_index()
+    )
+    gaps["shortfall"] = (gaps["required"] - gaps["allocated"]).clip(lower=0)
+    return gaps
+
+
+class AllocationPlan:
+    # Proposed moves from one optimizer run, with the shortfall per project
+    # before and after applying them
+    def __init__(self, moves, gaps):
+        self.moves = moves
+        self.gaps = gaps
+
+    @property
+    def shortfall_before(self):
+        return int(self.gaps["shortfall"].sum())
+
+    @property
+    def shortfall_after(self):
+        filled = self.moves.groupby(["to_project", "skill"], observed=True).size()
+        return self.shortfall_before - int(filled.sum())
+
+    def by_project(self):
+        # Required, currently allocated and proposed headcount per project
+        moved_in = self.moves.groupby("to_project").size()
+        moved_out = self.moves.groupby("from_project").size()
+        totals = self.gaps.groupby("project_id")[["required", "allocated"]].sum()
+        totals["proposed"] = (
+            totals["allocated"]
+            + moved_in.reindex(totals.index, fill_value=0)
+            - moved_out.reindex(totals.index, fill_value=0)
+        )
+        return totals
+
+
+def optimize_allocation(
+    requirements, people, skill_levels, priority=None, move_cost=MOVE_COST
+):
+    # Fills open (project, skill) slots from the bench and from people a
+    # project holds beyond its requirement for their skill, as one
+    # rectangular assignment problem: a candidate can take a slot when they
+    # hold its skill at the minimum level, and each filled slot gains its
+    # project's priority less the move and over-qualification costs.
+    # priority maps project_id to a weight (1 when missing)
+    gaps = staffing_gaps(requirements, people)
+    open_gaps = gaps[gaps["shortfall"] > 0]
+    slot_rows = np.repeat(np.arange(len(open_gaps)), open_gaps["shortfall"])
+    slot_project = open_gaps["project_id"].to_numpy()[slot_rows]
+    slot_skill = _codes(open_gaps["skill"])[slot_rows]
+    slot_level = open_gaps["min_level"].to_numpy()[slot_rows]
+    slot_gain = (
+        np.ones(len(slot_rows))
+        if priority is None
+        else priority.reindex(slot_project, fill_value=1.0).to_numpy(float)
+    )
+
+    # Candidates: the bench, then the weakest members of over-staffed skills
+    assigned = people[people["project_id"] >= 0].merge(
+        skill_levels, on=["employee_id", "skill"], how="left"
+    )
+    assigned = assigned.sort_values("level", ascending=False, kind="stable")
+    assigned = assigned.merge(
+        gaps[["project_id", "skill", "required"]], on=["project_id", "skill"]
+    )
+    rank = assigned.groupby(["project_id", "skill"], observed=True).cumcount()
+    released = assigned[rank.to_numpy() >= assigned["required"].to_numpy()]
+    bench = people[people["project_id"] < 0]
+    candidates = pd.concat(
+        [bench[["employee_id", "project_id"]], released[["employee_id", "project_id"]]],
+        ignore_index=True,
+    )
+    if len(slot_rows) == 0 or len(candidates) == 0:
+        return AllocationPlan(pd.DataFrame(columns=MOVE_COLUMNS), gaps)
+
+    # Candidate x skill level matrix (0 where the skill is not held)
+    positions = pd.Index(candidates["employee_id"])
+    held = skill_levels[skill_levels["employee_id"].isin(positions)]
+    levels = np.zeros((len(candidates), len(PROJECT_SKILLS)), np.int64)
+    levels[positions.get_indexer(held["employee_id"]), _codes(held["skill"])] = held[
+        "level"
+    ]
+
+    # Only slots someone can fill and people who can fill something enter
+    # the solver
+    candidate_levels = levels[:, slot_skill]
+    feasible = candidate_levels >= slot_level
+    rows = np.flatnonzero(feasible.any(axis=1))
+    cols = np.flatnonzero(feasible.any(axis=0))
+    feasible = feasible[np.ix_(rows, cols)]
+    gain = (
+        slot_gain[cols]
+        - move_cost * (candidates["project_id"].to_numpy()[rows, None] >= 0)
+        - OVERQUALIFIED_COST * (candidate_levels[np.ix_(rows, cols)] - slot_level[cols])
+    )
+    matched_rows, matched_cols = linear_sum_assignment(np.where(feasible, -gain, 0))
+    keep = feasible[matched_rows, matched_cols]
+    people_taken = rows[matched_rows[keep]]
+    slots_taken = cols[matched_cols[keep]]
+
+    moves = pd.DataFrame(
+        {
+            "employee_id": candidates["employee_id"].to_numpy()[people_taken],
+            "from_project": candidates["project_id"].to_numpy()[people_taken],
+            "to_project": slot_project[slots_taken],
+            "skill": pd.Categorical.from_codes(slot_skill[slots_taken], PROJECT_SKILLS),
+            "level": levels[people_taken, slot_skill[slots_taken]],
+        }
+    )
+    return AllocationPlan(moves.sort_values("to_project", ignore_index=True), gaps)
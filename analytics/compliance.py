@@ -0,0 +1,236 @@
+import numpy as np
+import pandas as pd
+
+STATUSES = ["compliant", "warning", "non-compliant"]
+
+# Requirement id and display label
+COMPLIANCE_REQUIREMENTS = {
+    "mandatoryTraining": "Mandatory Training",
+    "policyAcknowledgment": "Policy Acknowledgment",
+    "safetyTraining": "Safety Training",
+    "dataProtection": "Data Protection",
+    "codeOfConduct": "Code of Conduct",
+    "ethicsTraining": "Ethics Training",
+}
+
+# Org-wide share of compliant and of warning statuses per requirement
+COMPLIANCE_RATES = {
+    "mandatoryTraining": (0.97, 0.02),
+    "policyAcknowledgment": (0.92, 0.04),
+    "safetyTraining": (0.90, 0.05),
+    "dataProtection": (0.95, 0.03),
+    "codeOfConduct": (0.96, 0.02),
+    "ethicsTraining": (0.88, 0.06),
+}
+
+# A sorted uint32 position costs 32 bits, a packed word bitmap one bit per row
+_SPARSE_BITS = 32
+_popcount = getattr(np, "bitwise_count", None)
+
+
+def generate_compliance_records(employees, rates=COMPLIANCE_RATES, shift=0.0, seed=0):
+    # One status per employee and requirement; departments drift a little from
+    # the org-wide rates, and shift lowers every compliant share (an earlier
+    # snapshot)
+    rng = np.random.default_rng(seed)
+    department_codes = employees["department"].cat.codes.to_numpy()
+    department_offsets = rng.normal(
+        0, 0.02, len(employees["department"].cat.categories)
+    )
+    records = employees[["employee_id", "name", "department", "manager_id"]].copy()
+    for requirement, (compliant, warning) in rates.items():
+        compliant = np.clip(
+            compliant - shift + department_offsets[department_codes], 0, 1
+        )
+        draws = rng.random(len(employees))
+        codes = np.where(
+            draws < compliant, 0, np.where(draws < compliant + warning, 1, 2)
+        )
+        records[requirement] = pd.Categorical.from_codes(codes, STATUSES)
+    return records
+
+
+def _pack(positions, size):
+    mask = np.zeros(-(-size // 64) * 64, dtype=bool)
+    mask[positions] = True
+    return np.packbits(mask, bitorder="little").view(np.uint64)
+
+
+class Bitmap:
+    # Set of row positions over size rows. Sparse sets are a sorted uint32
+    # array and dense ones packed 64-bit words, whichever is smaller (the two
+    # container kinds of Roaring bitmaps); results are re-packed the same way
+    __slots__ = ("size", "words", "positions")
+
+    def __init__(self, size, words=None, positions=None):
+        self.size = size
+        self.words = words
+        self.positions = positions
+
+    @classmethod
+    def from_positions(cls, positions, size):
+        positions = np.asarray(positions, dtype=np.uint32)
+        if len(positions) * _SPARSE_BITS < size:
+            return cls(size, positions=positions)
+        return cls(size, words=_pack(positions, size))
+
+    @classmethod
+    def from_words(cls, words, size):
+        bitmap = cls(size, words=words)
+        if len(bitmap) * _SPARSE_BITS < size:
+            return cls(size, positions=bitmap.to_positions())
+        return bitmap
+
+    @classmethod
+    def full(cls, size):
+        return cls.from_positions(np.arange(size), size)
+
+    def _words(self):
+        return (
+            self.words if self.words is not None else _pack(self.positions, self.size)
+        )
+
+    def to_positions(self):
+        if self.positions is not None:
+            return self.positions
+        bits = np.unpackbits(self.words.view(np.uint8), bitorder="little")
+        return np.flatnonzero(bits[: self.size]).astype(np.uint32)
+
+    def contains(self, positions):
+        positions = np.asarray(positions, dtype=np.uint64)
+        if self.positions is not None:
+            if len(self.positions) == 0:
+                return np.zeros(len(positions), dtype=bool)
+            found = np.searchsorted(self.positions, positions)
+            found = np.minimum(found, len(self.positions) - 1)
+            return self.positions[found] == positions
+        bits = self.words[positions >> np.uint64(6)] >> (positions & np.uint64(63))
+        return (bits & np.uint64(1)).astype(bool)
+
+    def __and__(self, other):
+        if self.words is not None and other.words is not None:
+            return Bitmap.from_words(self.words & other.words, self.size)
+        sparse, other = (self, other) if self.positions is not None else (other, self)
+        return Bitmap(
+            self.size, positions=sparse.positions[other.contains(sparse.positions)]
+        )
+
+    def __or__(self, other):
+        if self.positions is not None and other.positions is not None:
+            merged = np.sort(np.concatenate([self.positions, other.positions]))
+            keep = np.ones(len(merged), dtype=bool)
+            keep[1:] = merged[1:] != merged[:-1]
+            return Bitmap.from_positions(merged[keep], self.size)
+        return Bitmap.from_words(self._words() | other._words(), self.size)
+
+    def __len__(self):
+        if self.positions is not None:
+            return len(self.positions)
+        if _popcount is not None:
+            return int(_popcount(self.words).sum())
+        return int(np.unpackbits(self.words.view(np.uint8)).sum())
+
+    @property
+    def nbytes(self):
+        return (self.words if self.words is not None else self.positions).nbytes
+
+
+class ComplianceIndex:
+    # One Bitmap per (requirement, status) and per value of each dimension
+    # column, over the row positions of the indexed frame. Conditions are
+    # ANDs of those bitmaps (ORs within a list of values) and counts are
+    # popcounts, so no query touches the rows themselves
+    def __init__(self, labels, requirements, dimensions, bitmaps):
+        self.labels = labels
+        self.requirements = list(requirements)
+        self.dimensions = list(dimensions)
+        self.bitmaps = bitmaps
+        self.size = len(labels)
+        self._all = Bitmap.full(self.size)
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame,
+        requirements=COMPLIANCE_REQUIREMENTS,
+        dimensions=("department", "manager_id"),
+        labels=("employee_id", "name"),
+    ):
+        frame = frame.reset_index(drop=True)
+        bitmaps = {}
+        for column in [*requirements, *dimensions]:
+            bitmaps[column] = {
+                value: Bitmap.from_positions(positions, len(frame))
+                for value, positions in frame.groupby(
+                    column, observed=True, sort=True
+                ).indices.items()
+            }
+        return cls(frame[list(labels)], requirements, dimensions, bitmaps)
+
+    def values(self, column):
+        return list(self.bitmaps[column])
+
+    def _matching(self, column, values):
+        if isinstance(values, (list, tuple, set)):
+            result = Bitmap(self.size, positions=np.empty(0, dtype=np.uint32))
+            for value in values:
+                result = result | self._matching(column, value)
+            return result
+        return self.bitmaps[column].get(
+            values, Bitmap(self.size, positions=np.empty(0, dtype=np.uint32))
+        )
+
+    def select(self, **conditions):
+        # e.g. select(dataProtection="non-compliant", department="Finance",
+        # manager_id="EMP000123"); a list of values matches any of them
+        result = self._all
+        for column, values in conditions.items():
+            if column not in self.bitmaps:
+                raise KeyError(f"Unknown compliance index column: {column}")
+            result = result & self._matching(column, values)
+        return result
+
+    def count(self, **conditions):
+        return len(self.select(**conditions))
+
+    def records(self, bitmap=None, limit=None, **conditions):
+        # Labels and every requirement's status for the matching rows
+        bitmap = self.select(**conditions) if bitmap is None else bitmap
+        positions = bitmap.to_positions()[:limit]
+        records = self.labels.iloc[positions].reset_index(drop=True)
+        for requirement in self.requirements:
+            statuses = np.empty(len(positions), dtype=object)
+            for status, status_bitmap in self.bitmaps[requirement].items():
+                statuses[status_bitmap.contains(positions)] = status
+            records[requirement] = statuses
+        return records
+
+    def compliance_rates(self, by=None, status="compliant", **conditions):
+        # Percentage of matching rows with the status, per requirement and
+        # per value of `by` (one "All" row without it)
+        base = self.select(**conditions)
+        groups = (
+            {"All": base}
+            if by is None
+            else {value: base & bitmap for value, bitmap in self.bitmaps[by].items()}
+        )
+        rates = {}
+        for value, group in groups.items():
+            total = len(group)
+            rates[value] = {
+                requirement: (
+                    100 * len(group & self._matching(requirement, status)) / total
+                    if total
+                    else np.nan
+                )
+                for requirement in self.requirements
+            }
+        return pd.DataFrame.from_dict(rates, orient="index")
+
+    @property
+    def nbytes(self):
+        return sum(
+            bitmap.nbytes
+            for column in self.bitmaps.values()
+            for bitmap in column.values()
+        )
@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+from analytics.payroll import PAY_CATEGORIES
+
+try:
+    import fcntl
+except ImportError:  # no cross-process file locks on this platform
+    fcntl = None
+
+# Row scope column and hidden columns per persona, applied after the cache so
+# every persona shares one cached copy. Unknown personas see no rows. Pay is
+# hidden as per-employee ledger amounts and as pay category columns
+SALARY_COLUMNS = ["amount", *PAY_CATEGORIES]
+PERSONA_ACCESS = {
+    "Individual Contributor": {"scope": "employee_id", "hidden": SALARY_COLUMNS},
+    "First Line Manager": {"scope": "manager_id", "hidden": SALARY_COLUMNS},
+    "Second Line Manager/Director": {"scope": "department", "hidden": []},
+    "HR Business Partner/HR Head": {"scope": None, "hidden": []},
+}
+
+
+def _restrict_frame(frame, access, scope):
+    column = access["scope"]
+    if column is not None and column in frame.columns and scope.get(column):
+        frame = frame[frame[column] == scope[column]]
+    hidden = [column for column in access["hidden"] if column in frame.columns]
+    return frame.drop(columns=hidden) if hidden else frame
+
+
+def restrict_for_persona(data, persona, scope=None):
+    # data is a DataFrame or a tuple/list of them; scope maps the persona's
+    # scope column to its value, e.g. {"department": "Sales"}
+    access = PERSONA_ACCESS.get(persona)
+    if isinstance(data, (tuple, list)):
+        return type(data)(restrict_for_persona(part, persona, scope) for part in data)
+    if not isinstance(data, pd.DataFrame):
+        return data
+    if access is None:
+        return data.iloc[0:0]
+    return _restrict_frame(data, access, scope or {})
+
+
+def _is_tabular(value):
+    if isinstance(value, tuple):
+        return all(isinstance(part, pd.DataFrame) for part in value)
+    return isinstance(value, pd.DataFrame)
+
+
+class SharedDatasetCache:
+    # Process-wide dataset cache shared by every session. Concurrent first
+    # loads of a key wait on one per-key lock, so the loader runs once. With
+    # a directory (e.g. under /dev/shm), DataFrames are also published as
+    # Arrow IPC files that other worker processes memory-map instead of
+    # regenerating, behind a file lock
+    def __init__(self, directory=None, ttl=None):
+        self.directory = Path(directory) if directory else None
+        self.ttl = ttl
+        self._entries = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+        self.loads = 0
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _key_lock(self, key):
+        with self._guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _fresh(self, loaded_at):
+        return self.ttl is None or time.time() - loaded_at < self.ttl
+
+    def get_or_load(self, name, loader, *args):
+        key = (name, *args)
+        entry = self._entries.get(key)
+        if entry is not None and self._fresh(entry[1]):
+            return entry[0]
+
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            if entry is None or not self._fresh(entry[1]):
+                entry = self._load_shared(key, loader, args)
+                self._entries[key] = entry
+            return entry[0]
+
+    def _load_shared(self, key, loader, args):
+        if self.directory is None:
+            return self._compute(loader, args)
+
+        stem = self.directory / hashlib.sha1(repr(key).encode()).hexdigest()
+        entry = self._read_ipc(stem)
+        if entry is not None:
+            return entry
+        with self._file_lock(stem):
+            entry = self._read_ipc(stem)
+            if entry is None:
+                entry = self._compute(loader, args)
+                if _is_tabular(entry[0]):
+                    self._write_ipc(stem, *entry)
+            return entry
+
+    def _compute(self, loader, args):
+        self.loads += 1
+        return loader(*args), time.time()
+
+    @contextmanager
+    def _file_lock(self, stem):
+        if fcntl is None:
+            yield
+            return
+        with open(stem.with_suffix(".lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_ipc(self, stem, value, loaded_at):
+        import pyarrow as pa
+
+        parts = value if isinstance(value, tuple) else (value,)
+        for i, part in enumerate(parts):
+            table = pa.Table.from_pandas(part)
+            tmp = stem.with_suffix(f".{i}.arrow.tmp")
+            with pa.OSFile(str(tmp), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp, stem.with_suffix(f".{i}.arrow"))
+
+        # The manifest is written last; its presence marks a complete entry
+        manifest = {
+            "parts": len(parts),
+            "tuple": isinstance(value, tuple),
+            "loaded_at": loaded_at,
+        }
+        tmp = stem.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(manifest))
+        os.replace(tmp, stem.with_suffix(".json"))
+
+    def _read_ipc(self, stem):
+        import pyarrow as pa
+
+        try:
+            manifest = json.loads(stem.with_suffix(".json").read_text())
+        except FileNotFoundError:
+            return None
+        if not self._fresh(manifest["loaded_at"]):
+            return None
+
+        parts = []
+        for i in range(manifest["parts"]):
+            with pa.memory_map(str(stem.with_suffix(f".{i}.arrow"))) as source:
+                parts.append(pa.ipc.open_file(source).read_all().to_pandas())
+        value = tuple(parts) if manifest["tuple"] else parts[0]
+        return value, manifest["loaded_at"]
+
+    def clear(self):
+        with self._guard:
+            self._entries.clear()
@@ -0,0 +1,193 @@
+import numpy as np
+import pandas as pd
+
+from analytics.employees import DEPARTMENTS
+
+# Categories per dimension; the first gender and ethnicity are the majority
+# groups the diversity hiring split is measured against
+GENDERS = ["Male", "Female", "Non-binary"]
+ETHNICITIES = ["White", "Asian", "Black", "Hispanic", "Other"]
+
+# np.digitize edges and the band each bucket is shown as
+AGE_EDGES = [26, 36, 46, 56]
+AGE_BANDS = ["18-25", "26-35", "36-45", "46-55", "56+"]
+TENURE_EDGES = [1, 3, 5, 10]
+TENURE_BANDS = ["0-1 years", "1-3 years", "3-5 years", "5-10 years", "10+ years"]
+
+DIMENSIONS = {
+    "gender": GENDERS,
+    "age_band": AGE_BANDS,
+    "ethnicity": ETHNICITIES,
+    "tenure_band": TENURE_BANDS,
+}
+
+# Dimensions the headline score averages. Age and tenure bands follow from
+# when people were hired, so a hire-date filter narrows them by construction;
+# they are reported as distributions only
+SCORED_DIMENSIONS = ["gender", "ethnicity"]
+
+_MINORITY_WEIGHTS = {"gender": [0.9, 0.1], "ethnicity": [0.38, 0.3, 0.25, 0.07]}
+
+
+def generate_demographic_records(num_employees, as_of=None, seed=0):
+    # Later hires are less likely to be in the majority groups, and each
+    # department drifts a little from the org-wide mix
+    rng = np.random.default_rng(seed)
+    as_of = pd.Timestamp.now().normalize() if as_of is None else pd.Timestamp(as_of)
+    department_codes = rng.integers(0, len(DEPARTMENTS), num_employees)
+    ages = np.clip(rng.normal(40, 11, num_employees), 18, 70).astype(int)
+    tenure_years = np.minimum(rng.exponential(5, num_employees), ages - 18)
+    hire_dates = as_of - pd.to_timedelta((tenure_years * 365.25).astype(int), "D")
+
+    recency = np.clip(1 - tenure_years / 20, 0, 1)
+    department_shift = rng.normal(0, 0.05, len(DEPARTMENTS))[department_codes]
+    records = {
+        "employee_id": np.arange(num_employees),
+        "department": pd.Categorical.from_codes(department_codes, DEPARTMENTS),
+        "age": ages,
+        "hire_date": hire_dates,
+    }
+    for column, categories, majority in [
+        ("gender", GENDERS, 0.7),
+        ("ethnicity", ETHNICITIES, 0.75),
+    ]:
+        in_majority = rng.random(num_employees) < (
+            majority - 0.25 * recency + department_shift
+        )
+        minority = 1 + rng.choice(
+            len(categories) - 1, num_employees, p=_MINORITY_WEIGHTS[column]
+        )
+        records[column] = pd.Categorical.from_codes(
+            np.where(in_majority, 0, minority), categories
+        )
+    return pd.DataFrame(records)
+
+
+def shannon_index(counts):
+    # Shannon entropy per row of counts, scaled by its maximum ln(k) to 0-1
+    counts = np.asarray(counts, dtype=float)
+    totals = counts.sum(axis=-1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shares = counts / totals
+        entropy = np.where(shares > 0, -shares * np.log(shares), 0).sum(axis=-1)
+    entropy[totals[..., 0] == 0] = np.nan
+    return entropy / np.log(counts.shape[-1])
+
+
+def simpson_index(counts):
+    # Gini-Simpson 1 - sum(p^2) per row of counts, scaled by its maximum
+    # 1 - 1/k to 0-1
+    counts = np.asarray(counts, dtype=float)
+    totals = counts.sum(axis=-1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        concentration = ((counts / totals) ** 2).sum(axis=-1)
+    return (1 - concentration) / (1 - 1 / counts.shape[-1])
+
+
+class DemographicsTable:
+    # Raw per-employee records reduced to small integer codes: every
+    # dimension's category (ages and tenures bucketed with np.digitize),
+    # department and hire day. Filters are boolean masks over the codes, and
+    # all dimension-by-department counts come from one bincount over codes
+    # offset into a shared (department, category) space; distributions and
+    # diversity indexes are derived from those counts
+    def __init__(self, records, as_of=None):
+        self.as_of = (
+            pd.Timestamp.now().normalize() if as_of is None else pd.Timestamp(as_of)
+        )
+        self.departments = list(records["department"].cat.categories)
+        self.department_codes = records["department"].cat.codes.to_numpy(np.int64)
+        self.hire_dates = records["hire_date"].to_numpy("datetime64[D]")
+
+        tenure_years = (np.datetime64(self.as_of.date(), "D") - self.hire_dates).astype(
+            int
+        ) / 365.25
+        self.codes = {
+            "gender": records["gender"].cat.codes.to_numpy(np.int64),
+            "age_band": np.digitize(records["age"].to_numpy(), AGE_EDGES),
+            "ethnicity": records["ethnicity"].cat.codes.to_numpy(np.int64),
+            "tenure_band": np.digitize(tenure_years, TENURE_EDGES),
+        }
+        sizes = [len(categories) for categories in DIMENSIONS.values()]
+        self._offsets = dict(zip(DIMENSIONS, np.cumsum([0, *sizes[:-1]])))
+        self._width = sum(sizes)
+
+    def __len__(self):
+        return len(self.department_codes)
+
+    def mask(self, departments=None, hired_since=None):
+        selected = np.ones(len(self), dtype=bool)
+        if departments is not None:
+            codes = [self.departments.index(d) for d in departments]
+            selected &= np.isin(self.department_codes, codes)
+        if hired_since is not None:
+            selected &= self.hire_dates >= np.datetime64(
+                pd.Timestamp(hired_since).date(), "D"
+            )
+        return selected
+
+    def counts(self, departments=None, hired_since=None):
+        # {dimension: DataFrame of department x category counts}
+        selected = self.mask(departments, hired_since)
+        base = self.department_codes[selected] * self._width
+        cells = np.concatenate(
+            [base + self._offsets[d] + self.codes[d][selected] for d in DIMENSIONS]
+        )
+        counts = np.bincount(
+            cells, minlength=len(self.departments) * self._width
+        ).reshape(len(self.departments), self._width)
+        return {
+            dimension: pd.DataFrame(
+                counts[:, self._offsets[dimension] : self._offsets[dimension] + len(c)],
+                index=pd.Index(self.departments, name="department"),
+                columns=c,
+            )
+            for dimension, c in DIMENSIONS.items()
+        }
+
+    def hiring_by_year(self, years=5, departments=None):
+        # Percentage of each year's hires outside the majority gender or
+        # ethnicity group
+        selected = self.mask(departments)
+        hire_years = (
+            self.hire_dates[selected].astype("datetime64[Y]").astype(int) + 1970
+        )
+        first_year = self.as_of.year - years + 1
+        diverse = (self.codes["gender"][selected] > 0) | (
+            self.codes["ethnicity"][selected] > 0
+        )
+        in_range = hire_years >= first_year
+        counts = np.bincount(
+            (hire_years[in_range] - first_year) * 2 + diverse[in_range],
+            minlength=years * 2,
+        ).reshape(years, 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            shares = 100 * counts / counts.sum(axis=1, keepdims=True)
+        return pd.DataFrame(
+            {
+                "year": [str(first_year + i) for i in range(years)],
+                "diverse": shares[:, 1].round(1),
+                "nonDiverse": shares[:, 0].round(1),
+            }
+        )
+
+
+def distribution(counts, dimension):
+    # Category counts of one dimension across the counted departments
+    return counts[dimension].sum().rename_axis("name").reset_index(name="value")
+
+
+def diversity_index(counts, by_department=True):
+    # Shannon and Simpson indexes per dimension on a 0-100 scale, and a score
+    # averaging the Simpson indexes of SCORED_DIMENSIONS. Departments with no
+    # counted employees are left out
+    if not by_department:
+        counts = {d: frame.sum().to_frame("All").T for d, frame in counts.items()}
+    result = {}
+    for dimension, frame in counts.items():
+        result[f"{dimension}_shannon"] = 100 * shannon_index(frame.to_numpy())
+        result[f"{dimension}_simpson"] = 100 * simpson_index(frame.to_numpy())
+    first = next(iter(counts.values()))
+    result = pd.DataFrame(result, index=first.index)
+    result["score"] = result[[f"{d}_simpson" for d in SCORED_DIMENSIONS]].mean(axis=1)
+    return result[(first.sum(axis=1) > 0).to_numpy()] if by_department else result
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+# Prefix matches count fully, fuzzy matches need this much trigram overlap
+MIN_FUZZY_SIMILARITY = 0.3
+
+
+def _trigrams(text):
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class EmployeeSearchIndex:
+    # Sorted token array for prefix lookups over names, IDs and positions,
+    # plus a trigram index over distinct names for typo-tolerant matching
+    def __init__(self, employees):
+        self.employees = employees[["employee_id", "name", "position"]].reset_index(
+            drop=True
+        )
+        self._num_employees = len(self.employees)
+        self._id_positions = pd.Index(self.employees["employee_id"].str.lower())
+
+        tokens = pd.concat(
+            [
+                self.employees["name"].astype(str).str.lower().str.split(),
+                self.employees["employee_id"].astype(str).str.lower().str.split(),
+                self.employees["position"].astype(str).str.lower().str.split(),
+            ]
+        ).explode()
+        tokens = tokens.dropna()
+        order = np.argsort(tokens.to_numpy(dtype=str), kind="stable")
+        self._tokens = tokens.to_numpy(dtype=str)[order]
+        self._token_owners = tokens.index.to_numpy()[order]
+
+        name_codes, unique_names = pd.factorize(self.employees["name"].str.lower())
+        self._name_codes = name_codes
+        self._num_names = len(unique_names)
+        self._name_trigram_counts = np.zeros(self._num_names)
+        postings = {}
+        for code, name in enumerate(unique_names):
+            grams = _trigrams(name)
+            self._name_trigram_counts[code] = len(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(code)
+        self._trigram_postings = {
+            gram: np.asarray(codes, dtype=np.int32) for gram, codes in postings.items()
+        }
+
+    def _prefix_owners(self, prefix):
+        start = np.searchsorted(self._tokens, prefix, side="left")
+        end = np.searchsorted(self._tokens, prefix + "\U0010ffff", side="left")
+        return self._token_owners[start:end]
+
+    def _name_similarity(self, query):
+        grams = _trigrams(query)
+        hits = [self._trigram_postings[g] for g in grams if g in self._trigram_postings]
+        if not hits:
+            return np.zeros(self._num_employees)
+
+        overlap = np.bincount(np.concatenate(hits), minlength=self._num_names)
+        dice = 2 * overlap / (len(grams) + self._name_trigram_counts)
+        return dice[self._name_codes]
+
+    def search(self, query, limit=20):
+        query = " ".join(query.lower().split())
+        if not query:
+            return self.employees.iloc[0:0].assign(score=[])
+
+        terms = query.split()
+        prefix_hits = np.zeros(self._num_employees)
+        for term in terms:
+            matched = np.zeros(self._num_employees, dtype=bool)
+            matched[self._prefix_owners(term)] = True
+            prefix_hits += matched
+
+        scores = prefix_hits / len(terms) + self._name_similarity(query)
+        exact = self._id_positions.get_indexer([query])[0]
+        if exact >= 0:
+            scores[exact] += 2
+
+        candidates = np.flatnonzero(
+            (prefix_hits > 0) | (scores >= MIN_FUZZY_SIMILARITY)
+        )
+        if len(candidates) > limit:
+            top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+
+        return self.employees.iloc[candidates].assign(score=scores[candidates])
+
+    def record(self, employee_id):
+        position = self._id_positions.get_indexer([employee_id.lower()])[0]
+        if position < 0:
+            return None
+        return self.employees.iloc[position].to_dict()
@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+
+# Synthetic org roster shared by the org-scale dashboards
+DEPARTMENTS = ["Engineering", "Sales", "Marketing", "HR", "Finance", "Customer Support"]
+
+FIRST_NAMES = [
+    "John",
+    "Jane",
+    "Bob",
+    "Alice",
+    "Charlie",
+    "Diana",
+    "Ethan",
+    "Eve",
+    "Frank",
+    "Grace",
+    "Henry",
+    "Ivy",
+    "Jack",
+    "Karen",
+    "Liam",
+    "Mia",
+    "Noah",
+    "Olivia",
+    "Paul",
+    "Quinn",
+    "Ruby",
+    "Sam",
+    "Tara",
+    "Uma",
+    "Victor",
+    "Wendy",
+    "Xavier",
+    "Yara",
+    "Zoe",
+    "Aaron",
+    "Bella",
+    "Carlos",
+]
+
+LAST_NAMES = [
+    "Doe",
+    "Smith",
+    "Johnson",
+    "Brown",
+    "Davis",
+    "Wilson",
+    "Miller",
+    "Lee",
+    "Taylor",
+    "Clark",
+    "Chen",
+    "Garcia",
+    "Martinez",
+    "Lopez",
+    "Young",
+    "King",
+    "Wright",
+    "Scott",
+    "Green",
+    "Baker",
+    "Adams",
+    "Nelson",
+    "Hill",
+    "Campbell",
+]
+
+POSITIONS = [
+    "Software Engineer",
+    "Senior Developer",
+    "Project Manager",
+    "UX Designer",
+    "Data Analyst",
+    "Quality Assurance Specialist",
+    "Sales Manager",
+    "Marketing Specialist",
+    "HR Coordinator",
+    "Financial Analyst",
+    "Support Specialist",
+    "Team Lead",
+]
+
+ROLES = ["Director", "Manager", "Individual Contributor"]
+
+TEAM_SIZE = 8
+MANAGERS_PER_DIRECTOR = 8
+
+
+def generate_employee_records(num_employees, departments=DEPARTMENTS, seed=0):
+    rng = np.random.default_rng(seed)
+    first = np.asarray(FIRST_NAMES, dtype=object)[
+        rng.integers(0, len(FIRST_NAMES), num_employees)
+    ]
+    last = np.asarray(LAST_NAMES, dtype=object)[
+        rng.integers(0, len(LAST_NAMES), num_employees)
+    ]
+
+    department_codes = rng.integers(0, len(departments), num_employees)
+    role_codes, manager_positions = _assign_reporting_lines(department_codes)
+    employee_ids = np.asarray(
+        [f"EMP{i:06d}" for i in range(1, num_employees + 1)], dtype=object
+    )
+    manager_ids = np.where(
+        manager_positions >= 0, employee_ids[manager_positions], None
+    )
+
+    return pd.DataFrame(
+        {
+            "employee_id": employee_ids,
+            "name": first + " " + last,
+            "department": pd.Categorical.from_codes(
+                department_codes, categories=list(departments)
+            ),
+            "position": pd.Categorical.from_codes(
+                rng.integers(0, len(POSITIONS), num_employees), categories=POSITIONS
+            ),
+            "role": pd.Categorical.from_codes(role_codes, categories=ROLES),
+            "manager_id": manager_ids,
+        }
+    )
+
+
+# Each department gets directors over managers over teams of individual
+# contributors; returns role codes and the row position of each manager
+def _assign_reporting_lines(department_codes):
+    role_codes = np.full(len(department_codes), 2, dtype=np.int8)
+    manager_positions = np.full(len(department_codes), -1, dtype=np.int64)
+
+    for code in np.unique(department_codes):
+        members = np.flatnonzero(department_codes == code)
+        num_managers = max(1, -(-len(members) // TEAM_SIZE))
+        num_directors = max(1, -(-num_managers // MANAGERS_PER_DIRECTOR))
+        directors = members[:num_directors]
+        managers = members[num_directors : num_directors + num_managers]
+        contributors = members[num_directors + num_managers :]
+
+        role_codes[directors] = 0
+        role_codes[managers] = 1
+        manager_positions[managers] = directors[
+            np.arange(len(managers)) // MANAGERS_PER_DIRECTOR
+        ]
+        if len(managers):
+            manager_positions[contributors] = managers[
+                np.arange(len(contributors)) % len(managers)
+            ]
+        else:
+            manager_positions[contributors] = directors[0]
+
+    return role_codes, manager_positions
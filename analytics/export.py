@@ -0,0 +1,94 @@
+import importlib.util
+import io
+
+import pandas as pd
+
+CHUNK_SIZE = 50_000
+EXCEL_MAX_ROWS = 1_048_575  # one row per sheet is taken by the header
+
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "Excel": (
+        "xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ),
+}
+
+# Formats whose writer dependency is importable; pyarrow ships with streamlit
+# and openpyxl is a project dependency, so all three are offered on a normal
+# install
+_FORMAT_DEPENDENCIES = {"CSV": None, "Parquet": "pyarrow", "Excel": "openpyxl"}
+
+
+def available_export_formats():
+    return [
+        name
+        for name, module in _FORMAT_DEPENDENCIES.items()
+        if module is None or importlib.util.find_spec(module) is not None
+    ]
+
+
+def iter_chunks(data, chunk_size=CHUNK_SIZE):
+    # Accepts a DataFrame or any iterable of DataFrames (e.g. a chunked reader)
+    if isinstance(data, pd.DataFrame):
+        for start in range(0, max(len(data), 1), chunk_size):
+            yield data.iloc[start : start + chunk_size]
+    else:
+        yield from data
+
+
+def _write_csv(chunks, sink):
+    for i, chunk in enumerate(chunks):
+        sink.write(chunk.to_csv(index=False, header=i == 0).encode("utf-8"))
+
+
+def _write_parquet(chunks, sink):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(sink, table.schema)
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _write_excel(chunks, sink):
+    from openpyxl import Workbook
+
+    # Write-only workbooks stream rows instead of holding cell objects
+    workbook = Workbook(write_only=True)
+    sheet, rows_in_sheet, header = None, 0, None
+    for chunk in chunks:
+        header = list(map(str, chunk.columns))
+        for row in chunk.itertuples(index=False, name=None):
+            if sheet is None or rows_in_sheet == EXCEL_MAX_ROWS:
+                sheet = workbook.create_sheet(f"Sheet{len(workbook.sheetnames) + 1}")
+                sheet.append(header)
+                rows_in_sheet = 0
+            sheet.append([None if pd.isna(value) else value for value in row])
+            rows_in_sheet += 1
+    if sheet is None:
+        workbook.create_sheet("Sheet1").append(header or [])
+    workbook.save(sink)
+
+
+_WRITERS = {"CSV": _write_csv, "Parquet": _write_parquet, "Excel": _write_excel}
+
+
+def write_export(data, export_format, sink, chunk_size=CHUNK_SIZE):
+    if export_format not in _WRITERS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+    _WRITERS[export_format](iter_chunks(data, chunk_size), sink)
+
+
+def export_bytes(data, export_format, chunk_size=CHUNK_SIZE):
+    buffer = io.BytesIO()
+    write_export(data, export_format, buffer, chunk_size)
+    return buffer.getvalue()
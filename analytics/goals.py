@@ -0,0 +1,242 @@
+import numpy as np
+import pandas as pd
+
+# Objectives roll up department <- team <- employee; key results are the
+# leaves that progress updates are booked against
+GOAL_LEVELS = ["department", "team", "employee", "key_result"]
+
+KEY_RESULTS = [
+    "Ship planned roadmap items",
+    "Improve coding skills",
+    "Enhance communication",
+    "Complete project deliverables",
+    "Learn a new technology",
+    "Mentor junior team members",
+    "Reduce open defects",
+    "Raise customer satisfaction",
+    "Document team processes",
+    "Automate a manual workflow",
+]
+
+
+def generate_goal_tree(employees, min_key_results=3, max_key_results=7, seed=0):
+    # One objective per department, per team (everyone reporting to the
+    # same manager) and per individual contributor, with weighted key
+    # results under each contributor's objective. Only key results carry a
+    # progress value; objective progress is rolled up. Team and employee
+    # objectives are titled after their owner
+    rng = np.random.default_rng(seed)
+    contributors = employees[employees["role"] == "Individual Contributor"]
+    departments = list(employees["department"].astype("category").cat.categories)
+    department_ids = [f"OBJ-{department}" for department in departments]
+
+    leads = contributors.drop_duplicates("manager_id")
+    lead_rows = employees.set_index("employee_id").loc[leads["manager_id"]]
+    lead_departments = lead_rows["department"].astype(str).to_numpy()
+    team_ids = "OBJ-TEAM-" + leads["manager_id"].to_numpy().astype(str)
+    employee_ids = "OBJ-" + contributors["employee_id"].to_numpy().astype(str)
+
+    counts = rng.integers(min_key_results, max_key_results + 1, len(contributors))
+    owners = np.repeat(np.arange(len(contributors)), counts)
+    numbers = np.arange(len(owners)) - np.repeat(np.cumsum(counts) - counts, counts)
+    key_result_ids = np.char.add(
+        np.char.add(employee_ids[owners].astype(str), "-KR"), (numbers + 1).astype(str)
+    )
+    progress = np.where(
+        rng.random(len(owners)) < 0.2, 100, rng.integers(0, 100, len(owners))
+    )
+
+    frames = [
+        pd.DataFrame(
+            {
+                "goal_id": department_ids,
+                "parent_id": None,
+                "level": "department",
+                "owner_id": None,
+                "department": departments,
+                "title": [f"{department} objectives" for department in departments],
+                "weight": 1.0,
+                "progress": np.nan,
+            }
+        ),
+        pd.DataFrame(
+            {
+                "goal_id": team_ids,
+                "parent_id": "OBJ-" + lead_departments.astype(object),
+                "level": "team",
+                "owner_id": leads["manager_id"].to_numpy(),
+                "department": lead_departments,
+                "title": lead_rows["name"].to_numpy().astype(object) + "'s team",
+                "weight": 1.0,
+                "progress": np.nan,
+            }
+        ),
+        pd.DataFrame(
+            {
+                "goal_id": employee_ids,
+                "parent_id": "OBJ-TEAM-"
+                + contributors["manager_id"].to_numpy().astype(object),
+                "level": "employee",
+                "owner_id": contributors["employee_id"].to_numpy(),
+                "department": contributors["department"].astype(str).to_numpy(),
+                "title": contributors["name"].to_numpy(),
+                "weight": 1.0,
+                "progress": np.nan,
+            }
+        ),
+        pd.DataFrame(
+            {
+                "goal_id": key_result_ids,
+                "parent_id": employee_ids[owners],
+                "level": "key_result",
+                "owner_id": contributors["employee_id"].to_numpy()[owners],
+                "department": contributors["department"].astype(str).to_numpy()[owners],
+                "title": np.asarray(KEY_RESULTS)[
+                    rng.integers(0, len(KEY_RESULTS), len(owners))
+                ],
+                "weight": rng.choice([1.0, 2.0, 3.0], len(owners)),
+                "progress": progress.astype(float),
+            }
+        ),
+    ]
+    goals = pd.concat(frames, ignore_index=True)
+    goals["level"] = pd.Categorical(goals["level"], categories=GOAL_LEVELS)
+    return goals
+
+
+class GoalStore:
+    # Goal tree with rolled-up progress kept current. Every goal stores its
+    # progress (the weighted mean of its children's for objectives) and how
+    # many key results under it are complete; an update walks only the
+    # changed key results' ancestor chains, adding each change scaled by the
+    # child's share of its parent's weight. Views read stored values
+    def __init__(self, goals):
+        self.goals = goals.reset_index(drop=True)
+        self._positions = pd.Index(self.goals["goal_id"])
+        self._parent = self._positions.get_indexer(self.goals["parent_id"])
+        self._level = self.goals["level"].cat.codes.to_numpy()
+        self._weight = self.goals["weight"].to_numpy(float)
+        leaves = self._level == GOAL_LEVELS.index("key_result")
+        self._leaf = leaves
+
+        # Children as contiguous runs of an ordering sorted by parent
+        order = np.argsort(self._parent, kind="stable")
+        self._children = order[self._parent[order] >= 0]
+        self._child_start = np.searchsorted(
+            self._parent[self._children], np.arange(len(self.goals) + 1)
+        )
+        self._child_weight = np.bincount(
+            self._parent[self._children],
+            weights=self._weight[self._children],
+            minlength=len(self.goals),
+        )
+        self._owned = {
+            (owner, level): position
+            for position, (owner, level) in enumerate(
+                zip(self.goals["owner_id"], self._level)
+            )
+            if owner is not None and not leaves[position]
+        }
+
+        self.progress = np.where(leaves, self.goals["progress"].to_numpy(float), 0.0)
+        self.completed = (leaves & (self.progress >= 100)).astype(np.int64)
+        self.key_results = leaves.astype(np.int64)
+        # Bottom-up once, deepest objectives first
+        for level in reversed(range(len(GOAL_LEVELS) - 1)):
+            children = self._children[
+                self._level[self._parent[self._children]] == level
+            ]
+            parents = self._parent[children]
+            self.progress += self._scatter(
+                parents,
+                self._weight[children]
+                * self.progress[children]
+                / self._child_weight[parents],
+            )
+            self.completed += self._scatter(parents, self.completed[children]).astype(
+                np.int64
+            )
+            self.key_results += self._scatter(
+                parents, self.key_results[children]
+            ).astype(np.int64)
+
+    def _scatter(self, index, weights):
+        return np.bincount(index, weights=weights, minlength=len(self.goals))
+
+    def update(self, updates):
+        # New progress per key result (goal_id, progress); with repeated
+        # goal ids the last update wins
+        if len(updates) == 0:
+            return self
+        updates = updates.drop_duplicates("goal_id", keep="last")
+        nodes = self._positions.get_indexer(updates["goal_id"])
+        if (nodes < 0).any():
+            raise KeyError("Progress updates reference unknown goals")
+        if not self._leaf[nodes].all():
+            raise ValueError("Progress is booked on key results; objectives roll up")
+        progress = np.clip(updates["progress"].to_numpy(float), 0, 100)
+        change = progress - self.progress[nodes]
+        completed = (progress >= 100).astype(np.int64) - (
+            self.progress[nodes] >= 100
+        ).astype(np.int64)
+        self.progress[nodes] = progress
+        self.completed[nodes] += completed
+
+        while len(nodes):
+            parents = self._parent[nodes]
+            above = parents >= 0
+            nodes, parents = nodes[above], parents[above]
+            change = self._weight[nodes] * change[above] / self._child_weight[parents]
+            completed = completed[above]
+            # Sum the changes per parent so each ancestor is touched once
+            nodes, inverse = np.unique(parents, return_inverse=True)
+            change = np.bincount(inverse, weights=change, minlength=len(nodes))
+            completed = np.bincount(
+                inverse, weights=completed, minlength=len(nodes)
+            ).astype(np.int64)
+            self.progress[nodes] += change
+            self.completed[nodes] += completed
+        return self
+
+    def _frame(self, positions):
+        goals = self.goals.iloc[positions]
+        return pd.DataFrame(
+            {
+                "goal_id": goals["goal_id"].to_numpy(),
+                "owner_id": goals["owner_id"].to_numpy(),
+                "department": goals["department"].to_numpy(),
+                "title": goals["title"].to_numpy(),
+                "weight": goals["weight"].to_numpy(),
+                "progress": self.progress[positions],
+                "completed": self.completed[positions],
+                "key_results": self.key_results[positions],
+            }
+        )
+
+    def goal(self, goal_id):
+        # Progress and key-result counts of one goal
+        position = self._positions.get_loc(goal_id)
+        return {
+            "progress": float(self.progress[position]),
+            "completed": int(self.completed[position]),
+            "key_results": int(self.key_results[position]),
+        }
+
+    def objective_id(self, owner_id, level):
+        # The employee or team objective an employee owns
+        position = self._owned[(owner_id, GOAL_LEVELS.index(level))]
+        return self._positions[position]
+
+    def children(self, goal_id):
+        position = self._positions.get_loc(goal_id)
+        return self._frame(
+            self._children[
+                self._child_start[position] : self._child_start[position + 1]
+            ]
+        )
+
+    def departments(self):
+        # Department objectives
+        return self._frame(
+            np.flatnonzero(self._level == GOAL_LEVELS.index("department"))
+        )
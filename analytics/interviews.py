@@ -0,0 +1,168 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from analytics.employees import FIRST_NAMES, LAST_NAMES
+from analytics.recruitment import DEPARTMENT_POSITIONS
+
+INTERVIEW_COLUMNS = ["interview_id", "start", "candidate", "position", "department"]
+
+# Interview slots: business days, on the half hour from 09:00 to 16:30
+_SLOTS_PER_DAY = 16
+_FIRST_SLOT = pd.Timedelta(hours=9)
+
+
+def generate_interview_schedule(num_interviews, start=None, days=60, seed=0):
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp.now().normalize() if start is None else pd.Timestamp(start)
+    business_days = pd.bdate_range(start, start + pd.Timedelta(days=days - 1))
+    dates = business_days[rng.integers(0, len(business_days), num_interviews)]
+    starts = (
+        dates
+        + _FIRST_SLOT
+        + pd.to_timedelta(30 * rng.integers(0, _SLOTS_PER_DAY, num_interviews), "m")
+    )
+
+    departments = list(DEPARTMENT_POSITIONS)
+    department_codes = rng.integers(0, len(departments), num_interviews)
+    choices = rng.random(num_interviews)
+    positions = np.empty(num_interviews, dtype=object)
+    for code, department in enumerate(departments):
+        options = np.asarray(DEPARTMENT_POSITIONS[department], dtype=object)
+        rows = department_codes == code
+        positions[rows] = options[(choices[rows] * len(options)).astype(int)]
+    first = np.asarray(FIRST_NAMES, dtype=object)[
+        rng.integers(0, len(FIRST_NAMES), num_interviews)
+    ]
+    last = np.asarray(LAST_NAMES, dtype=object)[
+        rng.integers(0, len(LAST_NAMES), num_interviews)
+    ]
+    return pd.DataFrame(
+        {
+            "interview_id": np.arange(num_interviews),
+            "start": starts,
+            "candidate": first + " " + last,
+            "position": positions,
+            "department": np.asarray(departments, dtype=object)[department_codes],
+        }
+    )
+
+
+_MINUTE = 60_000_000_000
+
+
+def _minute(time):
+    return pd.Timestamp(time).as_unit("ns").value // _MINUTE
+
+
+class InterviewCalendar:
+    # Per-department columns (start minute, id, candidate, position) kept
+    # sorted by start. Range lookups are two binary searches per department
+    # and slice the columns; inserts and cancels from the ATS feed splice
+    # them instead of re-sorting. A lock guards the columns, as one calendar
+    # is shared by every session
+    def __init__(self):
+        self._columns = {}
+        self._scheduled = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, interviews):
+        return cls().insert(interviews)
+
+    def __len__(self):
+        return len(self._scheduled)
+
+    @property
+    def departments(self):
+        return sorted(self._columns)
+
+    def insert(self, interviews):
+        # An interview id already in the calendar is rescheduled
+        minutes = pd.DatetimeIndex(interviews["start"]).as_unit("ns").asi8 // _MINUTE
+        ids = interviews["interview_id"].to_numpy(np.int64)
+        with self._lock:
+            self._cancel(ids)
+            for department, rows in interviews.groupby(
+                "department", sort=False
+            ).indices.items():
+                rows = rows[np.argsort(minutes[rows], kind="stable")]
+                columns = self._columns.get(department) or {
+                    "start": np.empty(0, np.int64),
+                    "interview_id": np.empty(0, np.int64),
+                    "candidate": np.empty(0, object),
+                    "position": np.empty(0, object),
+                }
+                at = np.searchsorted(columns["start"], minutes[rows], side="right")
+                new = {
+                    "start": minutes[rows],
+                    "interview_id": ids[rows],
+                    "candidate": interviews["candidate"].to_numpy()[rows],
+                    "position": interviews["position"].to_numpy()[rows],
+                }
+                self._columns[department] = {
+                    name: np.insert(values, at, new[name])
+                    for name, values in columns.items()
+                }
+                self._scheduled.update(
+                    zip(
+                        ids[rows].tolist(), zip([department] * len(rows), minutes[rows])
+                    )
+                )
+        return self
+
+    def cancel(self, interview_ids):
+        with self._lock:
+            return self._cancel(interview_ids)
+
+    def _cancel(self, interview_ids):
+        # Binary search to the start minute, then match the id among ties
+        cancelled = 0
+        for interview_id in np.asarray(interview_ids).tolist():
+            scheduled = self._scheduled.pop(interview_id, None)
+            if scheduled is None:
+                continue
+            department, minute = scheduled
+            columns = self._columns[department]
+            lo = np.searchsorted(columns["start"], minute, side="left")
+            hi = np.searchsorted(columns["start"], minute, side="right")
+            matches = columns["interview_id"][lo:hi] == interview_id
+            position = lo + np.flatnonzero(matches)[0]
+            self._columns[department] = {
+                name: np.delete(values, position) for name, values in columns.items()
+            }
+            cancelled += 1
+        return cancelled
+
+    def between(self, start, end, departments=None):
+        # Interviews starting in [start, end), ordered by start; departments
+        # None means all of them, an empty selection matches nothing
+        first, last = _minute(start), _minute(end)
+        with self._lock:
+            if departments is None:
+                departments = list(self._columns)
+            selected = [d for d in departments if d in self._columns]
+            parts = []
+            for department in selected:
+                columns = self._columns[department]
+                lo = np.searchsorted(columns["start"], first, side="left")
+                hi = np.searchsorted(columns["start"], last, side="left")
+                part = {name: values[lo:hi] for name, values in columns.items()}
+                part["department"] = np.full(hi - lo, department, dtype=object)
+                parts.append(part)
+
+        if not parts:
+            return pd.DataFrame(columns=INTERVIEW_COLUMNS).astype(
+                {"start": "datetime64[ns]"}
+            )
+        merged = {
+            name: np.concatenate([part[name] for part in parts]) for name in parts[0]
+        }
+        order = np.argsort(merged["start"], kind="stable")
+        merged["start"] = (merged["start"] * _MINUTE).astype("datetime64[ns]")
+        return pd.DataFrame({name: merged[name][order] for name in INTERVIEW_COLUMNS})
+
+    def upcoming(self, days, departments=None, now=None):
+        now = pd.Timestamp.now() if now is None else pd.Timestamp(now)
+        return self.between(now, now + pd.Timedelta(days=days), departments)
@@ -0,0 +1,184 @@
+import numpy as np
+import pandas as pd
+
+# Per-group running state and the value new groups start from
+_VECTOR_FIELDS = {
+    "count": 0.0,
+    "mean_x": 0.0,
+    "mean_y": 0.0,
+    "m2_x": 0.0,
+    "m2_y": 0.0,
+    "co_moment": 0.0,
+    "min_x": np.inf,
+    "max_x": -np.inf,
+    "min_y": np.inf,
+    "max_y": -np.inf,
+}
+_MATRIX_FIELDS = ["sums", "y_counts", "x_sums_by_y"]
+
+
+class GroupedRunningStats:
+    # Running count, means, M2 and co-moment of (x, y) per group, merged batch
+    # by batch with Chan's parallel form of Welford's update. A per-group
+    # histogram of y carries x sums, so splits at the average y need no rows.
+    # Queries cost O(groups), plus O(bins) for the splits.
+    def __init__(self, x, y, group, y_range=(0.0, 5.0), bins=500, sum_columns=()):
+        self.x, self.y, self.group = x, y, group
+        self.sum_columns = list(sum_columns)
+        self.y_edges = np.linspace(y_range[0], y_range[1], bins + 1)
+        self.groups = []
+
+        for name in _VECTOR_FIELDS:
+            setattr(self, name, np.zeros(0))
+        self.sums = np.zeros((0, len(self.sum_columns)))
+        self.y_counts = np.zeros((0, bins))
+        self.x_sums_by_y = np.zeros((0, bins))
+
+    @classmethod
+    def from_frame(cls, frame, x, y, group, **kwargs):
+        return cls(x, y, group, **kwargs).update(frame)
+
+    def _codes(self, labels):
+        labels = pd.Series(labels).astype(str)
+        new = [label for label in labels.unique() if label not in self.groups]
+        if new:
+            self.groups.extend(new)
+            for name, fill in _VECTOR_FIELDS.items():
+                grown = np.concatenate([getattr(self, name), np.full(len(new), fill)])
+                setattr(self, name, grown)
+            for name in _MATRIX_FIELDS:
+                current = getattr(self, name)
+                padding = np.zeros((len(new), current.shape[1]))
+                setattr(self, name, np.vstack([current, padding]))
+        return pd.Index(self.groups).get_indexer(labels)
+
+    def update(self, frame):
+        if len(frame) == 0:
+            return self
+        codes = self._codes(frame[self.group])
+        num_groups = len(self.groups)
+        x = frame[self.x].to_numpy(dtype=float)
+        y = frame[self.y].to_numpy(dtype=float)
+
+        # Moments of the incoming batch, per group
+        batch_count = np.bincount(codes, minlength=num_groups).astype(float)
+        safe_count = np.maximum(batch_count, 1)
+        batch_mean_x = np.bincount(codes, x, num_groups) / safe_count
+        batch_mean_y = np.bincount(codes, y, num_groups) / safe_count
+        dx = x - batch_mean_x[codes]
+        dy = y - batch_mean_y[codes]
+
+        # Merge them into the running moments
+        total = self.count + batch_count
+        safe_total = np.maximum(total, 1)
+        delta_x = batch_mean_x - self.mean_x
+        delta_y = batch_mean_y - self.mean_y
+        weight = self.count * batch_count / safe_total
+        self.mean_x = self.mean_x + delta_x * batch_count / safe_total
+        self.mean_y = self.mean_y + delta_y * batch_count / safe_total
+        self.m2_x += np.bincount(codes, dx * dx, num_groups) + delta_x**2 * weight
+        self.m2_y += np.bincount(codes, dy * dy, num_groups) + delta_y**2 * weight
+        self.co_moment += (
+            np.bincount(codes, dx * dy, num_groups) + delta_x * delta_y * weight
+        )
+        self.count = total
+
+        np.minimum.at(self.min_x, codes, x)
+        np.maximum.at(self.max_x, codes, x)
+        np.minimum.at(self.min_y, codes, y)
+        np.maximum.at(self.max_y, codes, y)
+        for i, column in enumerate(self.sum_columns):
+            values = frame[column].to_numpy(dtype=float)
+            self.sums[:, i] += np.bincount(codes, values, num_groups)
+
+        num_bins = self.y_counts.shape[1]
+        y_bins = np.searchsorted(self.y_edges, y, side="right") - 1
+        cells = codes * num_bins + np.clip(y_bins, 0, num_bins - 1)
+        shape = (num_groups, num_bins)
+        self.y_counts += np.bincount(cells, minlength=num_groups * num_bins).reshape(
+            shape
+        )
+        self.x_sums_by_y += np.bincount(cells, x, num_groups * num_bins).reshape(shape)
+        return self
+
+    def _selection(self, groups=None):
+        if groups is None:
+            return np.flatnonzero(self.count > 0)
+        positions = pd.Index(self.groups).get_indexer(list(groups))
+        return positions[positions >= 0]
+
+    def _combined(self, groups=None):
+        selected = self._selection(groups)
+        count = self.count[selected]
+        total = count.sum()
+        if total == 0:
+            return 0, np.nan, np.nan, np.nan, np.nan, np.nan
+
+        mean_x = (count * self.mean_x[selected]).sum() / total
+        mean_y = (count * self.mean_y[selected]).sum() / total
+        offset_x = self.mean_x[selected] - mean_x
+        offset_y = self.mean_y[selected] - mean_y
+        m2_x = (self.m2_x[selected] + count * offset_x**2).sum()
+        m2_y = (self.m2_y[selected] + count * offset_y**2).sum()
+        co_moment = (self.co_moment[selected] + count * offset_x * offset_y).sum()
+        return total, mean_x, mean_y, m2_x, m2_y, co_moment
+
+    def means(self, groups=None):
+        _, mean_x, mean_y, _, _, _ = self._combined(groups)
+        return mean_x, mean_y
+
+    def correlation(self, groups=None):
+        _, _, _, m2_x, m2_y, co_moment = self._combined(groups)
+        denominator = np.sqrt(m2_x * m2_y)
+        return co_moment / denominator if denominator > 0 else np.nan
+
+    def ratio_of_means(self, groups=None):
+        # Mean y per unit of mean x for each group, highest first
+        selected = self._selection(groups)
+        ratios = pd.Series(
+            self.mean_y[selected] / self.mean_x[selected],
+            index=[self.groups[i] for i in selected],
+        )
+        return ratios.sort_values(ascending=False)
+
+    def x_means_split_by_average_y(self, groups=None):
+        # Returns mean x for rows above the combined mean y and for the rest;
+        # the histogram bin holding the mean counts as "at or below"
+        selected = self._selection(groups)
+        above = self.y_edges[:-1] > self.means(groups)[1]
+        counts = self.y_counts[selected].sum(axis=0)
+        x_sums = self.x_sums_by_y[selected].sum(axis=0)
+
+        def mean(mask):
+            return (
+                x_sums[mask].sum() / counts[mask].sum()
+                if counts[mask].any()
+                else np.nan
+            )
+
+        return mean(above), mean(~above)
+
+    def group_maximum(self, column, groups=None):
+        # (value, group) of the largest x or y seen in the selected groups
+        selected = self._selection(groups)
+        values = self.max_x[selected] if column == self.x else self.max_y[selected]
+        best = int(np.argmax(values))
+        return values[best], self.groups[selected[best]]
+
+    def group_summary(self, groups=None):
+        selected = self._selection(groups)
+        summary = pd.DataFrame(
+            {
+                self.group: [self.groups[i] for i in selected],
+                "count": self.count[selected],
+                f"{self.x}_mean": self.mean_x[selected],
+                f"{self.x}_min": self.min_x[selected],
+                f"{self.x}_max": self.max_x[selected],
+                f"{self.y}_mean": self.mean_y[selected],
+                f"{self.y}_min": self.min_y[selected],
+                f"{self.y}_max": self.max_y[selected],
+            }
+        )
+        for i, column in enumerate(self.sum_columns):
+            summary[f"{column}_sum"] = self.sums[selected, i]
+        return summary.sort_values(self.group).reset_index(drop=True)
@@ -0,0 +1,146 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+PARTITION_COLUMN = "department"
+
+# Aggregations that can be computed per shard and merged afterwards; mean is
+# carried as a (sum, count) pair and divided once the shards are merged
+_MERGE_FUNCTIONS = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+AGGREGATIONS = [*_MERGE_FUNCTIONS, "mean"]
+
+_EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+def _partial_spec(aggregations):
+    partials = {}
+    for name, (column, func) in aggregations.items():
+        if func not in AGGREGATIONS:
+            raise ValueError(f"Unsupported shard aggregation: {func}")
+        if func == "mean":
+            partials[f"{name}__sum"] = (column, "sum")
+            partials[f"{name}__count"] = (column, "count")
+        else:
+            partials[name] = (column, func)
+    return partials
+
+
+def _partial_aggregate(shard, by, partials):
+    return shard.groupby(by, observed=True, sort=False).agg(**partials)
+
+
+def _merge_partials(results, by, aggregations):
+    merged = pd.concat(results)
+    merge_spec = {}
+    for name, (_, func) in aggregations.items():
+        if func == "mean":
+            merge_spec[f"{name}__sum"] = "sum"
+            merge_spec[f"{name}__count"] = "sum"
+        else:
+            merge_spec[name] = _MERGE_FUNCTIONS[func]
+    merged = merged.groupby(level=by, observed=True).agg(merge_spec)
+
+    for name, (_, func) in aggregations.items():
+        if func == "mean":
+            merged[name] = merged.pop(f"{name}__sum") / merged.pop(f"{name}__count")
+    return merged[list(aggregations)]
+
+
+class PartitionedFrame:
+    # One DataFrame per department, in memory and on disk as
+    # <directory>/<column>=<value>/part.parquet. Single-department views read
+    # one shard; "All" aggregations run per shard in a pool and merge
+    def __init__(self, shards, column=PARTITION_COLUMN, categories=None):
+        self.shards = dict(shards)
+        self.column = column
+        self.categories = list(categories or self.shards)
+
+    @classmethod
+    def from_frame(cls, frame, column=PARTITION_COLUMN):
+        values = frame[column]
+        categories = (
+            list(values.cat.categories)
+            if isinstance(values.dtype, pd.CategoricalDtype)
+            else sorted(values.unique())
+        )
+        shards = {
+            value: shard.reset_index(drop=True)
+            for value, shard in frame.groupby(column, observed=True, sort=False)
+        }
+        return cls(shards, column, categories)
+
+    @property
+    def partitions(self):
+        return [value for value in self.categories if value in self.shards]
+
+    def __len__(self):
+        return sum(len(shard) for shard in self.shards.values())
+
+    def shard(self, partition):
+        if partition in self.shards:
+            return self.shards[partition]
+        # Departments without rows get an empty frame with the shard columns
+        return next(iter(self.shards.values()), pd.DataFrame()).iloc[0:0]
+
+    def select(self, partitions=None):
+        partitions = self.partitions if partitions is None else list(partitions)
+        return pd.concat([self.shard(p) for p in partitions], ignore_index=True)
+
+    def map_shards(self, func, *args, partitions=None, executor="thread", workers=None):
+        partitions = self.partitions if partitions is None else list(partitions)
+        partitions = [p for p in partitions if p in self.shards]
+        if len(partitions) <= 1 or workers == 1:
+            return {p: func(self.shards[p], *args) for p in partitions}
+
+        workers = min(workers or os.cpu_count() or 1, len(partitions))
+        with _EXECUTORS[executor](max_workers=workers) as pool:
+            futures = {p: pool.submit(func, self.shards[p], *args) for p in partitions}
+            return {p: future.result() for p, future in futures.items()}
+
+    def aggregate(
+        self, by, aggregations, partitions=None, executor="thread", workers=None
+    ):
+        # aggregations maps output name -> (column, func), as in DataFrame.agg
+        by = [by] if isinstance(by, str) else list(by)
+        results = self.map_shards(
+            _partial_aggregate,
+            by,
+            _partial_spec(aggregations),
+            partitions=partitions,
+            executor=executor,
+            workers=workers,
+        )
+        if not results:
+            return pd.DataFrame(columns=list(aggregations))
+        return _merge_partials(list(results.values()), by, aggregations)
+
+    def write(self, directory):
+        for value, shard in self.shards.items():
+            path = Path(directory) / f"{self.column}={value}"
+            path.mkdir(parents=True, exist_ok=True)
+            shard.drop(columns=self.column).to_parquet(
+                path / "part.parquet", index=False
+            )
+
+    @classmethod
+    def read(cls, directory, partitions=None, column=PARTITION_COLUMN):
+        # Only the requested partitions are read from disk
+        prefix = f"{column}="
+        available = sorted(
+            path.name[len(prefix) :]
+            for path in Path(directory).iterdir()
+            if path.name.startswith(prefix)
+        )
+        wanted = available if partitions is None else list(partitions)
+        dtype = pd.CategoricalDtype(available)
+
+        shards = {}
+        for value in wanted:
+            path = Path(directory) / f"{prefix}{value}" / "part.parquet"
+            if path.exists():
+                shard = pd.read_parquet(path)
+                shard[column] = pd.Categorical([value] * len(shard), dtype=dtype)
+                shards[value] = shard
+        return cls(shards, column, available)
@@ -0,0 +1,214 @@
+import numpy as np
+import pandas as pd
+
+PAY_CATEGORIES = ["Base Salary", "Overtime", "Benefits", "Bonuses"]
+
+# Annual base salary medians and bonus targets (share of base) per role
+_BASE_SALARY = {
+    "Director": 220_000,
+    "Manager": 150_000,
+    "Individual Contributor": 95_000,
+}
+_BONUS_TARGET = {"Director": 0.15, "Manager": 0.1, "Individual Contributor": 0.06}
+_BENEFITS_RATE = 0.21
+_OVERTIME_RATE = 0.14
+
+_PERIODS_CHUNK = 12
+
+
+def generate_payroll_ledger(employees, periods=12, end=None, seed=0):
+    # Monthly ledger rows for the `periods` months up to `end`: base salary
+    # and benefits every month, overtime for individual contributors and
+    # bonuses at quarter ends. Zero amounts are not booked
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp.now() if end is None else pd.Timestamp(end)
+    months = pd.date_range(
+        end=end.to_period("M").to_timestamp(), periods=periods, freq="MS"
+    )
+    roles = employees["role"].astype(str).to_numpy()
+    num_employees = len(employees)
+
+    monthly_base = (
+        pd.Series(roles).map(_BASE_SALARY).to_numpy()
+        * rng.lognormal(0, 0.2, num_employees)
+        / 12
+    )
+    bonus_target = pd.Series(roles).map(_BONUS_TARGET).to_numpy()
+    contributor = roles == "Individual Contributor"
+
+    shape = (periods, num_employees)
+    amounts = np.stack(
+        [
+            np.broadcast_to(monthly_base, shape),
+            np.where(
+                contributor, monthly_base * rng.gamma(1.0, _OVERTIME_RATE, shape), 0
+            ),
+            monthly_base * _BENEFITS_RATE * rng.normal(1, 0.05, shape),
+            np.where(
+                (months.month % 3 == 0)[:, None],
+                3 * monthly_base * bonus_target * rng.gamma(4.0, 0.25, shape),
+                0,
+            ),
+        ],
+        axis=-1,
+    ).round(2)
+
+    period_codes, employee_codes, category_codes = np.nonzero(amounts)
+    return pd.DataFrame(
+        {
+            "employee_id": employees["employee_id"].to_numpy()[employee_codes],
+            "period": months[period_codes],
+            "category": pd.Categorical.from_codes(category_codes, PAY_CATEGORIES),
+            "amount": amounts[period_codes, employee_codes, category_codes],
+        }
+    )
+
+
+def _codes(values, categories):
+    return pd.Categorical(values, categories=categories).codes.astype(np.int64)
+
+
+class PayrollLedger:
+    # Append-only per-employee, per-pay-period, per-category ledger. Each
+    # append adds its amounts into precomputed rollups: department x period x
+    # category, and for every employee the same over their whole reporting
+    # subtree (themselves included), by walking the rows up the manager
+    # chain. Breakdowns sum rollup slices and never rescan the ledger
+    def __init__(self, employees, origin, categories=PAY_CATEGORIES):
+        self.origin = pd.Timestamp(origin).to_period("M")
+        self.categories = list(categories)
+        self.departments = list(
+            employees["department"].astype("category").cat.categories
+        )
+        self._employees = pd.Index(employees["employee_id"])
+        self._department = _codes(employees["department"], self.departments)
+        self._manager = self._employees.get_indexer(employees["manager_id"])
+        self._log = []
+
+        self.num_periods = 0
+        self.last_period = -1
+        self.department_totals = np.zeros(
+            (len(self.departments), 0, len(self.categories))
+        )
+        self.subtree_totals = np.zeros((len(self._employees), 0, len(self.categories)))
+
+    def _period_codes(self, periods):
+        periods = pd.DatetimeIndex(periods)
+        codes = np.asarray(
+            (periods.year - self.origin.year) * 12 + periods.month - self.origin.month,
+            dtype=np.int64,
+        )
+        if len(codes) and codes.min() < 0:
+            raise ValueError(f"Pay periods before the ledger origin {self.origin}")
+        if len(codes) and codes.max() >= self.num_periods:
+            grow = -(-(codes.max() + 1 - self.num_periods) // _PERIODS_CHUNK)
+            for name in ["department_totals", "subtree_totals"]:
+                current = getattr(self, name)
+                shape = list(current.shape)
+                shape[1] = grow * _PERIODS_CHUNK
+                setattr(self, name, np.concatenate([current, np.zeros(shape)], axis=1))
+            self.num_periods += grow * _PERIODS_CHUNK
+        return codes
+
+    @staticmethod
+    def _add(counter, index, weights):
+        counter += np.bincount(
+            np.ravel_multi_index(index, counter.shape),
+            weights=weights,
+            minlength=counter.size,
+        ).reshape(counter.shape)
+
+    def append(self, rows):
+        # Rows must refer to employees on the roster
+        if len(rows) == 0:
+            return self
+        employees = self._employees.get_indexer(rows["employee_id"])
+        if (employees < 0).any():
+            raise KeyError("Ledger rows reference employees not on the roster")
+        self._log.append(rows)
+        periods = self._period_codes(rows["period"])
+        categories = _codes(rows["category"], self.categories)
+        amounts = rows["amount"].to_numpy(dtype=float)
+        self.last_period = max(self.last_period, periods.max())
+
+        self._add(
+            self.department_totals,
+            (self._department[employees], periods, categories),
+            amounts,
+        )
+        while len(employees):
+            self._add(self.subtree_totals, (employees, periods, categories), amounts)
+            employees = self._manager[employees]
+            above = employees >= 0
+            employees, periods = employees[above], periods[above]
+            categories, amounts = categories[above], amounts[above]
+        return self
+
+    def events(self):
+        # The raw ledger, for audits and replays; dashboards read the rollups
+        return pd.concat(self._log, ignore_index=True)
+
+    @property
+    def periods(self):
+        # Pay periods up to the latest one booked
+        return pd.period_range(self.origin, periods=self.last_period + 1).to_timestamp()
+
+    def _slice(self, start, end, last):
+        # [start, end] as period positions; `last` keeps only the trailing
+        # number of booked periods instead
+        if last is not None:
+            return slice(max(self.last_period + 1 - last, 0), self.last_period + 1)
+        first = 0 if start is None else self._position(start)
+        stop = self.last_period + 1 if end is None else self._position(end) + 1
+        return slice(max(first, 0), max(stop, 0))
+
+    def _position(self, period):
+        period = pd.Timestamp(period).to_period("M")
+        return (period.year - self.origin.year) * 12 + period.month - self.origin.month
+
+    def by_department(self, start=None, end=None, last=None):
+        # Department x category totals
+        totals = self.department_totals[:, self._slice(start, end, last)].sum(axis=1)
+        return pd.DataFrame(
+            totals,
+            index=pd.Index(self.departments, name="department"),
+            columns=self.categories,
+        )
+
+    def by_category(self, departments=None, start=None, end=None, last=None):
+        rows = (
+            slice(None)
+            if departments is None
+            else [self.departments.index(d) for d in departments]
+        )
+        totals = self.department_totals[rows, self._slice(start, end, last)].sum(
+            axis=(0, 1)
+        )
+        return pd.Series(
+            totals, index=pd.Index(self.categories, name="category"), name="amount"
+        )
+
+    def by_period(self, departments=None, start=None, end=None, last=None):
+        # Period x category totals
+        rows = (
+            slice(None)
+            if departments is None
+            else [self.departments.index(d) for d in departments]
+        )
+        periods = self._slice(start, end, last)
+        totals = self.department_totals[rows, periods].sum(axis=0)
+        return pd.DataFrame(
+            totals,
+            index=pd.Index(self.periods[periods.start : periods.stop], name="period"),
+            columns=self.categories,
+        )
+
+    def subtree(self, employee_id, start=None, end=None, last=None):
+        # Category totals over an employee and everyone reporting up to them
+        position = self._employees.get_loc(employee_id)
+        totals = self.subtree_totals[position, self._slice(start, end, last)].sum(
+            axis=0
+        )
+        return pd.Series(
+            totals, index=pd.Index(self.categories, name="category"), name="amount"
+        )
@@ -0,0 +1,72 @@
+import numpy as np
+
+RISK_LEVELS = ["low", "medium", "high"]
+
+# Weight of each risk driver in the 0-100 score, and the score at which a
+# project becomes medium and high risk
+RISK_WEIGHTS = {
+    "schedule": 0.35,
+    "budget": 0.3,
+    "velocity": 0.2,
+    "staffing": 0.15,
+}
+RISK_THRESHOLDS = [30, 55]
+
+# Values at which each driver saturates: slip as a share of the planned
+# duration, projected overrun as a share of budget, and unfilled share of
+# the required FTEs
+SLIP_SATURATION = 0.25
+OVERRUN_SATURATION = 0.25
+STAFFING_SATURATION = 0.3
+
+# Driver value when a project has no measured progress rate yet
+UNKNOWN_VELOCITY_GAP = 0.5
+
+
+def score_risk(forecast, projects, days):
+    # forecast holds per-project arrays (completion, progress_rate, eac,
+    # schedule_slip) as of `days` (day numbers, one per project); projects
+    # holds the matching rows of budget, start, planned_end, required_fte and
+    # allocated_fte. Each driver is scaled to 0-1, then weighted into a
+    # 0-100 score
+    budget = projects["budget"].to_numpy(float)
+    start = projects["start"].to_numpy("datetime64[D]").astype(np.int64)
+    planned_end = projects["planned_end"].to_numpy("datetime64[D]").astype(np.int64)
+    planned_days = np.maximum(planned_end - start, 1)
+    days_left = planned_end - days
+    remaining = 100 - forecast["completion"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slip = forecast["schedule_slip"] / (SLIP_SATURATION * planned_days)
+        overrun = (forecast["eac"] - budget) / (OVERRUN_SATURATION * budget)
+        needed_rate = remaining / np.maximum(days_left, 1)
+        velocity = np.where(
+            days_left <= 0,
+            (remaining > 0).astype(float),
+            1 - forecast["progress_rate"] / needed_rate,
+        )
+        velocity = np.where(
+            np.isnan(forecast["progress_rate"]) & (days_left > 0),
+            UNKNOWN_VELOCITY_GAP,
+            velocity,
+        )
+        required = projects["required_fte"].to_numpy(float)
+        staffing = (required - projects["allocated_fte"].to_numpy(float)) / (
+            STAFFING_SATURATION * required
+        )
+
+    drivers = {
+        "schedule": np.clip(np.nan_to_num(slip, nan=0.0), 0, 1),
+        "budget": np.clip(np.nan_to_num(overrun, nan=0.0), 0, 1),
+        "velocity": np.clip(np.nan_to_num(velocity, nan=0.0), 0, 1),
+        "staffing": np.clip(np.nan_to_num(staffing, nan=0.0), 0, 1),
+    }
+    drivers["risk_score"] = 100 * sum(
+        RISK_WEIGHTS[name] * drivers[name] for name in RISK_WEIGHTS
+    )
+    return drivers
+
+
+def risk_levels(scores):
+    # Codes into RISK_LEVELS
+    return np.digitize(scores, RISK_THRESHOLDS)
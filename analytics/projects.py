@@ -0,0 +1,340 @@
+import numpy as np
+import pandas as pd
+
+from analytics.employees import DEPARTMENTS
+from analytics.project_risk import (RISK_LEVELS, RISK_WEIGHTS, risk_levels,
+                                    score_risk)
+
+PORTFOLIOS = [
+    "Digital Transformation",
+    "Customer Experience",
+    "Operational Excellence",
+    "Data & Analytics",
+    "Security & Compliance",
+]
+
+PROJECT_NAMES = [
+    "Cloud Migration",
+    "AI Integration",
+    "Mobile App Redesign",
+    "Chatbot Implementation",
+    "Website Redesign",
+    "Mobile App Development",
+    "CRM Integration",
+    "Data Migration",
+    "Security Audit",
+]
+
+# Projects without a schedule forecast yet (no snapshots, or too few to
+# measure progress) are "unknown" rather than counted as on track
+PROJECT_STATUSES = ["on-track", "at-risk", "delayed", "unknown"]
+
+# Days of snapshots the burn and progress rates are measured over, and the
+# schedule slip (days) at which a project is at risk or delayed
+BURN_WINDOW_DAYS = 28
+SLIP_THRESHOLDS = [0, 30]
+
+# Fully loaded cost of one FTE-year, used to size project teams
+_FTE_YEAR_COST = 150_000
+
+
+def generate_project_portfolio(
+    num_projects, end=None, snapshot_days=14, history_days=364, seed=0
+):
+    # Active projects and their spend/completion snapshots every
+    # `snapshot_days` over the last `history_days`. Each project runs at its
+    # own pace and cost factor against plan, with noisy reporting
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp.now().normalize() if end is None else pd.Timestamp(end)
+    planned_days = rng.integers(90, 541, num_projects)
+    pace = rng.lognormal(0.02, 0.1, num_projects)
+    cost_factor = rng.lognormal(0.04, 0.1, num_projects)
+    actual_days = planned_days * pace
+    elapsed = rng.uniform(0.05, 0.95, num_projects) * actual_days
+    start = end - pd.to_timedelta(elapsed.round(), "D")
+    budget = (rng.lognormal(13.8, 0.5, num_projects) / 1000).round() * 1000
+    required = np.clip(
+        np.round(budget / (_FTE_YEAR_COST * planned_days / 365)), 1, 60
+    ).astype(int)
+
+    projects = pd.DataFrame(
+        {
+            "project_id": np.arange(num_projects),
+            "name": [
+                f"{PROJECT_NAMES[i % len(PROJECT_NAMES)]} {i + 1:04d}"
+                for i in range(num_projects)
+            ],
+            "portfolio": pd.Categorical.from_codes(
+                rng.integers(0, len(PORTFOLIOS), num_projects), PORTFOLIOS
+            ),
+            "department": pd.Categorical.from_codes(
+                rng.integers(0, len(DEPARTMENTS), num_projects), DEPARTMENTS
+            ),
+            "budget": budget,
+            "start": start,
+            "planned_end": start + pd.to_timedelta(planned_days, "D"),
+            "required_fte": required,
+            "allocated_fte": np.minimum(
+                required,
+                rng.binomial(required, 0.85) + (rng.random(num_projects) < 0.3),
+            ),
+        }
+    )
+
+    # Snapshot days run back from `end`; a project reports from its start
+    offsets = np.arange(0, history_days + 1, snapshot_days)
+    days_ago = np.repeat(offsets[None, :], num_projects, axis=0)
+    age = elapsed[:, None] - days_ago
+    reported = age >= 0
+    project_codes = np.nonzero(reported)[0]
+    age = age[reported]
+    true_completion = np.clip(age / actual_days[project_codes], 0, 1)
+    completion = np.clip(
+        np.round(100 * true_completion + rng.normal(0, 1.0, len(age))), 0, 99
+    )
+    spent = np.round(
+        budget[project_codes]
+        * cost_factor[project_codes]
+        * true_completion
+        * rng.normal(1, 0.02, len(age)),
+        2,
+    )
+    snapshots = pd.DataFrame(
+        {
+            "project_id": project_codes,
+            "date": end - pd.to_timedelta(days_ago[reported], "D"),
+            "spent": spent,
+            "completion": completion,
+        }
+    )
+    return projects, snapshots.sort_values(["project_id", "date"], ignore_index=True)
+
+
+_DAY = np.timedelta64(1, "D")
+
+
+class ProjectStore:
+    # Project attributes plus time-stamped spend and completion snapshots,
+    # kept as column arrays sorted by (project, day) under one int64 key.
+    # Metrics for every project as of any date are a pair of vectorized
+    # binary searches (the latest snapshot, and the one a burn window
+    # earlier) followed by array arithmetic, memoized until the next append.
+    # Risk scores are kept per snapshot: each is scored as of its own date
+    # the first time it is read, and only a project's new snapshots are
+    # rescored
+    def __init__(self, projects):
+        self.projects = projects.sort_values("project_id", ignore_index=True)
+        self._ids = self.projects["project_id"].to_numpy(np.int64)
+        self._keys = np.empty(0, np.int64)
+        self._spent = np.empty(0)
+        self._completion = np.empty(0)
+        self._risk = np.empty((0, len(RISK_WEIGHTS) + 1))
+        self._metrics = {}
+
+    @classmethod
+    def from_frames(cls, projects, snapshots):
+        return cls(projects).append(snapshots)
+
+    def __len__(self):
+        return len(self.projects)
+
+    @staticmethod
+    def _days(dates):
+        return np.asarray(
+            pd.DatetimeIndex(dates).to_numpy("datetime64[D]").astype(np.int64)
+        )
+
+    def _key(self, positions, days):
+        return (np.asarray(positions, np.int64) << 32) + days
+
+    def append(self, snapshots):
+        # A snapshot for a project and day already stored replaces it
+        if len(snapshots) == 0:
+            return self
+        positions = np.searchsorted(self._ids, snapshots["project_id"].to_numpy())
+        positions = np.minimum(positions, len(self._ids) - 1)
+        if (self._ids[positions] != snapshots["project_id"].to_numpy()).any():
+            raise KeyError("Snapshots reference projects not in the store")
+
+        keys = np.concatenate(
+            [self._key(positions, self._days(snapshots["date"])), self._keys]
+        )
+        spent = np.concatenate([snapshots["spent"].to_numpy(float), self._spent])
+        completion = np.concatenate(
+            [snapshots["completion"].to_numpy(float), self._completion]
+        )
+        # Scores of an updated project's later snapshots depend on its
+        # earlier ones, so all of that project's scores are dropped
+        risk = self._risk.copy()
+        risk[np.isin(self._keys >> 32, positions)] = np.nan
+        risk = np.concatenate([np.full((len(snapshots), risk.shape[1]), np.nan), risk])
+
+        # Stable sort puts the new snapshot first among equal keys
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        keep = np.ones(len(keys), dtype=bool)
+        keep[1:] = keys[1:] != keys[:-1]
+        self._keys = keys[keep]
+        self._spent = spent[order][keep]
+        self._completion = completion[order][keep]
+        self._risk = risk[order][keep]
+        self._metrics.clear()
+        return self
+
+    @property
+    def latest_date(self):
+        if len(self._keys) == 0:
+            return None
+        return pd.Timestamp(np.datetime64(int((self._keys & 0xFFFFFFFF).max()), "D"))
+
+    def _snapshot_at(self, positions, days):
+        # Row of each project's latest snapshot on or before its day; -1 if none
+        rows = np.searchsorted(self._keys, self._key(positions, days), side="right") - 1
+        found = (rows >= 0) & ((self._keys[np.maximum(rows, 0)] >> 32) == positions)
+        return np.where(found, rows, -1)
+
+    def _forecast(self, positions, days, window_days=BURN_WINDOW_DAYS):
+        # Latest spend and completion of the given projects as of their
+        # days, burn and progress rates over the window, and the cost
+        # (EAC = budget / CPI) and schedule forecasts they imply
+        latest = self._snapshot_at(positions, days)
+        earlier = self._snapshot_at(positions, days - window_days)
+        earlier = np.where(earlier >= 0, earlier, latest)
+        reported = latest >= 0
+        latest, earlier = np.maximum(latest, 0), np.maximum(earlier, 0)
+
+        spent = np.where(reported, self._spent[latest], 0.0)
+        completion = np.where(reported, self._completion[latest], 0.0)
+        span = ((self._keys[latest] - self._keys[earlier]) & 0xFFFFFFFF).astype(float)
+        budget = self.projects["budget"].to_numpy(float)[positions]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            burn_rate = np.where(
+                span > 0, (spent - self._spent[earlier]) / span, np.nan
+            )
+            progress_rate = np.where(
+                span > 0, (completion - self._completion[earlier]) / span, np.nan
+            )
+            earned = budget * completion / 100
+            cpi = np.where(spent > 0, earned / spent, np.nan)
+            eac = np.where(cpi > 0, budget / cpi, budget)
+            # No measured progress over the window means no finish in sight;
+            # a single snapshot gives no rate at all
+            days_left = np.where(
+                progress_rate > 0,
+                (100 - completion) / progress_rate,
+                np.where(span > 0, np.inf, np.nan),
+            )
+
+        finite = np.isfinite(days_left)
+        finish = days + np.round(np.where(finite, days_left, 0)).astype(np.int64)
+        planned_end = (
+            self.projects["planned_end"].to_numpy("datetime64[D]").astype(np.int64)
+        )
+        slip = np.where(finite, finish - planned_end[positions], np.nan)
+        slip[np.isposinf(days_left)] = np.inf
+        return {
+            "spent": spent,
+            "completion": completion,
+            "burn_rate": burn_rate,
+            "progress_rate": progress_rate,
+            "cpi": cpi,
+            "eac": eac,
+            "projected_overrun": eac - budget,
+            "projected_finish": np.where(
+                finite, finish.astype("datetime64[D]"), np.datetime64("NaT")
+            ),
+            "schedule_slip": slip,
+        }
+
+    def metrics(self, as_of=None, window_days=BURN_WINDOW_DAYS):
+        # One row per project with its forecast as of `as_of`, the status
+        # its schedule slip implies, and the risk score of its latest
+        # snapshot
+        as_of = self.latest_date if as_of is None else pd.Timestamp(as_of)
+        cache_key = (as_of, window_days)
+        if cache_key in self._metrics:
+            return self._metrics[cache_key]
+
+        positions = np.arange(len(self._ids))
+        day = self._days([as_of])[0]
+        forecast = self._forecast(positions, np.full(len(positions), day), window_days)
+        slip = forecast["schedule_slip"]
+        risk = self.risk_scores(as_of)
+        metrics = self.projects.assign(
+            **forecast,
+            status=pd.Categorical.from_codes(
+                np.where(
+                    np.isnan(slip),
+                    PROJECT_STATUSES.index("unknown"),
+                    np.digitize(slip, SLIP_THRESHOLDS, right=True),
+                ),
+                PROJECT_STATUSES,
+            ),
+            **{
+                column: risk[column].to_numpy()
+                for column in ["risk_score", *RISK_WEIGHTS, "risk"]
+            },
+        )
+        self._metrics[cache_key] = metrics
+        return metrics
+
+    def risk_scores(self, as_of=None):
+        # Risk drivers (0-1) and score (0-100) of each project's latest
+        # snapshot on or before `as_of`; projects with no snapshot score 0
+        as_of = self.latest_date if as_of is None else pd.Timestamp(as_of)
+        positions = np.arange(len(self._ids))
+        rows = self._snapshot_at(positions, self._days([as_of])[0])
+        stale = (rows >= 0) & np.isnan(self._risk[np.maximum(rows, 0), 0])
+        if stale.any():
+            stale_positions, stale_rows = positions[stale], rows[stale]
+            days = self._keys[stale_rows] & 0xFFFFFFFF
+            scored = score_risk(
+                self._forecast(stale_positions, days),
+                self.projects.iloc[stale_positions],
+                days,
+            )
+            self._risk[stale_rows] = np.column_stack(
+                [scored["risk_score"], *(scored[name] for name in RISK_WEIGHTS)]
+            )
+
+        values = np.where((rows >= 0)[:, None], self._risk[np.maximum(rows, 0)], 0.0)
+        scores = pd.DataFrame(
+            values[:, 1:], columns=list(RISK_WEIGHTS), index=self.projects.index
+        )
+        scores.insert(0, "risk_score", values[:, 0])
+        scores.insert(0, "project_id", self._ids)
+        scores["risk"] = pd.Categorical.from_codes(
+            risk_levels(values[:, 0]), RISK_LEVELS
+        )
+        return scores
+
+    def history(self, project_id):
+        # Snapshot series of one project, oldest first
+        position = np.searchsorted(self._ids, project_id)
+        lo, hi = np.searchsorted(
+            self._keys >> 32, [position, position + 1], side="left"
+        )
+        return pd.DataFrame(
+            {
+                "date": (self._keys[lo:hi] & 0xFFFFFFFF).astype("datetime64[D]"),
+                "spent": self._spent[lo:hi],
+                "completion": self._completion[lo:hi],
+            }
+        )
+
+    def portfolio_summary(self, as_of=None, by="portfolio", departments=None):
+        # Budget, spend, EAC and status counts per portfolio (or department),
+        # over the given departments' projects or all of them
+        metrics = self.metrics(as_of)
+        if departments is not None:
+            metrics = metrics[metrics["department"].isin(departments)]
+        summary = metrics.groupby(by, observed=False).agg(
+            projects=("project_id", "size"),
+            budget=("budget", "sum"),
+            spent=("spent", "sum"),
+            eac=("eac", "sum"),
+            completion=("completion", "mean"),
+        )
+        summary["projected_overrun"] = summary["eac"] - summary["budget"]
+        statuses = pd.crosstab(metrics[by], metrics["status"], dropna=False)
+        return summary.join(statuses.reindex(columns=PROJECT_STATUSES, fill_value=0))
@@ -0,0 +1,184 @@
+import heapq
+
+import numpy as np
+import pandas as pd
+
+SKETCH_SIZE = 200
+PERCENTILE_BANDS = [0.10, 0.25, 0.50, 0.75, 0.90]
+
+
+class KLLSketch:
+    # KLL quantile sketch: level h holds items that each stand for 2**h
+    # values. Levels are compacted by sorting and promoting every other item,
+    # so memory stays O(k log(n/k)); sketches merge level by level
+    def __init__(self, k=SKETCH_SIZE, seed=0):
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                # An odd item out stays behind at its level
+                items = np.sort(items)
+                even = len(items) // 2 * 2
+                promoted = items[:even][self._rng.integers(0, 2) :: 2]
+                self.levels[level] = items[even:]
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], promoted]
+                )
+            level += 1
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compress()
+        return self
+
+    def merge(self, other):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(items), 2.0**level) for level, items in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def quantile(self, q):
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        items, cumulative = self._weighted_items()
+        positions = np.searchsorted(cumulative, np.asarray(q) * cumulative[-1])
+        return items[np.minimum(positions, len(items) - 1)]
+
+    def rank(self, value):
+        # Approximate share of values at or below value
+        if self.count == 0:
+            return np.nan
+        items, cumulative = self._weighted_items()
+        position = np.searchsorted(items, value, side="right")
+        return cumulative[position - 1] / cumulative[-1] if position else 0.0
+
+
+def _extreme_positions(scores, k):
+    # Positions of the k largest scores in O(n); ties at the cut-off keep the
+    # earliest positions, as DataFrame.nlargest does
+    if len(scores) <= k:
+        return np.arange(len(scores))
+    threshold = scores[np.argpartition(scores, -k)[-k]]
+    above = np.flatnonzero(scores > threshold)
+    tied = np.flatnonzero(scores == threshold)[: k - len(above)]
+    return np.concatenate([above, tied])
+
+
+class PerformanceRanking:
+    # Per-group min-heaps of the k best and k worst rows plus a KLL sketch of
+    # scores. Batches are narrowed with argpartition before touching the
+    # heaps; "All" views merge k entries per group and the group sketches
+    def __init__(
+        self, score="rating", group="department", k=5, sketch_size=SKETCH_SIZE
+    ):
+        self.score = score
+        self.group = group
+        self.k = k
+        self.sketch_size = sketch_size
+        self._top = {}
+        self._bottom = {}
+        self._sketches = {}
+        self._seen = 0
+
+    @classmethod
+    def from_frame(cls, frame, score="rating", group="department", **kwargs):
+        return cls(score, group, **kwargs).update(frame)
+
+    @property
+    def groups(self):
+        return list(self._sketches)
+
+    def _push(self, heap, key, record):
+        if len(heap) < self.k:
+            heapq.heappush(heap, (*key, record))
+        elif key > heap[0][:2]:
+            heapq.heapreplace(heap, (*key, record))
+
+    def update(self, frame):
+        scores = frame[self.score].to_numpy(dtype=float)
+        sequence = self._seen + np.arange(len(frame))
+        self._seen += len(frame)
+
+        for group, positions in frame.groupby(
+            self.group, observed=True, sort=False
+        ).indices.items():
+            group_scores = scores[positions]
+            if group not in self._sketches:
+                self._sketches[group] = KLLSketch(
+                    self.sketch_size, seed=len(self._sketches)
+                )
+                self._top[group], self._bottom[group] = [], []
+            self._sketches[group].update(group_scores)
+
+            # Only each batch's own k extremes can enter the heaps; ties keep
+            # the earliest row
+            for heap, signed in (
+                (self._top[group], group_scores),
+                (self._bottom[group], -group_scores),
+            ):
+                for offset in _extreme_positions(signed, self.k):
+                    position = positions[offset]
+                    self._push(
+                        heap,
+                        (signed[offset], -sequence[position]),
+                        frame.iloc[position].to_dict(),
+                    )
+        return self
+
+    def _selection(self, groups=None):
+        return (
+            self.groups
+            if groups is None
+            else [g for g in groups if g in self._sketches]
+        )
+
+    def _ranked(self, heaps, groups, k):
+        entries = [entry for group in self._selection(groups) for entry in heaps[group]]
+        best = heapq.nlargest(k or self.k, entries, key=lambda entry: entry[:2])
+        return pd.DataFrame([record for *_, record in best])
+
+    def top(self, k=None, groups=None):
+        return self._ranked(self._top, groups, k)
+
+    def bottom(self, k=None, groups=None):
+        return self._ranked(self._bottom, groups, k)
+
+    def sketch(self, groups=None):
+        selected = self._selection(groups)
+        merged = KLLSketch(self.sketch_size)
+        for group in selected:
+            merged.merge(self._sketches[group])
+        return merged
+
+    def percentile_bands(self, bands=PERCENTILE_BANDS, groups=None):
+        return pd.Series(
+            self.sketch(groups).quantile(bands), index=bands, name=self.score
+        )
+
+    def percentile_rank(self, value, groups=None):
+        return self.sketch(groups).rank(value)
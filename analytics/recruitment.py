@@ -0,0 +1,317 @@
+import numpy as np
+import pandas as pd
+
+STAGES = ["Applied", "Screening", "Interview", "Offer", "Hired"]
+SOURCES = ["Job Boards", "Referrals", "Company Website", "LinkedIn"]
+
+# Positions each recruiting department hires for
+DEPARTMENT_POSITIONS = {
+    "Engineering": ["Software Engineer", "Senior Developer", "Data Analyst"],
+    "Sales": ["Sales Manager", "Account Executive"],
+    "Marketing": ["Marketing Specialist", "UX Designer"],
+    "HR": ["HR Coordinator", "Recruiter"],
+    "Finance": ["Financial Analyst", "Accountant"],
+}
+
+# Time-to-fill histogram bin edges in days; the last bin is open-ended
+TIME_TO_FILL_EDGES = np.arange(0, 181, 5)
+
+# Share of candidates reaching each stage after Applied, and the chance an
+# open requisition is filled
+_STAGE_CONVERSION = [0.45, 0.4, 0.3]
+_SOURCE_WEIGHTS = [0.4, 0.3, 0.2, 0.1]
+_FILL_RATE = 0.85
+
+_DAYS_CHUNK = 366
+
+
+def generate_recruitment_events(
+    num_requisitions, end=None, days=730, applicants=60, seed=0
+):
+    # Requisitions opened over the last `days` days, and the stage transitions
+    # of their candidates up to `end`; each filled requisition hires one
+    # candidate who reached Offer
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp.now().normalize() if end is None else pd.Timestamp(end)
+    departments = list(DEPARTMENT_POSITIONS)
+    department_codes = rng.integers(0, len(departments), num_requisitions)
+    choices = rng.random(num_requisitions)
+    positions = np.empty(num_requisitions, dtype=object)
+    for code, department in enumerate(departments):
+        options = np.asarray(DEPARTMENT_POSITIONS[department], dtype=object)
+        rows = department_codes == code
+        positions[rows] = options[(choices[rows] * len(options)).astype(int)]
+    opened = end - pd.to_timedelta(rng.integers(0, days, num_requisitions), "D")
+    requisitions = pd.DataFrame(
+        {
+            "requisition_id": np.arange(num_requisitions),
+            "department": pd.Categorical.from_codes(department_codes, departments),
+            "position": pd.Categorical(positions),
+            "date": opened,
+        }
+    )
+
+    counts = rng.poisson(applicants, num_requisitions)
+    requisition_ids = np.repeat(np.arange(num_requisitions), counts)
+    num_candidates = len(requisition_ids)
+    reached = 1 + (rng.random((num_candidates, 3)) < _STAGE_CONVERSION).cumprod(
+        axis=1
+    ).sum(axis=1)
+    step_days = rng.integers(3, 11, (num_candidates, len(STAGES))).cumsum(axis=1)
+    step_days[:, 0] = rng.integers(0, 30, num_candidates)
+    step_days[:, 1:] += step_days[:, :1]
+
+    # The first candidate of a requisition to reach Offer is the hire
+    offered = np.flatnonzero(reached == len(STAGES) - 1)
+    _, first = np.unique(requisition_ids[offered], return_index=True)
+    hires = offered[first]
+    hires = hires[rng.random(len(hires)) < _FILL_RATE]
+    reached[hires] = len(STAGES)
+
+    candidate_ids = np.repeat(np.arange(num_candidates), reached)
+    stage_codes = np.arange(reached.sum()) - np.repeat(
+        np.cumsum(reached) - reached, reached
+    )
+    dates = (
+        opened.to_numpy()[requisition_ids[candidate_ids]]
+        + pd.to_timedelta(step_days[candidate_ids, stage_codes], "D").to_numpy()
+    )
+    transitions = pd.DataFrame(
+        {
+            "candidate_id": candidate_ids,
+            "requisition_id": requisition_ids[candidate_ids],
+            "source": pd.Categorical.from_codes(
+                rng.choice(len(SOURCES), num_candidates, p=_SOURCE_WEIGHTS)[
+                    candidate_ids
+                ],
+                SOURCES,
+            ),
+            "stage": pd.Categorical.from_codes(stage_codes, STAGES),
+            "date": dates,
+        }
+    )
+    transitions = transitions[transitions["date"] <= end]
+    return requisitions, transitions.sort_values("date", kind="stable")
+
+
+def _codes(values, categories):
+    return pd.Categorical(values, categories=categories).codes.astype(np.int64)
+
+
+class RecruitmentEventStore:
+    # Append-only log of requisition openings and candidate stage
+    # transitions. Each append updates per-department, per-day counters:
+    # transitions by source and stage, requisitions still open by opening
+    # day, and time-to-fill sums and histograms by hire day. Queries sum
+    # counter slices, so their cost does not grow with the number of events
+    def __init__(
+        self,
+        origin,
+        department_positions=DEPARTMENT_POSITIONS,
+        sources=SOURCES,
+        stages=STAGES,
+        time_to_fill_edges=TIME_TO_FILL_EDGES,
+    ):
+        self.origin = pd.Timestamp(origin).normalize()
+        self.departments = list(department_positions)
+        self.positions = sorted(
+            {p for positions in department_positions.values() for p in positions}
+        )
+        self.sources = list(sources)
+        self.stages = list(stages)
+        self.time_to_fill_edges = np.asarray(time_to_fill_edges)
+        self._hired = self.stages.index("Hired")
+        self._log = {"requisitions": [], "transitions": []}
+
+        num_departments, num_bins = len(self.departments), len(time_to_fill_edges)
+        self.num_days = 0
+        self.transitions = np.zeros(
+            (num_departments, 0, len(self.sources), len(self.stages)), np.int64
+        )
+        self.still_open = np.zeros((num_departments, 0), np.int64)
+        self.fill_days = np.zeros((num_departments, len(self.positions), 0))
+        self.fills = np.zeros((num_departments, len(self.positions), 0), np.int64)
+        self.fill_histogram = np.zeros((num_departments, 0, num_bins), np.int64)
+
+        # Per requisition: department, position, opening day (-1 when unknown)
+        self._requisition_department = np.zeros(0, np.int64)
+        self._requisition_position = np.zeros(0, np.int64)
+        self._requisition_opened = np.full(0, -1, np.int64)
+
+    def _day_codes(self, dates):
+        days = (pd.to_datetime(dates).to_numpy() - self.origin.to_datetime64()) // (
+            np.timedelta64(1, "D")
+        )
+        days = np.asarray(days, dtype=np.int64)
+        if len(days) and days.min() < 0:
+            raise ValueError(f"Events before the store origin {self.origin.date()}")
+        if len(days) and days.max() >= self.num_days:
+            self._grow_days(days.max() + 1)
+        return days
+
+    def _grow_days(self, needed):
+        grow = -(-(needed - self.num_days) // _DAYS_CHUNK) * _DAYS_CHUNK
+        for name, axis in [
+            ("transitions", 1),
+            ("still_open", 1),
+            ("fill_days", 2),
+            ("fills", 2),
+            ("fill_histogram", 1),
+        ]:
+            current = getattr(self, name)
+            shape = list(current.shape)
+            shape[axis] = grow
+            setattr(
+                self,
+                name,
+                np.concatenate([current, np.zeros(shape, current.dtype)], axis=axis),
+            )
+        self.num_days += grow
+
+    def _grow_requisitions(self, needed):
+        missing = needed - len(self._requisition_opened)
+        if missing > 0:
+            self._requisition_department = np.concatenate(
+                [self._requisition_department, np.zeros(missing, np.int64)]
+            )
+            self._requisition_position = np.concatenate(
+                [self._requisition_position, np.zeros(missing, np.int64)]
+            )
+            self._requisition_opened = np.concatenate(
+                [self._requisition_opened, np.full(missing, -1, np.int64)]
+            )
+
+    @staticmethod
+    def _add(counter, index, weights=None):
+        # Scatter-add through one bincount over the counter's flat index
+        counter += (
+            np.bincount(
+                np.ravel_multi_index(index, counter.shape),
+                weights=weights,
+                minlength=counter.size,
+            )
+            .reshape(counter.shape)
+            .astype(counter.dtype)
+        )
+
+    def open_requisitions(self, requisitions):
+        if len(requisitions) == 0:
+            return self
+        self._log["requisitions"].append(requisitions)
+        ids = requisitions["requisition_id"].to_numpy(np.int64)
+        departments = _codes(requisitions["department"], self.departments)
+        days = self._day_codes(requisitions["date"])
+        self._grow_requisitions(ids.max() + 1)
+        self._requisition_department[ids] = departments
+        self._requisition_position[ids] = _codes(
+            requisitions["position"], self.positions
+        )
+        self._requisition_opened[ids] = days
+        self._add(self.still_open, (departments, days))
+        return self
+
+    def append(self, transitions):
+        # Transitions must refer to requisitions already opened
+        if len(transitions) == 0:
+            return self
+        self._log["transitions"].append(transitions)
+        requisitions = transitions["requisition_id"].to_numpy(np.int64)
+        if (
+            requisitions.max() >= len(self._requisition_opened)
+            or (self._requisition_opened[requisitions] < 0).any()
+        ):
+            raise KeyError("Transitions reference requisitions that were never opened")
+
+        departments = self._requisition_department[requisitions]
+        days = self._day_codes(transitions["date"])
+        stages = _codes(transitions["stage"], self.stages)
+        self._add(
+            self.transitions,
+            (departments, days, _codes(transitions["source"], self.sources), stages),
+        )
+
+        hired = stages == self._hired
+        if hired.any():
+            filled = requisitions[hired]
+            departments, days = departments[hired], days[hired]
+            opened = self._requisition_opened[filled]
+            positions = self._requisition_position[filled]
+            time_to_fill = days - opened
+            bins = np.searchsorted(self.time_to_fill_edges, time_to_fill, "right") - 1
+            self._add(self.still_open, (departments, opened), -np.ones(len(filled)))
+            self._add(self.fill_days, (departments, positions, days), time_to_fill)
+            self._add(self.fills, (departments, positions, days))
+            self._add(self.fill_histogram, (departments, days, bins))
+        return self
+
+    def events(self, kind="transitions"):
+        # The raw log, for audits and replays; dashboards read the counters
+        return pd.concat(self._log[kind], ignore_index=True)
+
+    def _selection(self, departments, start, end):
+        rows = (
+            np.arange(len(self.departments))
+            if departments is None
+            else [self.departments.index(d) for d in departments]
+        )
+        first = 0 if start is None else (pd.Timestamp(start) - self.origin).days
+        last = (
+            self.num_days if end is None else (pd.Timestamp(end) - self.origin).days + 1
+        )
+        return rows, slice(max(first, 0), max(last, 0))
+
+    def funnel(self, departments=None, start=None, end=None):
+        # Candidates entering each stage in the window
+        rows, days = self._selection(departments, start, end)
+        counts = self.transitions[rows, days].sum(axis=(0, 1, 2))
+        return pd.Series(
+            counts, index=pd.Index(self.stages, name="stage"), name="count"
+        )
+
+    def source_attribution(self, stage="Hired", departments=None, start=None, end=None):
+        rows, days = self._selection(departments, start, end)
+        counts = self.transitions[rows, days, :, self.stages.index(stage)].sum(
+            axis=(0, 1)
+        )
+        return pd.Series(
+            counts, index=pd.Index(self.sources, name="source"), name="count"
+        )
+
+    def open_positions(self, departments=None, start=None, end=None):
+        # Requisitions opened in the window that are not filled yet
+        rows, days = self._selection(departments, start, end)
+        counts = self.still_open[rows, days].sum(axis=1)
+        return pd.Series(
+            counts,
+            index=pd.Index([self.departments[r] for r in rows], name="department"),
+            name="count",
+        )
+
+    def time_to_fill(self, departments=None, start=None, end=None):
+        # Average days to fill per position, over hires in the window
+        rows, days = self._selection(departments, start, end)
+        fills = self.fills[rows, :, days].sum(axis=(0, 2))
+        total_days = self.fill_days[rows, :, days].sum(axis=(0, 2))
+        filled = fills > 0
+        return pd.DataFrame(
+            {
+                "position": np.asarray(self.positions)[filled],
+                "days": total_days[filled] / fills[filled],
+                "hires": fills[filled],
+            }
+        )
+
+    def time_to_fill_histogram(self, departments=None, start=None, end=None):
+        rows, days = self._selection(departments, start, end)
+        counts = self.fill_histogram[rows, days].sum(axis=(0, 1))
+        return pd.Series(
+            counts, index=pd.Index(self.time_to_fill_edges, name="days"), name="hires"
+        )
+
+    def time_to_fill_quantile(self, q, departments=None, start=None, end=None):
+        # Lower edge of the histogram bin holding the q-th hire
+        histogram = self.time_to_fill_histogram(departments, start, end)
+        if histogram.sum() == 0:
+            return np.nan
+        position = np.searchsorted(histogram.cumsum().to_numpy(), q * histogram.sum())
+        return histogram.index[min(position, len(histogram) - 1)]
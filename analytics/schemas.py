@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+
+# Declared column dtypes per dataset, enforced when the dataset is loaded.
+# "*" sets the dtype of every float64 column not listed by name
+DATASET_SCHEMAS = {
+    "team_productivity": {
+        "Team": "category",
+        "Task Completion Rate": "float32",
+        "Communication Efficiency Rate": "float32",
+        "Knowledge Contributions": "int8",
+        "Meeting Effectiveness": "float32",
+        "Average Meeting Duration": "float32",
+        "Percentage Time in Meetings": "float32",
+        "Action Items per Meeting": "float32",
+        "Resolutions per Meeting": "float32",
+    },
+    "org_department_productivity": {
+        "department": "category",
+        "productivity": "int8",
+    },
+    "org_performance_ratings": {
+        "department": "category",
+        "exceptional": "int16",
+        "exceedsExpectations": "int16",
+        "meetsExpectations": "int16",
+        "needsImprovement": "int16",
+        "unsatisfactory": "int16",
+        "total_employees": "int16",
+        "avg_performance": "float32",
+    },
+    "org_trends": {"*": "float32"},
+    "org_training_impact": {
+        "department": "category",
+        "avgPerformance": "float32",
+        "trainingHours": "float32",
+        "employees": "int16",
+    },
+    "performance_vs_training": {
+        "department": "category",
+        "avgPerformance": "float32",
+        "trainingHours": "float32",
+        "employees": "int16",
+    },
+    "engagement_survey": {
+        "respondent_id": "int32",
+        "team": "category",
+        "quarter": "category",
+        "question": "category",
+        "score": "int8",
+    },
+}
+
+# Datasets loaded as a tuple of frames name one schema per part
+DATASET_PARTS = {
+    "org_productivity": [
+        "org_department_productivity",
+        "org_performance_ratings",
+        "org_trends",
+        "org_training_impact",
+    ],
+}
+
+# Memory of each dataset before and after its last enforcement, in bytes
+_memory_usage = {}
+
+
+def has_schema(dataset):
+    return dataset in DATASET_SCHEMAS or dataset in DATASET_PARTS
+
+
+def _check_range(values, dtype, dataset, column):
+    # Narrow integer casts wrap silently, so out-of-range data is an error
+    if not np.issubdtype(np.dtype(dtype), np.integer) or values.empty:
+        return
+    limits = np.iinfo(dtype)
+    if values.min() < limits.min or values.max() > limits.max:
+        raise ValueError(
+            f"{dataset}.{column} has values outside the {dtype} range "
+            f"[{limits.min}, {limits.max}]"
+        )
+
+
+def enforce_schema(data, dataset):
+    if dataset in DATASET_PARTS:
+        return tuple(
+            enforce_schema(part, name)
+            for part, name in zip(data, DATASET_PARTS[dataset])
+        )
+
+    schema = DATASET_SCHEMAS[dataset]
+    missing = [column for column in schema if column != "*" and column not in data]
+    if missing:
+        raise KeyError(f"{dataset} is missing columns: {', '.join(missing)}")
+
+    casts = {column: dtype for column, dtype in schema.items() if column != "*"}
+    if "*" in schema:
+        for column in data.columns[data.dtypes == np.float64]:
+            casts.setdefault(column, schema["*"])
+    for column, dtype in casts.items():
+        if dtype != "category":
+            _check_range(data[column], dtype, dataset, column)
+
+    before = data.memory_usage(deep=True).sum()
+    data = data.astype(casts)
+    _memory_usage[dataset] = {
+        "rows": len(data),
+        "bytes_before": int(before),
+        "bytes_after": int(data.memory_usage(deep=True).sum()),
+    }
+    return data
+
+
+def memory_report():
+    report = pd.DataFrame.from_dict(_memory_usage, orient="index")
+    if report.empty:
+        return report
+    report.index.name = "dataset"
+    report["saved_pct"] = 100 * (1 - report["bytes_after"] / report["bytes_before"])
+    return report.reset_index()
@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+CORE_SKILLS = [
+    "Project Management",
+    "Data Analysis",
+    "Leadership",
+    "Communication",
+    "Technical Writing",
+]
+
+# Share of employees holding each core skill, at any level
+CORE_SKILL_PREVALENCE = [0.75, 0.60, 0.55, 0.80, 0.45]
+
+MAX_SKILL_LEVEL = 5
+
+
+def generate_skill_catalog(num_skills):
+    return CORE_SKILLS + [
+        f"Skill {i:04d}" for i in range(1, num_skills - len(CORE_SKILLS) + 1)
+    ]
+
+
+def generate_skill_records(employees, skills, avg_skills_per_employee=8, seed=0):
+    rng = np.random.default_rng(seed)
+    num_employees = len(employees)
+    num_core = len(CORE_SKILLS)
+
+    # Core skills are held independently with a fixed prevalence
+    held = rng.random((num_employees, num_core)) < CORE_SKILL_PREVALENCE
+    core_rows, core_cols = np.nonzero(held)
+
+    # The long tail follows a Zipf-like popularity curve
+    counts = rng.poisson(avg_skills_per_employee, num_employees)
+    tail_rows = np.repeat(np.arange(num_employees), counts)
+    popularity = 1.0 / np.arange(1, len(skills) - num_core + 1) ** 0.8
+    tail_cols = num_core + rng.choice(
+        len(popularity), size=len(tail_rows), p=popularity / popularity.sum()
+    )
+
+    rows = np.concatenate([core_rows, tail_rows])
+    cols = np.concatenate([core_cols, tail_cols])
+    _, first = np.unique(rows.astype(np.int64) * len(skills) + cols, return_index=True)
+    rows, cols = rows[first], cols[first]
+
+    return pd.DataFrame(
+        {
+            "employee_id": employees["employee_id"].to_numpy()[rows],
+            "skill": pd.Categorical.from_codes(cols, categories=skills),
+            "level": rng.integers(1, MAX_SKILL_LEVEL + 1, len(rows)).astype(np.int8),
+        }
+    )
+
+
+class SkillsIndex:
+    # Employee x skill proficiency matrix (CSC, so each skill is a contiguous
+    # slice) plus one packed bitset of members per department
+    def __init__(
+        self, employee_ids, departments, skills, employee_idx, skill_idx, levels
+    ):
+        self.employee_ids = np.asarray(employee_ids)
+        self.skills = list(skills)
+        self._skill_positions = {skill: i for i, skill in enumerate(self.skills)}
+
+        num_employees = len(self.employee_ids)
+        department_codes = pd.Categorical(departments)
+        self.departments = list(department_codes.categories)
+        codes = department_codes.codes
+
+        self.matrix = sparse.csc_matrix(
+            (np.asarray(levels, dtype=np.int8), (employee_idx, skill_idx)),
+            shape=(num_employees, len(self.skills)),
+        )
+        self.department_bitsets = {
+            department: np.packbits(codes == i)
+            for i, department in enumerate(self.departments)
+        }
+        self.department_sizes = np.bincount(codes, minlength=len(self.departments))
+        self._membership = sparse.csr_matrix(
+            (np.ones(num_employees), (codes, np.arange(num_employees))),
+            shape=(len(self.departments), num_employees),
+        )
+        self._holder_counts = {}
+
+    @classmethod
+    def from_frame(cls, employees, skill_records, skills=None):
+        if skills is None:
+            skills = list(skill_records["skill"].cat.categories)
+        employee_idx = pd.Index(employees["employee_id"]).get_indexer(
+            skill_records["employee_id"]
+        )
+        skill_idx = pd.Index(skills).get_indexer(skill_records["skill"])
+        known = (employee_idx >= 0) & (skill_idx >= 0)
+        return cls(
+            employees["employee_id"],
+            employees["department"],
+            skills,
+            employee_idx[known],
+            skill_idx[known],
+            skill_records["level"].to_numpy()[known],
+        )
+
+    def department_mask(self, department=None):
+        if department is None:
+            return np.ones(len(self.employee_ids), dtype=bool)
+        return np.unpackbits(
+            self.department_bitsets[department], count=len(self.employee_ids)
+        ).astype(bool)
+
+    def employees_with_skill(self, skill, min_level=1, department=None):
+        column = self._skill_positions[skill]
+        start, end = self.matrix.indptr[column], self.matrix.indptr[column + 1]
+        rows = self.matrix.indices[start:end]
+        rows = rows[self.matrix.data[start:end] >= min_level]
+
+        if department is not None:
+            bitset = self.department_bitsets[department]
+            in_department = (bitset[rows >> 3] >> (7 - (rows & 7))) & 1
+            rows = rows[in_department.astype(bool)]
+
+        return self.employee_ids[np.sort(rows)]
+
+    def _counts_at_level(self, min_level):
+        # Department x skill holder counts, computed once per level
+        if min_level not in self._holder_counts:
+            qualified = self.matrix.copy()
+            qualified.data = (qualified.data >= min_level).astype(np.float64)
+            qualified.eliminate_zeros()
+            self._holder_counts[min_level] = (self._membership @ qualified).toarray()
+        return self._holder_counts[min_level]
+
+    def availability(self, min_level=1, department=None):
+        counts = self._counts_at_level(min_level)
+        if department is None:
+            holders, population = counts.sum(axis=0), self.department_sizes.sum()
+        else:
+            position = self.departments.index(department)
+            holders, population = counts[position], self.department_sizes[position]
+
+        return pd.Series(
+            100 * holders / max(population, 1), index=self.skills, name="availability"
+        )
+
+    def availability_by_department(self, min_level=1):
+        counts = self._counts_at_level(min_level)
+        return pd.DataFrame(
+            100 * counts / np.maximum(self.department_sizes, 1)[:, None],
+            index=self.departments,
+            columns=self.skills,
+        )
+
+    def gap_analysis(self, target, min_level=1, department=None):
+        # target is either one availability % for every skill or a skill -> % map
+        availability = self.availability(min_level, department)
+        if np.isscalar(target):
+            targets = pd.Series(float(target), index=availability.index)
+        else:
+            targets = pd.Series(target, dtype=float).reindex(availability.index)
+
+        gaps = pd.DataFrame(
+            {
+                "skill": availability.index,
+                "availability": availability.to_numpy(),
+                "target": targets.to_numpy(),
+            }
+        ).dropna(subset=["target"])
+        gaps["gap"] = (gaps["target"] - gaps["availability"]).clip(lower=0)
+        return (
+            gaps[gaps["gap"] > 0]
+            .sort_values("gap", ascending=False)
+            .reset_index(drop=True)
+        )
@@ -0,0 +1,245 @@
+import numpy as np
+import pandas as pd
+
+# Groups with fewer respondents than this never show scores or distributions
+MIN_RESPONDENTS = 5
+SCORE_LEVELS = [1, 2, 3, 4, 5]
+ALL_TEAMS = "All Teams"
+
+SURVEY_QUARTERS = ["Q1", "Q2", "Q3", "Q4"]
+
+# Question and the offset it adds to a team's baseline score
+SURVEY_QUESTIONS = {
+    "Job Satisfaction": 0.25,
+    "Work-Life Balance": -0.05,
+    "Team Collaboration": 0.15,
+    "Career Growth": -0.35,
+    "Company Culture": 0.15,
+    "Leadership": -0.15,
+    "Compensation": -0.45,
+}
+
+# Team headcount and baseline score (1-5 scale)
+SURVEY_TEAMS = {
+    "Product Development": (9000, 4.1),
+    "Customer Support": (6000, 3.85),
+    "Sales": (5000, 4.35),
+    "Marketing": (3000, 4.0),
+    "Human Resources": (2000, 4.2),
+    "Platform Engineering": (10, 4.0),
+    "Legal": (4, 3.9),
+}
+
+
+def generate_survey_responses(
+    teams=SURVEY_TEAMS,
+    questions=SURVEY_QUESTIONS,
+    quarters=SURVEY_QUARTERS,
+    response_rate=0.8,
+    seed=0,
+):
+    # One row per answer: every respondent answers every question, and each
+    # employee responds to a given quarter's survey with response_rate
+    rng = np.random.default_rng(seed)
+    team_names = list(teams)
+    headcounts = np.array([headcount for headcount, _ in teams.values()])
+    baselines = np.array([baseline for _, baseline in teams.values()])
+    offsets = np.array(list(questions.values()))
+    employee_teams = np.repeat(np.arange(len(team_names)), headcounts)
+
+    frames = []
+    for quarter_code in range(len(quarters)):
+        respondents = np.flatnonzero(rng.random(len(employee_teams)) < response_rate)
+        respondent_ids = np.repeat(respondents, len(offsets))
+        team_codes = employee_teams[respondent_ids]
+        question_codes = np.tile(np.arange(len(offsets)), len(respondents))
+        latent = (
+            baselines[team_codes]
+            + offsets[question_codes]
+            + 0.05 * quarter_code
+            + rng.normal(0, 0.8, len(respondent_ids))
+        )
+        frames.append(
+            pd.DataFrame(
+                {
+                    "respondent_id": respondent_ids,
+                    "team": pd.Categorical.from_codes(team_codes, team_names),
+                    "quarter": pd.Categorical.from_codes(
+                        np.full(len(respondent_ids), quarter_code), quarters
+                    ),
+                    "question": pd.Categorical.from_codes(
+                        question_codes, list(questions)
+                    ),
+                    "score": np.clip(np.rint(latent), 1, 5).astype(int),
+                }
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
+
+def _categories(values):
+    values = pd.Series(values)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.remove_unused_categories()
+    return values.astype("category")
+
+
+class SurveyAggregates:
+    # Answer counts, score sums and score histograms per (team, quarter,
+    # question), built from the raw responses with one bincount each. Team
+    # views, "All Teams" rollups and quarter-over-quarter deltas are derived
+    # from these arrays; a group below min_respondents is suppressed, and so
+    # is any rollup of teams whose combined respondents fall below it
+    def __init__(
+        self,
+        teams,
+        quarters,
+        questions,
+        respondents,
+        counts,
+        sums,
+        distribution,
+        min_respondents=MIN_RESPONDENTS,
+    ):
+        self.teams = list(teams)
+        self.quarters = list(quarters)
+        self.questions = list(questions)
+        self.respondents = respondents
+        self.counts = counts
+        self.sums = sums
+        self.distribution = distribution
+        self.min_respondents = min_respondents
+        self.suppressed, self.means, self.deltas = self._summarise(
+            respondents, counts, sums
+        )
+
+    @classmethod
+    def from_responses(cls, responses, min_respondents=MIN_RESPONDENTS):
+        team = _categories(responses["team"])
+        quarter = _categories(responses["quarter"])
+        question = _categories(responses["question"])
+        shape = (
+            len(team.cat.categories),
+            len(quarter.cat.categories),
+            len(question.cat.categories),
+        )
+
+        team_quarter = team.cat.codes.to_numpy(np.int64) * shape[1]
+        team_quarter += quarter.cat.codes.to_numpy(np.int64)
+        cell = team_quarter * shape[2] + question.cat.codes.to_numpy(np.int64)
+        scores = responses["score"].to_numpy()
+        size = int(np.prod(shape))
+
+        counts = np.bincount(cell, minlength=size).reshape(shape)
+        sums = np.bincount(cell, weights=scores, minlength=size).reshape(shape)
+        levels = len(SCORE_LEVELS)
+        distribution = np.bincount(
+            cell * levels + (scores.astype(np.int64) - SCORE_LEVELS[0]),
+            minlength=size * levels,
+        ).reshape(*shape, levels)
+
+        # Distinct respondents per (team, quarter), not answers
+        ids = responses["respondent_id"].to_numpy(np.int64)
+        stride = ids.max() + 1 if len(ids) else 1
+        distinct = np.unique(team_quarter * stride + ids)
+        respondents = np.bincount(
+            distinct // stride, minlength=shape[0] * shape[1]
+        ).reshape(shape[:2])
+
+        return cls(
+            team.cat.categories,
+            quarter.cat.categories,
+            question.cat.categories,
+            respondents,
+            counts,
+            sums,
+            distribution,
+            min_respondents,
+        )
+
+    def _summarise(self, respondents, counts, sums):
+        # Arrays lead with any group axes, then quarter (and question)
+        suppressed = respondents < self.min_respondents
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = sums / counts
+        means[np.broadcast_to(suppressed[..., None], means.shape)] = np.nan
+        deltas = np.full_like(means, np.nan)
+        deltas[..., 1:, :] = means[..., 1:, :] - means[..., :-1, :]
+        return suppressed, means, deltas
+
+    def _positions(self, teams):
+        if teams is None:
+            return np.arange(len(self.teams))
+        return np.array([self.teams.index(t) for t in teams if t in self.teams], int)
+
+    def _quarter(self, quarter):
+        return (
+            len(self.quarters) - 1 if quarter is None else self.quarters.index(quarter)
+        )
+
+    def _groups(self, teams, by_team):
+        positions = self._positions(teams)
+        if by_team:
+            return (
+                [self.teams[p] for p in positions],
+                self.respondents[positions],
+                self.counts[positions],
+                self.sums[positions],
+                self.distribution[positions],
+            )
+        return (
+            [ALL_TEAMS],
+            self.respondents[positions].sum(axis=0)[None],
+            self.counts[positions].sum(axis=0)[None],
+            self.sums[positions].sum(axis=0)[None],
+            self.distribution[positions].sum(axis=0)[None],
+        )
+
+    def scores(self, teams=None, quarter=None, by_team=True):
+        # Mean per team (or rollup) and question for one quarter, with the
+        # change since the previous quarter
+        if by_team:
+            positions = self._positions(teams)
+            names = [self.teams[p] for p in positions]
+            respondents = self.respondents[positions]
+            suppressed = self.suppressed[positions]
+            means, deltas = self.means[positions], self.deltas[positions]
+        else:
+            names, respondents, counts, sums, _ = self._groups(teams, by_team)
+            suppressed, means, deltas = self._summarise(respondents, counts, sums)
+        q = self._quarter(quarter)
+        num_questions = len(self.questions)
+        return pd.DataFrame(
+            {
+                "team": np.repeat(names, num_questions),
+                "question": np.tile(self.questions, len(names)),
+                "respondents": np.repeat(respondents[:, q], num_questions),
+                "mean": means[:, q].ravel(),
+                "delta": deltas[:, q].ravel(),
+                "suppressed": np.repeat(suppressed[:, q], num_questions),
+            }
+        )
+
+    def trend(self, teams=None, by_team=True):
+        # Mean over all questions per quarter; one column per team or rollup
+        names, respondents, counts, sums, _ = self._groups(teams, by_team)
+        suppressed, means, _ = self._summarise(
+            respondents, counts.sum(axis=-1)[..., None], sums.sum(axis=-1)[..., None]
+        )
+        return pd.DataFrame(
+            means[..., 0].T,
+            index=pd.Index(self.quarters, name="quarter"),
+            columns=names,
+        )
+
+    def score_distribution(self, question, teams=None, quarter=None):
+        # Answers per score level across the selected teams; None when the
+        # selection is below the respondent threshold
+        _, respondents, _, _, distribution = self._groups(teams, by_team=False)
+        q = self._quarter(quarter)
+        if respondents[0, q] < self.min_respondents:
+            return None
+        counts = distribution[0, q, self.questions.index(question)]
+        return pd.Series(
+            counts, index=pd.Index(SCORE_LEVELS, name="score"), name="count"
+        )
@@ -0,0 +1,199 @@
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from analytics.employees import DEPARTMENTS
+
+SPRINT_DAYS = 14
+
+# Sprints in the rolling window, smoothing factors tried per team, and the
+# coverage of the forecast prediction intervals
+ROLLING_SPRINTS = 4
+SMOOTHING_GRID = np.round(np.linspace(0.1, 0.9, 9), 2)
+FORECAST_LEVEL = 0.8
+
+
+def generate_sprint_history(num_teams, sprints=26, end=None, seed=0):
+    # Completed story points per team and sprint. Each team has its own
+    # base velocity and drift; some teams formed partway through and have
+    # no earlier sprints
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp.now().normalize() if end is None else pd.Timestamp(end)
+    base = rng.lognormal(np.log(45), 0.35, num_teams)
+    drift = rng.normal(0, 0.01, num_teams)
+    first = np.where(
+        rng.random(num_teams) < 0.15, rng.integers(1, sprints - 6, num_teams), 0
+    )
+
+    sprint = np.arange(sprints)
+    mean = base[:, None] * (1 + drift[:, None] * (sprint - first[:, None]))
+    points = np.maximum(
+        np.round(mean + rng.normal(0, 1, mean.shape) * 0.15 * base[:, None]), 0
+    )
+    team, column = np.nonzero(sprint >= first[:, None])
+    ends = end - pd.to_timedelta((sprints - 1 - sprint) * SPRINT_DAYS, "D")
+    return pd.DataFrame(
+        {
+            "team": pd.Categorical.from_codes(
+                team, [f"Team {i + 1:03d}" for i in range(num_teams)]
+            ),
+            "department": pd.Categorical.from_codes(
+                rng.integers(0, len(DEPARTMENTS), num_teams)[team], DEPARTMENTS
+            ),
+            "sprint": column + 1,
+            "sprint_end": ends[column],
+            "story_points": points[team, column].astype(int),
+        }
+    )
+
+
+class VelocityHistory:
+    # Story points as a teams x sprints matrix, NaN where a team has no
+    # sprint yet. Rolling statistics are differences of cumulative sums along
+    # the sprint axis, and the smoothing forecast steps through sprints once
+    # for every team and candidate smoothing factor together, so no query
+    # loops over teams. Forecasts are memoized until the next append
+    def __init__(self, teams, departments):
+        self.teams = list(teams)
+        self.departments = pd.Categorical(departments)
+        self.sprints = np.zeros(0, np.int64)
+        self.points = np.zeros((len(self.teams), 0))
+        self._forecasts = {}
+
+    @classmethod
+    def from_frame(cls, frame):
+        teams = frame.drop_duplicates("team").sort_values("team")
+        return cls(teams["team"].astype(str), teams["department"]).append(frame)
+
+    def append(self, frame):
+        # Sprint results; a team and sprint already recorded is overwritten
+        if len(frame) == 0:
+            return self
+        sprints = np.union1d(self.sprints, frame["sprint"].to_numpy())
+        points = np.full((len(self.teams), len(sprints)), np.nan)
+        points[:, np.searchsorted(sprints, self.sprints)] = self.points
+        rows = pd.Index(self.teams).get_indexer(frame["team"].astype(str))
+        if (rows < 0).any():
+            raise KeyError("Sprint results reference unknown teams")
+        columns = np.searchsorted(sprints, frame["sprint"].to_numpy())
+        points[rows, columns] = frame["story_points"].to_numpy(float)
+        self.sprints, self.points = sprints, points
+        self._forecasts.clear()
+        return self
+
+    def rolling(self, window=ROLLING_SPRINTS):
+        # Mean and sample variance over each team's last `window` sprints,
+        # NaN until a team has `window` of them
+        observed = ~np.isnan(self.points)
+        values = np.where(observed, self.points, 0.0)
+        pad = np.zeros((len(self.teams), 1))
+        counts = np.cumsum(np.hstack([pad, observed]), axis=1)
+        sums = np.cumsum(np.hstack([pad, values]), axis=1)
+        squares = np.cumsum(np.hstack([pad, values**2]), axis=1)
+
+        mean = np.full(self.points.shape, np.nan)
+        variance = np.full(self.points.shape, np.nan)
+        if self.points.shape[1] < window:
+            return mean, variance
+        n = counts[:, window:] - counts[:, :-window]
+        total = sums[:, window:] - sums[:, :-window]
+        total_squares = squares[:, window:] - squares[:, :-window]
+        full = n == window
+        with np.errstate(invalid="ignore"):
+            window_mean = total / window
+            window_variance = (total_squares - window * window_mean**2) / (window - 1)
+        mean[:, window - 1 :] = np.where(full, window_mean, np.nan)
+        variance[:, window - 1 :] = np.where(
+            full, np.maximum(window_variance, 0), np.nan
+        )
+        return mean, variance
+
+    def _smooth(self, alphas):
+        # Simple exponential smoothing over the sprint axis for every
+        # (alpha, team): final level, sum of squared one-step errors and
+        # number of errors. A team's level starts at its first sprint
+        level = np.full((len(alphas), len(self.teams)), np.nan)
+        sse = np.zeros_like(level)
+        errors = np.zeros(len(self.teams))
+        alphas = np.asarray(alphas)[:, None]
+        for values in self.points.T:
+            seen = ~np.isnan(values)
+            started = seen & ~np.isnan(level[0])
+            error = np.where(started, values - level, 0.0)
+            sse += error**2
+            errors += started
+            level = np.where(
+                started, level + alphas * error, np.where(seen, values, level)
+            )
+        return level, sse, errors
+
+    def forecast(self, horizon=3, level=FORECAST_LEVEL):
+        # Per team: the smoothing factor with the lowest one-step error, a
+        # flat forecast at the final level, and prediction intervals widening
+        # as sigma * sqrt(1 + (h - 1) * alpha^2)
+        cache_key = (horizon, level)
+        if cache_key in self._forecasts:
+            return self._forecasts[cache_key]
+
+        levels, sse, errors = self._smooth(SMOOTHING_GRID)
+        best = np.argmin(sse, axis=0)
+        teams = np.arange(len(self.teams))
+        alpha = SMOOTHING_GRID[best]
+        final = levels[best, teams]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sigma = np.sqrt(sse[best, teams] / np.maximum(errors - 1, 1))
+        sigma = np.where(errors >= 2, sigma, np.nan)
+
+        steps = np.arange(1, horizon + 1)
+        spread = sigma[:, None] * np.sqrt(1 + (steps - 1) * alpha[:, None] ** 2)
+        z = NormalDist().inv_cdf(0.5 + level / 2)
+        last = self.sprints[-1] if len(self.sprints) else 0
+        forecast = pd.DataFrame(
+            {
+                "team": np.repeat(self.teams, horizon),
+                "department": np.repeat(np.asarray(self.departments), horizon),
+                "sprint": np.tile(last + steps, len(self.teams)),
+                "forecast": np.repeat(final, horizon),
+                "sigma": spread.ravel(),
+                "alpha": np.repeat(alpha, horizon),
+            }
+        )
+        forecast["lower"] = np.maximum(forecast["forecast"] - z * forecast["sigma"], 0)
+        forecast["upper"] = forecast["forecast"] + z * forecast["sigma"]
+        self._forecasts[cache_key] = forecast
+        return forecast
+
+    def capacity(self, horizon=3, level=FORECAST_LEVEL, by="department"):
+        # Forecast story points summed per group and sprint; team errors are
+        # taken as independent, so group variances add
+        forecast = self.forecast(horizon, level)
+        grouped = (
+            forecast.assign(variance=forecast["sigma"] ** 2)
+            .groupby([by, "sprint"], observed=True)
+            .agg(
+                teams=("team", "size"),
+                forecast=("forecast", "sum"),
+                variance=("variance", "sum"),
+            )
+            .reset_index()
+        )
+        z = NormalDist().inv_cdf(0.5 + level / 2)
+        spread = z * np.sqrt(grouped.pop("variance"))
+        grouped["lower"] = np.maximum(grouped["forecast"] - spread, 0)
+        grouped["upper"] = grouped["forecast"] + spread
+        return grouped
+
+    def team_history(self, team, window=ROLLING_SPRINTS):
+        # One team's sprints with their rolling mean and standard deviation
+        row = self.teams.index(team)
+        mean, variance = self.rolling(window)
+        history = pd.DataFrame(
+            {
+                "sprint": self.sprints,
+                "story_points": self.points[row],
+                "rolling_mean": mean[row],
+                "rolling_std": np.sqrt(variance[row]),
+            }
+        )
+        return history.dropna(subset=["story_points"])
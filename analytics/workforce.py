@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+# Monte Carlo paths per scenario and the quantiles shown as bands
+SIMULATION_PATHS = 5000
+PROJECTION_QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+PLAN_COLUMNS = [
+    "department",
+    "headcount",
+    "voluntary_rate",
+    "involuntary_rate",
+    "hires",
+]
+
+
+class WorkforceProjection:
+    # Simulated headcount as a (month, path, department) array; month 0 is
+    # the starting headcount. Bands and probabilities are taken across paths
+    # of the summed selected departments
+    def __init__(self, departments, headcount):
+        self.departments = list(departments)
+        self.headcount = headcount
+
+    @property
+    def months(self):
+        return self.headcount.shape[0] - 1
+
+    def _totals(self, departments=None):
+        if departments is None:
+            return self.headcount.sum(axis=2)
+        columns = [self.departments.index(d) for d in departments]
+        return self.headcount[:, :, columns].sum(axis=2)
+
+    def bands(self, quantiles=PROJECTION_QUANTILES, departments=None):
+        totals = self._totals(departments)
+        bands = np.quantile(totals, quantiles, axis=1).T
+        result = pd.DataFrame(
+            bands,
+            index=pd.RangeIndex(self.months + 1, name="month"),
+            columns=[f"p{round(q * 100)}" for q in quantiles],
+        )
+        result["mean"] = totals.mean(axis=1)
+        return result
+
+    def shortfall_probability(self, required, departments=None):
+        # Share of paths below the required headcount in each month
+        totals = self._totals(departments)
+        return pd.Series(
+            (totals < required).mean(axis=1),
+            index=pd.RangeIndex(self.months + 1, name="month"),
+            name="probability",
+        )
+
+
+def simulate_workforce(
+    plan, months=18, paths=SIMULATION_PATHS, rate_volatility=0.25, seed=0
+):
+    # plan has one row per department with its headcount, monthly voluntary
+    # and involuntary turnover (%) and mean hires per month. Each path and
+    # month draws its own turnover multiplier (gamma, mean 1, coefficient of
+    # variation rate_volatility); leavers are binomial on the current
+    # headcount and hires Poisson. All paths and departments advance together
+    rng = np.random.default_rng(seed)
+    plan = plan[PLAN_COLUMNS]
+    turnover = (plan["voluntary_rate"] + plan["involuntary_rate"]).to_numpy() / 100
+    hires = plan["hires"].to_numpy(dtype=float)
+    shape = 1 / rate_volatility**2 if rate_volatility > 0 else None
+
+    headcount = np.empty((months + 1, paths, len(plan)), dtype=np.int64)
+    headcount[0] = plan["headcount"].to_numpy()
+    for month in range(1, months + 1):
+        rates = np.broadcast_to(turnover, (paths, len(plan)))
+        if shape is not None:
+            rates = rates * rng.gamma(shape, 1 / shape, (paths, len(plan)))
+        leavers = rng.binomial(headcount[month - 1], np.clip(rates, 0, 1))
+        headcount[month] = (
+            headcount[month - 1] - leavers + rng.poisson(hires, (paths, len(plan)))
+        )
+    return WorkforceProjection(plan["department"], headcount)
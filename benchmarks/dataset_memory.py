@@ -0,0 +1,48 @@
+import argparse
+
+import pandas as pd
+
+from analytics.schemas import enforce_schema, memory_report
+from first_line_manager.mgr_productivity_dashboard import \
+    generate_team_dummy_data
+from second_line_manager_or_director.org_performance_dashboard import \
+    generate_performance_vs_training_data
+from second_line_manager_or_director.org_productivity_dashboard import \
+    generate_dummy_data
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report dataset memory before and after schema enforcement"
+    )
+    parser.add_argument("--teams", type=int, default=500)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--entries-per-department", type=int, default=10_000)
+    args = parser.parse_args()
+
+    departments = ["Sales", "Marketing", "Engineering", "Customer Support", "HR"]
+    enforce_schema(generate_team_dummy_data(args.teams, args.days), "team_productivity")
+    enforce_schema(generate_dummy_data(), "org_productivity")
+    enforce_schema(
+        pd.DataFrame(
+            generate_performance_vs_training_data(
+                departments, args.entries_per_department
+            )
+        ),
+        "performance_vs_training",
+    )
+
+    report = memory_report()
+    print(report.to_string(index=False, float_format="{:.1f}".format))
+    total_before, total_after = (
+        report["bytes_before"].sum(),
+        report["bytes_after"].sum(),
+    )
+    print(
+        f"\nTotal: {total_before / 2**20:.1f} MB -> {total_after / 2**20:.1f} MB "
+        f"({100 * (1 - total_after / total_before):.1f}% saved)"
+    )
+
+
+if __name__ == "__main__":
+    main()
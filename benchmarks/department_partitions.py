@@ -0,0 +1,116 @@
+import argparse
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from analytics.employees import DEPARTMENTS, POSITIONS
+from analytics.partitions import PartitionedFrame
+
+NUM_ROWS = 2_000_000
+
+AGGREGATIONS = {
+    "hours": ("hours", "sum"),
+    "avg_performance": ("performance", "mean"),
+    "max_tasks": ("tasks", "max"),
+    "records": ("performance", "count"),
+}
+
+
+def generate_activity_records(num_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "department": pd.Categorical.from_codes(
+                rng.integers(0, len(DEPARTMENTS), num_rows), categories=DEPARTMENTS
+            ),
+            "position": pd.Categorical.from_codes(
+                rng.integers(0, len(POSITIONS), num_rows), categories=POSITIONS
+            ),
+            "hours": rng.uniform(0, 10, num_rows),
+            "performance": rng.uniform(1, 5, num_rows),
+            "tasks": rng.integers(0, 20, num_rows),
+        }
+    )
+
+
+def _best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_benchmark(num_rows=NUM_ROWS, repeat=3, workers=None):
+    frame = generate_activity_records(num_rows)
+    partitioned = PartitionedFrame.from_frame(frame)
+    department = DEPARTMENTS[0]
+
+    def mask_single():
+        shard = frame[frame["department"] == department]
+        return shard.groupby("position", observed=True).agg(**AGGREGATIONS)
+
+    def mask_all():
+        return frame.groupby("position", observed=True).agg(**AGGREGATIONS)
+
+    cases = {
+        "single department, frame mask": mask_single,
+        "single department, shard": lambda: partitioned.aggregate(
+            "position", AGGREGATIONS, partitions=[department]
+        ),
+        "all departments, single frame": mask_all,
+        "all departments, thread pool": lambda: partitioned.aggregate(
+            "position", AGGREGATIONS, executor="thread", workers=workers
+        ),
+        "all departments, process pool": lambda: partitioned.aggregate(
+            "position", AGGREGATIONS, executor="process", workers=workers
+        ),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        frame.to_parquet(f"{directory}/all.parquet", index=False)
+        partitioned.write(directory)
+
+        def read_all_then_mask():
+            loaded = pd.read_parquet(f"{directory}/all.parquet")
+            return loaded[loaded["department"] == department]
+
+        cases["single department read, full file + mask"] = read_all_then_mask
+        cases["single department read, one partition"] = lambda: (
+            PartitionedFrame.read(directory, [department]).shard(department)
+        )
+
+        # Sharded results must match the single-frame answer before timing
+        pd.testing.assert_frame_equal(
+            cases["all departments, thread pool"]().sort_index(),
+            mask_all().sort_index(),
+            check_dtype=False,
+        )
+
+        return pd.DataFrame(
+            [
+                {"case": name, "seconds": _best_of(func, repeat)}
+                for name, func in cases.items()
+            ]
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare department-sharded aggregation with single-frame masks"
+    )
+    parser.add_argument("--rows", type=int, default=NUM_ROWS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.rows, args.repeat, args.workers)
+    print(f"{args.rows:,} rows, best of {args.repeat}")
+    print(results.to_string(index=False, float_format="{:.4f}".format))
+
+
+if __name__ == "__main__":
+    main()
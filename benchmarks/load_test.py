@@ -0,0 +1,204 @@
+import argparse
+import ast
+import random
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+APP_SCRIPT = Path(__file__).resolve().parent.parent / "main.py"
+PERCENTILES = [50, 95, 99]
+
+
+def load_persona_navigation(script=APP_SCRIPT):
+    # Read from the source so the harness process does not import (and
+    # register components for) every dashboard outside a Streamlit runtime
+    for node in ast.parse(Path(script).read_text()).body:
+        if isinstance(node, ast.Assign) and any(
+            getattr(target, "id", None) == "PERSONA_NAVIGATION"
+            for target in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    raise ValueError(f"PERSONA_NAVIGATION not found in {script}")
+
+
+PERSONA_NAVIGATION = load_persona_navigation()
+
+
+def _rss_bytes():
+    # Current resident set size; falls back to the peak where /proc is missing
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+class DashboardSession:
+    # One simulated user: opens the app, then alternates think time with a
+    # navigation click or a change to one of the page's selectboxes
+    def __init__(self, session_id, actions, think_time, timeout, seed):
+        self.session_id = session_id
+        self.actions = actions
+        self.think_time = think_time
+        self.rng = random.Random(seed)
+        self.app = AppTest.from_file(str(APP_SCRIPT), default_timeout=timeout)
+        self.timings = []
+        self.errors = 0
+
+    def _rerun(self, action, widget=None, value=None):
+        start = time.perf_counter()
+        try:
+            if widget is None:
+                self.app.run()
+            else:
+                widget.set_value(value).run()
+            failed = bool(self.app.exception)
+        except Exception:
+            failed = True
+        self.errors += failed
+        self.timings.append(
+            {
+                "session": self.session_id,
+                "action": action,
+                "seconds": time.perf_counter() - start,
+                "failed": failed,
+            }
+        )
+
+    def _navigate(self):
+        persona = self.rng.choice(list(PERSONA_NAVIGATION))
+        page = self.rng.choice(PERSONA_NAVIGATION[persona])
+        persona_select = self.app.sidebar.selectbox[0]
+        if persona_select.value != persona:
+            self._rerun(f"{persona}: open", persona_select, persona)
+        self._rerun(f"{persona}: {page}", self.app.sidebar.radio[0], page)
+
+    def _change_widget(self):
+        widgets = [w for w in self.app.main.selectbox if len(w.options) > 1]
+        if not widgets:
+            return self._navigate()
+        widget = self.rng.choice(widgets)
+        value = self.rng.choice([o for o in widget.options if o != widget.value])
+        self._rerun(f"widget: {widget.label}", widget, value)
+
+    def run(self):
+        self._rerun("initial load")
+        for _ in range(self.actions):
+            time.sleep(self.rng.expovariate(1 / self.think_time))
+            if self.rng.random() < 0.5:
+                self._navigate()
+            else:
+                self._change_widget()
+        return self.timings
+
+
+def run_load_test(sessions, actions, think_time, timeout=60, seed=0, ramp_up=5.0):
+    # Scripts run on AppTest's own threads, so CPU is measured for the whole
+    # process and shared out per session
+    cpu_start = time.process_time()
+    rss_start = _rss_bytes()
+    peak_rss = [rss_start]
+    stop = threading.Event()
+
+    def sample_memory():
+        while not stop.wait(0.5):
+            peak_rss[0] = max(peak_rss[0], _rss_bytes())
+
+    def start_session(session_id):
+        # Sessions arrive spread over the ramp-up window
+        time.sleep(ramp_up * session_id / max(sessions, 1))
+        session = DashboardSession(
+            session_id, actions, think_time, timeout, seed + session_id
+        )
+        return session.run()
+
+    sampler = threading.Thread(target=sample_memory, daemon=True)
+    sampler.start()
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        results = list(pool.map(start_session, range(sessions)))
+    wall_time = time.perf_counter() - wall_start
+    cpu_seconds = time.process_time() - cpu_start
+    stop.set()
+    peak_rss[0] = max(peak_rss[0], _rss_bytes())
+
+    timings = pd.DataFrame([timing for session in results for timing in session])
+    latencies = timings["seconds"].to_numpy()
+    summary = {
+        "sessions": sessions,
+        "reruns": len(timings),
+        "failed_reruns": int(timings["failed"].sum()),
+        "wall_seconds": wall_time,
+        "throughput_reruns_per_s": len(timings) / wall_time,
+        **{
+            f"p{p}_latency_s": value
+            for p, value in zip(PERCENTILES, np.percentile(latencies, PERCENTILES))
+        },
+        "cpu_utilization": cpu_seconds / wall_time,
+        "cpu_seconds_per_session": cpu_seconds / sessions,
+        "memory_mb_per_session": (peak_rss[0] - rss_start) / sessions / 2**20,
+        "peak_rss_mb": peak_rss[0] / 2**20,
+    }
+    return summary, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulate concurrent dashboard sessions and report rerun latency"
+    )
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--actions", type=int, default=20)
+    parser.add_argument("--think-time", type=float, default=2.0)
+    parser.add_argument("--ramp-up", type=float, default=5.0)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timings-csv", default=None)
+    parser.add_argument(
+        "--max-p95",
+        type=float,
+        default=None,
+        help="Exit non-zero when p95 rerun latency (seconds) exceeds this",
+    )
+    args = parser.parse_args()
+
+    summary, timings = run_load_test(
+        args.sessions,
+        args.actions,
+        args.think_time,
+        args.timeout,
+        args.seed,
+        args.ramp_up,
+    )
+    for name, value in summary.items():
+        print(
+            f"{name:>26}: {value:,.3f}"
+            if isinstance(value, float)
+            else f"{name:>26}: {value:,}"
+        )
+
+    slowest = (
+        timings.groupby("action")["seconds"]
+        .agg(["count", "median", "max"])
+        .sort_values("median", ascending=False)
+        .head(10)
+    )
+    print("\nSlowest actions (median seconds)")
+    print(slowest.to_string(float_format="{:.3f}".format))
+
+    if args.timings_csv:
+        timings.to_csv(args.timings_csv, index=False)
+    if args.max_p95 is not None and summary["p95_latency_s"] > args.max_p95:
+        print(f"p95 latency {summary['p95_latency_s']:.3f}s exceeds {args.max_p95}s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,81 +1,17 @@
 import pandas as pd
 import streamlit as st
 
-from ui.style import (create_styled_bar_chart, create_styled_bullet_list,
-                      create_styled_tabs)
-
-# Anonymized engagement data
-anonymized_engagement_data = [
-    {
-        "id": "EMP001",
-        "workLifeBalance": 7,
-        "jobSatisfaction": 8,
-        "teamCollaboration": 9,
-        "careerGrowth": 6,
-    },
-    {
-        "id": "EMP002",
-        "workLifeBalance": 6,
-        "jobSatisfaction": 7,
-        "teamCollaboration": 8,
-        "careerGrowth": 7,
-    },
-    {
-        "id": "EMP003",
-        "workLifeBalance": 8,
-        "jobSatisfaction": 6,
-        "teamCollaboration": 7,
-        "careerGrowth": 8,
-    },
-    {
-        "id": "EMP004",
-        "workLifeBalance": 5,
-        "jobSatisfaction": 7,
-        "teamCollaboration": 9,
-        "careerGrowth": 6,
-    },
-    {
-        "id": "EMP005",
-        "workLifeBalance": 7,
-        "jobSatisfaction": 8,
-        "teamCollaboration": 6,
-        "careerGrowth": 7,
-    },
-]
-
-# Employee compliance data
-employee_compliance_data = [
-    {
-        "name": "Alice",
-        "safetyTraining": "compliant",
-        "dataProtection": "compliant",
-        "codeOfConduct": "compliant",
-    },
-    {
-        "name": "Bob",
-        "safetyTraining": "non-compliant",
-        "dataProtection": "compliant",
-        "codeOfConduct": "compliant",
-    },
-    {
-        "name": "Charlie",
-        "safetyTraining": "compliant",
-        "dataProtection": "warning",
-        "codeOfConduct": "compliant",
-    },
-    {
-        "name": "Diana",
-        "safetyTraining": "compliant",
-        "dataProtection": "compliant",
-        "codeOfConduct": "non-compliant",
-    },
-    {
-        "name": "Ethan",
-        "safetyTraining": "warning",
-        "dataProtection": "compliant",
-        "codeOfConduct": "compliant",
-    },
-]
+from analytics.compliance import COMPLIANCE_REQUIREMENTS
+from ui.datasets import load_compliance_index, load_survey_aggregates
+from ui.style import (create_export_download, create_styled_bar_chart,
+                      create_styled_bullet_list, create_styled_tabs)
+from ui.table import create_status_table
+
+# The manager's own team in the engagement survey
+MANAGER_TEAM = "Platform Engineering"
+
+# The manager's id in the org compliance index
+MANAGER_ID = "EMP001505"
 
 
 def manager_engagement_and_compliance_dashboard():
@@ -96,66 +32,56 @@ def manager_engagement_and_compliance_dashboard():
 def display_engagement_metrics():
     st.header("Anonymized Team Engagement Metrics")
 
-    df = pd.DataFrame(anonymized_engagement_data)
-    categories = [
-        "workLifeBalance",
-        "jobSatisfaction",
-        "teamCollaboration",
-        "careerGrowth",
-    ]
-
-    for category in categories:
-        create_styled_bar_chart(
-            df["id"],
-            df[category],
-            "Employee ID",
-            f"{category} Score",
-            # f"{category} Scores"
+    aggregates = load_survey_aggregates()
+    scores = aggregates.scores(teams=[MANAGER_TEAM])
+    if scores.empty or scores["suppressed"].all():
+        st.info(
+            f"Fewer than {aggregates.min_respondents} team members responded to "
+            "the latest survey, so results are hidden to protect anonymity."
         )
+        return
+
+    st.caption(
+        f"{scores['respondents'].iloc[0]} respondents, "
+        f"{aggregates.quarters[-1]}; scores on a 1-5 scale"
+    )
+    create_styled_bar_chart(
+        scores["question"], scores["mean"], "Survey Question", "Average Score"
+    )
 
     # Metric detail buttons
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        if st.button("Work-Life Balance"):
-            show_metric_details("workLifeBalance")
-    with col2:
-        if st.button("Job Satisfaction"):
-            show_metric_details("jobSatisfaction")
-    with col3:
-        if st.button("Team Collaboration"):
-            show_metric_details("teamCollaboration")
-    with col4:
-        if st.button("Career Growth"):
-            show_metric_details("careerGrowth")
-
-
-def show_metric_details(metric):
-    st.subheader(f"{metric} Details")
-    df = pd.DataFrame(anonymized_engagement_data)
-    st.dataframe(df[["id", metric]])
+    columns = st.columns(4)
+    for i, question in enumerate(aggregates.questions):
+        with columns[i % 4]:
+            if st.button(question):
+                show_metric_details(aggregates, question)
+
+
+def show_metric_details(aggregates, question):
+    st.subheader(f"{question} Details")
+    row = aggregates.scores(teams=[MANAGER_TEAM]).set_index("question").loc[question]
+    change = (
+        "" if pd.isna(row["delta"]) else f" ({row['delta']:+.2f} since last quarter)"
+    )
+    st.write(f"Average score: {row['mean']:.2f}{change}")
+    distribution = aggregates.score_distribution(question, teams=[MANAGER_TEAM])
+    if distribution is not None:
+        create_styled_bar_chart(distribution.index, distribution, "Score", "Responses")
 
 
 def display_compliance_status():
     st.header("Team Compliance Status")
 
-    df = pd.DataFrame(employee_compliance_data)
-
-    # Function to color-code status
-    def color_status(val):
-        if val == "compliant":
-            return "background-color: #90EE90"
-        elif val == "non-compliant":
-            return "background-color: #FFB6C1"
-        elif val == "warning":
-            return "background-color: #FFFFE0"
-        return ""
-
-    # Apply color-coding to the dataframe
-    styled_df = df.style.applymap(
-        color_status, subset=["safetyTraining", "dataProtection", "codeOfConduct"]
-    )
+    df = load_compliance_index().records(manager_id=MANAGER_ID)
 
-    st.dataframe(styled_df, use_container_width=True)
+    create_status_table(
+        df.drop(columns="employee_id"),
+        status_columns=list(COMPLIANCE_REQUIREMENTS),
+        use_container_width=True,
+    )
+    create_export_download(
+        {"All": df}, "team_compliance_status", key="compliance_export"
+    )
 
 
 def display_engagement_action_items():
@@ -172,13 +98,13 @@ def display_engagement_action_items():
 
 def display_compliance_action_items():
     st.header("Compliance Action Items")
+    df = load_compliance_index().records(manager_id=MANAGER_ID)
     compliance_action_items = [
-        "Ensure Bob completes his safety training by the end of the week",
-        "Follow up with Charlie regarding the data protection warning",
-        "Review the code of conduct with Diana and provide necessary guidance",
-        "Schedule a refresher course on safety procedures for Ethan",
-        "Conduct a team-wide compliance awareness session",
+        f"Follow up with {row['name']} on {label} ({row[requirement]})"
+        for requirement, label in COMPLIANCE_REQUIREMENTS.items()
+        for _, row in df[df[requirement] != "compliant"].iterrows()
     ]
+    compliance_action_items.append("Conduct a team-wide compliance awareness session")
     create_styled_bullet_list(compliance_action_items, "Compliance Action Items")
 
 
@@ -3,9 +3,20 @@ from datetime import datetime
 import pandas as pd
 import streamlit as st
 
+from ui.datasets import load_goal_store, load_payroll_ledger
 from ui.style import (create_multi_bar_chart, create_pie_chart,
-                      create_styled_bar_chart, create_styled_metric,
-                      create_styled_tabs)
+                      create_progress_bar, create_styled_bar_chart,
+                      create_styled_metric, create_styled_tabs)
+
+# The manager's id in the org payroll ledger and goal tree, and their team's
+# annual compensation budget per payroll category
+MANAGER_ID = "EMP000278"
+TEAM_COMPENSATION_BUDGET = {
+    "Base Salary": 900000,
+    "Overtime": 100000,
+    "Benefits": 200000,
+    "Bonuses": 100000,
+}
 
 
 def manager_overview_dashboard():
@@ -20,11 +31,14 @@ def manager_overview_dashboard():
         ]
     )
 
+    # Trailing twelve months of pay across the manager's reporting subtree
+    team_payroll = load_payroll_ledger().subtree(MANAGER_ID, last=12)
     compensation_data = pd.DataFrame(
-        [
-            {"name": "Salaries", "current": 850000, "budgeted": 900000},
-            {"name": "Bonuses", "current": 50000, "budgeted": 100000},
-        ]
+        {
+            "name": list(TEAM_COMPENSATION_BUDGET),
+            "current": team_payroll[list(TEAM_COMPENSATION_BUDGET)].round().to_numpy(),
+            "budgeted": list(TEAM_COMPENSATION_BUDGET.values()),
+        }
     )
 
     upcoming_learning_opportunities = pd.DataFrame(
@@ -87,6 +101,30 @@ def manager_overview_dashboard():
             st.plotly_chart(fig, use_container_width=True)
 
     with tab2:
+        # Rolled-up progress of the team objective and each member's
+        store = load_goal_store()
+        team_goal_id = store.objective_id(MANAGER_ID, "team")
+        team_goal = store.goal(team_goal_id)
+        st.subheader("Team Goals")
+        col_progress, col_completed = st.columns(2)
+        with col_progress:
+            create_styled_metric(
+                "Team Goal Progress", f"{team_goal['progress']:.0f}%", "🎯"
+            )
+        with col_completed:
+            create_styled_metric(
+                "Key Results Completed",
+                f"{team_goal['completed']}/{team_goal['key_results']}",
+                "✅",
+            )
+        members = store.children(team_goal_id)
+        for name, progress in zip(members["title"], members["progress"]):
+            create_progress_bar(
+                name,
+                round(progress),
+                "In Progress" if progress < 100 else "Completed",
+            )
+
         st.subheader("Employee Development")
         st.write("Upcoming Learning Opportunities")
         for _, opportunity in upcoming_learning_opportunities.iterrows():
@@ -3,10 +3,24 @@ from typing import Dict, List
 import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
-from ui.style import (apply_styled_dropdown_css, create_styled_bar_chart,
-                      create_styled_line_chart, create_styled_tabs)
+from analytics.employee_search import EmployeeSearchIndex
+from analytics.velocity import FORECAST_LEVEL, ROLLING_SPRINTS, SPRINT_DAYS
+from ui.datasets import load_velocity_history
+from ui.style import (apply_styled_dropdown_css, create_search_selectbox,
+                      create_styled_bar_chart, create_styled_tabs)
+
+# The manager's delivery team, the two-week sprints that fit in each
+# duration (2, 6 and 26) and sprints forecast ahead
+MANAGER_TEAM = "Team 042"
+DURATION_DAYS = {"Monthly": 30, "Quarterly": 91, "Yearly": 364}
+SPRINTS_CHARTED = {
+    duration: max(round(days / SPRINT_DAYS), 1)
+    for duration, days in DURATION_DAYS.items()
+}
+FORECAST_SPRINTS = 3
 
 
 # Dummy data generation functions
@@ -14,6 +28,22 @@ def get_dummy_employees() -> List[str]:
     return ["Alice", "Bob", "Charlie", "David", "Eve"]
 
 
+def get_dummy_employee_directory() -> pd.DataFrame:
+    employees = get_dummy_employees()
+    return pd.DataFrame(
+        {
+            "employee_id": [f"EMP{i:03d}" for i in range(1, len(employees) + 1)],
+            "name": employees,
+            "position": "Developer",
+        }
+    )
+
+
+@st.cache_resource
+def load_employee_search_index() -> EmployeeSearchIndex:
+    return EmployeeSearchIndex(get_dummy_employee_directory())
+
+
 def get_commits_per_developer(duration: str) -> Dict[str, int]:
     employees = get_dummy_employees()
     multiplier = 1 if duration == "Monthly" else (3 if duration == "Quarterly" else 12)
@@ -44,13 +74,91 @@ def get_average_resolution_time(duration: str) -> Dict[str, float]:
 
 
 def get_sprint_velocity(duration: str) -> pd.DataFrame:
-    sprints = (
-        range(1, 11)
-        if duration == "Monthly"
-        else (range(1, 5) if duration == "Quarterly" else range(1, 13))
+    # The team's recent sprints with their rolling mean, followed by the
+    # smoothing forecast and its prediction interval for the next sprints
+    history = load_velocity_history()
+    team = history.team_history(MANAGER_TEAM).tail(SPRINTS_CHARTED[duration])
+    forecast = history.forecast(FORECAST_SPRINTS)
+    forecast = forecast[forecast["team"] == MANAGER_TEAM]
+    return pd.concat(
+        [
+            team.rename(
+                columns={
+                    "sprint": "Sprint",
+                    "story_points": "Story Points",
+                    "rolling_mean": "Rolling Mean",
+                    "rolling_std": "Rolling Std",
+                }
+            ),
+            forecast[["sprint", "forecast", "lower", "upper"]].rename(
+                columns={
+                    "sprint": "Sprint",
+                    "forecast": "Forecast",
+                    "lower": "Lower",
+                    "upper": "Upper",
+                }
+            ),
+        ],
+        ignore_index=True,
+    )
+
+
+def build_sprint_velocity_chart(sprint_data: pd.DataFrame) -> go.Figure:
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scatter(
+            x=sprint_data["Sprint"],
+            y=sprint_data["Upper"],
+            mode="lines",
+            line_width=0,
+            showlegend=False,
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=sprint_data["Sprint"],
+            y=sprint_data["Lower"],
+            mode="lines",
+            line_width=0,
+            fill="tonexty",
+            fillcolor="rgba(99, 110, 250, 0.2)",
+            name=f"{FORECAST_LEVEL:.0%} interval",
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=sprint_data["Sprint"],
+            y=sprint_data["Story Points"],
+            mode="lines+markers",
+            name="Story Points",
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=sprint_data["Sprint"],
+            y=sprint_data["Rolling Mean"],
+            mode="lines",
+            line_dash="dot",
+            name=f"{ROLLING_SPRINTS}-sprint mean",
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=sprint_data["Sprint"],
+            y=sprint_data["Forecast"],
+            mode="lines+markers",
+            line_dash="dash",
+            name="Forecast",
+        )
     )
-    story_points = np.random.randint(20, 100, len(sprints))
-    return pd.DataFrame({"Sprint": sprints, "Story Points": story_points})
+    fig.update_layout(
+        xaxis_title="Sprint",
+        yaxis_title="Story Points",
+        height=300,
+        margin=dict(t=20, b=20),
+        legend=dict(orientation="h", y=-0.3),
+    )
+    return fig
 
 
 def get_bug_fix_rate(duration: str) -> Dict[str, float]:
@@ -87,8 +195,13 @@ def manager_performance_dashboard():
     with col1:
         duration = st.selectbox("Select Duration", ["Monthly", "Quarterly", "Yearly"])
     with col2:
-        employees = get_dummy_employees()
-        selected_employee = st.selectbox("Select Employee", ["All"] + employees)
+        employee = create_search_selectbox(
+            "Select Employee",
+            load_employee_search_index(),
+            key="performance_employee",
+            all_label="All",
+        )
+        selected_employee = "All" if employee is None else employee["name"]
 
     # Create tabs for different metric categories
     tabs = create_styled_tabs(["Code Metrics", "Sprint & Issues", "Page Metrics"])
@@ -130,11 +243,16 @@ def manager_performance_dashboard():
         with col1:
             # Sprint Velocity
             sprint_data = get_sprint_velocity(duration)
-            create_styled_line_chart(
-                sprint_data["Story Points"],
-                "Sprint",
-                "Story Points",
-                # f"Sprint Velocity (Story Points per Sprint) ({duration})"
+            st.plotly_chart(
+                build_sprint_velocity_chart(sprint_data), use_container_width=True
+            )
+            next_sprint = sprint_data.dropna(subset=["Forecast"]).iloc[0]
+            st.caption(
+                f"Sprint {next_sprint['Sprint']:.0f} forecast: "
+                f"{next_sprint['Forecast']:.0f} points "
+                f"({next_sprint['Lower']:.0f}-{next_sprint['Upper']:.0f} at "
+                f"{FORECAST_LEVEL:.0%}); last {ROLLING_SPRINTS} sprints vary by "
+                f"±{sprint_data['Rolling Std'].dropna().iloc[-1]:.0f}"
             )
 
         with col2:
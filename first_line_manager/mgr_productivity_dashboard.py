@@ -5,11 +5,18 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
-from ui.style import (apply_styled_dropdown_css, create_pie_chart,
-                      create_progress_bar, create_styled_bar_chart,
+from analytics.employee_search import EmployeeSearchIndex
+from analytics.employees import generate_employee_records
+from ui.datasets import load_shared_dataset
+from ui.style import (apply_styled_dropdown_css, create_export_download,
+                      create_pie_chart, create_progress_bar,
+                      create_search_selectbox, create_styled_bar_chart,
                       create_styled_bullet_list, create_styled_line_chart,
                       create_styled_metric, create_styled_tabs,
                       display_pie_chart)
+from ui.table import create_status_table
+
+NUM_DIRECTORY_EMPLOYEES = 50_000
 
 
 # Helper functions to generate dummy data for employee-level dashboard
@@ -28,6 +35,23 @@ def generate_employee_position(employee):
     return positions.get(employee, "Employee")
 
 
+# Org-wide directory searched by the employee selector; the team above is
+# kept at the front so its positions come from generate_employee_position
+def generate_employee_directory(num_employees):
+    directory = generate_employee_records(num_employees)
+    team = generate_employee_list()
+    directory.loc[: len(team) - 1, "name"] = team
+    directory.loc[: len(team) - 1, "position"] = [
+        generate_employee_position(employee) for employee in team
+    ]
+    return directory
+
+
+@st.cache_resource
+def load_employee_search_index():
+    return EmployeeSearchIndex(generate_employee_directory(NUM_DIRECTORY_EMPLOYEES))
+
+
 def generate_productivity_score():
     return round(random.uniform(1, 10), 1)
 
@@ -337,10 +361,13 @@ def employee_productivity_dashboard():
     # Dropdowns for employee and duration
     col1, col2 = st.columns(2)
     with col1:
-        employees = ["All Employees"] + generate_employee_list()
-        selected_employee = st.selectbox(
-            "Select Employee", employees, key="employee_select"
+        employee = create_search_selectbox(
+            "Select Employee",
+            load_employee_search_index(),
+            key="employee_select",
+            all_label="All Employees",
         )
+        selected_employee = "All Employees" if employee is None else employee["name"]
     with col2:
         duration = st.selectbox(
             "Select Duration", ["Quarterly", "Yearly"], key="duration_select"
@@ -364,7 +391,7 @@ def employee_productivity_dashboard():
             "learning_data": generate_learning_data(),
             "code_data": generate_code_data(),
         }
-        employee_position = generate_employee_position(selected_employee)
+        employee_position = employee["position"]
         productivity_score = data["productivity_score"]
         total_tasks, completed_tasks, _, _, _ = data["task_data"]
 
@@ -629,7 +656,7 @@ def manager_productivity_dashboard():
     st.header("Team Productivity Overview")
 
     # Dummy data
-    df = generate_team_dummy_data(num_teams=5, duration=365)
+    df = load_shared_dataset("team_productivity", generate_team_dummy_data, 5, 365)
 
     # Filters
     col1, col2 = st.columns(2)
@@ -663,7 +690,7 @@ def manager_productivity_dashboard():
 
     # Aggregate data
     agg_df = (
-        filtered_df.groupby("Team")
+        filtered_df.groupby("Team", observed=True)
         .agg(
             {
                 "Task Completion Rate": "mean",
@@ -712,18 +739,23 @@ def manager_productivity_dashboard():
             "Resolutions per Meeting",
         ]
     ]
-    st.dataframe(
-        meeting_df.set_index("Team").style.format(
-            {
-                "Meeting Effectiveness": "{:.2%}",
-                "Average Meeting Duration": "{:.0f} min",
-                "Percentage Time in Meetings": "{:.2%}",
-                "Action Items per Meeting": "{:.1f}",
-                "Resolutions per Meeting": "{:.1f}",
-            }
-        ),
+    create_status_table(
+        meeting_df.set_index("Team"),
+        formats={
+            "Meeting Effectiveness": "{:.2%}",
+            "Average Meeting Duration": "{:.0f} min",
+            "Percentage Time in Meetings": "{:.2%}",
+            "Action Items per Meeting": "{:.1f}",
+            "Resolutions per Meeting": "{:.1f}",
+        },
         height=220,
     )
+    meeting_columns = ["Team", "Date"] + meeting_df.columns[1:].tolist()
+    create_export_download(
+        {"Filtered": filtered_df[meeting_columns], "All": df[meeting_columns]},
+        "meeting_productivity",
+        key="meeting_export",
+    )
 
     st.subheader("Other Productivity Metrics Table")
     other_df = agg_df[
@@ -734,16 +766,21 @@ def manager_productivity_dashboard():
             "Knowledge Contributions",
         ]
     ]
-    st.dataframe(
-        other_df.set_index("Team").style.format(
-            {
-                "Task Completion Rate": "{:.2%}",
-                "Communication Efficiency Rate": "{:.2%}",
-                "Knowledge Contributions": "{:.0f}",
-            }
-        ),
+    create_status_table(
+        other_df.set_index("Team"),
+        formats={
+            "Task Completion Rate": "{:.2%}",
+            "Communication Efficiency Rate": "{:.2%}",
+            "Knowledge Contributions": "{:.0f}",
+        },
         height=220,
     )
+    other_columns = ["Team", "Date"] + other_df.columns[1:].tolist()
+    create_export_download(
+        {"Filtered": filtered_df[other_columns], "All": df[other_columns]},
+        "other_productivity_metrics",
+        key="other_metrics_export",
+    )
 
     # Attention Required section
     st.subheader("Attention Required")
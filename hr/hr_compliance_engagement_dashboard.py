@@ -3,32 +3,18 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+from analytics.compliance import COMPLIANCE_REQUIREMENTS, STATUSES
+from ui.datasets import load_compliance_index, load_survey_aggregates
 from ui.style import (apply_styled_dropdown_css, create_pie_chart,
                       create_styled_metric, create_styled_tabs,
                       display_pie_chart)
+from ui.table import create_status_table
 
-# Mock data (same as before)
+# Rows listed by the compliance explorer
+EXPLORER_ROWS = 500
+
+# Mock data (same as before); completion rates come from the compliance index
 dummy_compliance_data = {
-    "trainingCompletion": {
-        "overall": 85,
-        "departments": [
-            {"name": "HR", "completion": 95},
-            {"name": "IT", "completion": 88},
-            {"name": "Finance", "completion": 82},
-            {"name": "Marketing", "completion": 78},
-            {"name": "Operations", "completion": 80},
-        ],
-    },
-    "policyAcknowledgments": {
-        "overall": 92,
-        "departments": [
-            {"name": "HR", "acknowledgment": 98},
-            {"name": "IT", "acknowledgment": 95},
-            {"name": "Finance", "acknowledgment": 90},
-            {"name": "Marketing", "acknowledgment": 89},
-            {"name": "Operations", "acknowledgment": 88},
-        ],
-    },
     "complianceIncidents": [
         {
             "id": 1,
@@ -46,38 +32,16 @@ dummy_compliance_data = {
     ],
 }
 
-dummy_engagement_data = [
-    {
-        "subject": "Job Satisfaction",
-        "score": 4.2,
-        "description": "Overall contentment with job roles and responsibilities",
-    },
-    {
-        "subject": "Work-Life Balance",
-        "score": 3.9,
-        "description": "Ability to maintain a healthy balance between work and personal life",
-    },
-    {
-        "subject": "Career Growth",
-        "score": 3.6,
-        "description": "Opportunities for professional development and advancement",
-    },
-    {
-        "subject": "Company Culture",
-        "score": 4.1,
-        "description": "Alignment with organizational values and work environment",
-    },
-    {
-        "subject": "Leadership",
-        "score": 3.8,
-        "description": "Confidence in company leadership and management",
-    },
-    {
-        "subject": "Compensation",
-        "score": 3.5,
-        "description": "Satisfaction with salary and benefits package",
-    },
-]
+# What each engagement survey question covers
+engagement_descriptions = {
+    "Job Satisfaction": "Overall contentment with job roles and responsibilities",
+    "Work-Life Balance": "Ability to maintain a healthy balance between work and personal life",
+    "Team Collaboration": "How well colleagues work together and share knowledge",
+    "Career Growth": "Opportunities for professional development and advancement",
+    "Company Culture": "Alignment with organizational values and work environment",
+    "Leadership": "Confidence in company leadership and management",
+    "Compensation": "Satisfaction with salary and benefits package",
+}
 
 score_interpretation = [
     {
@@ -120,18 +84,22 @@ def hr_engagement_and_compliance_dashboard():
     tab1, tab2, tab3 = create_styled_tabs(["Compliance", "Engagement", "Incidents"])
 
     with tab1:
+        compliance_index = load_compliance_index()
+        department_rates = compliance_index.compliance_rates(by="department")
+        overall_rates = compliance_index.compliance_rates().iloc[0]
+
         st.subheader("Compliance Training Completion")
         col1, col2 = st.columns(2)
         with col1:
             create_styled_metric(
                 "Overall Completion",
-                f"{dummy_compliance_data['trainingCompletion']['overall']}%",
+                f"{overall_rates['mandatoryTraining']:.0f}%",
                 "📊",
             )
         with col2:
-            pie_data = dummy_compliance_data["trainingCompletion"]["departments"]
+            pie_data = department_rates["mandatoryTraining"].rename_axis("name")
             fig = create_pie_chart(
-                data=pie_data,
+                data=pie_data.reset_index(name="completion"),
                 names="name",
                 values="completion",
                 title="Department-wise Completion",
@@ -143,14 +111,15 @@ def hr_engagement_and_compliance_dashboard():
         with col1:
             create_styled_metric(
                 "Overall Acknowledgment",
-                f"{dummy_compliance_data['policyAcknowledgments']['overall']}%",
+                f"{overall_rates['policyAcknowledgment']:.0f}%",
                 "✅",
             )
         with col2:
-            acknowledgment_data = dummy_compliance_data["policyAcknowledgments"][
-                "departments"
-            ]
-            df = pd.DataFrame(acknowledgment_data)
+            df = (
+                department_rates["policyAcknowledgment"]
+                .rename_axis("name")
+                .reset_index(name="acknowledgment")
+            )
             fig = px.bar(
                 df,
                 x="name",
@@ -162,12 +131,17 @@ def hr_engagement_and_compliance_dashboard():
             )
             st.plotly_chart(fig, use_container_width=True)
 
+        display_compliance_explorer(compliance_index)
+
     with tab2:
+        aggregates = load_survey_aggregates()
+        engagement_scores = aggregates.scores(by_team=False)
+
         st.subheader("Engagement Survey Results")
         fig = go.Figure(
             data=go.Scatterpolar(
-                r=[item["score"] for item in dummy_engagement_data],
-                theta=[item["subject"] for item in dummy_engagement_data],
+                r=engagement_scores["mean"],
+                theta=engagement_scores["question"],
                 fill="toself",
                 line_color="#0074D9",
             )
@@ -188,14 +162,32 @@ def hr_engagement_and_compliance_dashboard():
             st.write(f"• {item}")
 
         st.subheader("Detailed Engagement Scores")
-        for item in dummy_engagement_data:
-            percentage = (item["score"] / 5) * 100  # Convert score to percentage
+        for _, item in engagement_scores.iterrows():
+            percentage = (item["mean"] / 5) * 100  # Convert score to percentage
+            change = (
+                ""
+                if pd.isna(item["delta"])
+                else f", {item['delta']:+.2f} since last quarter"
+            )
             st.write(
-                f"**{item['subject']}:** {item['score']} out of 5 ({percentage:.1f}%)"
+                f"**{item['question']}:** {item['mean']:.1f} out of 5 "
+                f"({percentage:.1f}%{change})"
             )
-            st.write(f"_{item['description']}_")
+            st.write(f"_{engagement_descriptions.get(item['question'], '')}_")
             st.write("---")
 
+        st.subheader("Engagement by Team")
+        team_scores = aggregates.scores().pivot(
+            index="team", columns="question", values="mean"
+        )
+        st.dataframe(
+            team_scores[aggregates.questions].round(2), use_container_width=True
+        )
+        st.caption(
+            f"Teams with fewer than {aggregates.min_respondents} respondents "
+            "are left blank to protect anonymity."
+        )
+
     with tab3:
         st.subheader("Compliance Incidents")
         for incident in dummy_compliance_data["complianceIncidents"]:
@@ -210,5 +202,36 @@ def hr_engagement_and_compliance_dashboard():
         )
 
 
+def display_compliance_explorer(compliance_index):
+    st.subheader("Find Employees by Compliance Status")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        requirement = st.selectbox(
+            "Requirement",
+            list(COMPLIANCE_REQUIREMENTS),
+            format_func=COMPLIANCE_REQUIREMENTS.get,
+        )
+    with col2:
+        statuses = st.multiselect("Status", STATUSES, default=["non-compliant"])
+    with col3:
+        department = st.selectbox(
+            "Department", ["All"] + compliance_index.values("department")
+        )
+
+    conditions = {requirement: statuses}
+    if department != "All":
+        conditions["department"] = department
+    matches = compliance_index.select(**conditions)
+    create_styled_metric("Matching Employees", f"{len(matches):,}", "🔎")
+    create_status_table(
+        compliance_index.records(matches, limit=EXPLORER_ROWS),
+        status_columns=list(COMPLIANCE_REQUIREMENTS),
+        use_container_width=True,
+        hide_index=True,
+    )
+    if len(matches) > EXPLORER_ROWS:
+        st.caption(f"Showing the first {EXPLORER_ROWS:,} of {len(matches):,}")
+
+
 if __name__ == "__main__":
     hr_engagement_and_compliance_dashboard()
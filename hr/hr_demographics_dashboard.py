@@ -1,53 +1,20 @@
 import pandas as pd
 import streamlit as st
 
+from analytics.demographics import distribution, diversity_index
+from ui.datasets import load_demographics
 from ui.style import (apply_styled_dropdown_css, create_multi_bar_chart,
                       create_pie_chart, create_styled_tabs, display_pie_chart)
 
-# Dummy data (unchanged)
-dummyData = {
-    "genderDistribution": [
-        {"name": "Male", "value": 55},
-        {"name": "Female", "value": 42},
-        {"name": "Non-binary", "value": 3},
-    ],
-    "ageDistribution": [
-        {"name": "18-25", "value": 15},
-        {"name": "26-35", "value": 30},
-        {"name": "36-45", "value": 25},
-        {"name": "46-55", "value": 20},
-        {"name": "56+", "value": 10},
-    ],
-    "ethnicityDistribution": [
-        {"name": "White", "value": 60},
-        {"name": "Asian", "value": 15},
-        {"name": "Black", "value": 12},
-        {"name": "Hispanic", "value": 10},
-        {"name": "Other", "value": 3},
-    ],
-    "tenureDistribution": [
-        {"name": "0-1 years", "value": 20},
-        {"name": "1-3 years", "value": 30},
-        {"name": "3-5 years", "value": 25},
-        {"name": "5-10 years", "value": 15},
-        {"name": "10+ years", "value": 10},
-    ],
-    "diversityHiring": [
-        {"year": "2020", "diverse": 25, "nonDiverse": 75},
-        {"year": "2021", "diverse": 30, "nonDiverse": 70},
-        {"year": "2022", "diverse": 35, "nonDiverse": 65},
-        {"year": "2023", "diverse": 40, "nonDiverse": 60},
-        {"year": "2024", "diverse": 45, "nonDiverse": 55},
-    ],
+# Days back from today each time period option covers; None is all time
+HIRED_WITHIN_DAYS = {
+    "Last 30 days": 30,
+    "Last 90 days": 90,
+    "Last 6 months": 180,
+    "Last year": 365,
+    "All time": None,
 }
 
-# Convert dummy data to DataFrames (unchanged)
-gender_df = pd.DataFrame(dummyData["genderDistribution"])
-age_df = pd.DataFrame(dummyData["ageDistribution"])
-ethnicity_df = pd.DataFrame(dummyData["ethnicityDistribution"])
-tenure_df = pd.DataFrame(dummyData["tenureDistribution"])
-diversity_hiring_df = pd.DataFrame(dummyData["diversityHiring"])
-
 
 def diversity_index_component(score):
     return f"""
@@ -68,8 +35,11 @@ def diversity_index_component(score):
 def hr_demographics_dashboard():
     st.title("Employee Demographics & Diversity Dashboard")
 
-    # Display the Diversity Index at the top
-    st.markdown(diversity_index_component(78), unsafe_allow_html=True)
+    demographics = load_demographics()
+
+    # The Diversity Index sits at the top; it is filled once the filters
+    # below are read
+    diversity_index_slot = st.empty()
 
     # Add some space
     st.markdown("<br>", unsafe_allow_html=True)
@@ -81,13 +51,31 @@ def hr_demographics_dashboard():
     col1, col2 = st.columns(2)
     with col1:
         filter_option = st.selectbox(
-            "Filter by:", ("All Employees", "By Department", "By Role", "By Location")
+            "Filter by:", ("All Departments", *demographics.departments)
         )
     with col2:
-        duration_option = st.selectbox(
-            "Time period:",
-            ("Last 30 days", "Last 90 days", "Last 6 months", "Last year", "All time"),
-        )
+        duration_option = st.selectbox("Time period:", tuple(HIRED_WITHIN_DAYS))
+
+    departments = None if filter_option == "All Departments" else [filter_option]
+    days = HIRED_WITHIN_DAYS[duration_option]
+    hired_since = None if days is None else demographics.as_of - pd.Timedelta(days=days)
+    counts = demographics.counts(departments, hired_since)
+    diversity = diversity_index(counts, by_department=False)
+
+    # Display the Diversity Index at the top
+    score = diversity["score"].iloc[0]
+    diversity_index_slot.markdown(
+        diversity_index_component("n/a" if pd.isna(score) else f"{score:.0f}"),
+        unsafe_allow_html=True,
+    )
+    if days is not None:
+        st.caption(f"Showing employees hired in the {duration_option.lower()}")
+
+    gender_df = distribution(counts, "gender")
+    age_df = distribution(counts, "age_band")
+    ethnicity_df = distribution(counts, "ethnicity")
+    tenure_df = distribution(counts, "tenure_band")
+    diversity_hiring_df = demographics.hiring_by_year(departments=departments)
 
     # Create tabs for different sections
     tabs = create_styled_tabs(["Demographics", "Diversity Metrics"])
@@ -126,6 +114,21 @@ def hr_demographics_dashboard():
         )
         st.plotly_chart(fig_diversity, use_container_width=True)
 
+        st.subheader("Diversity Index by Department")
+        by_department = diversity_index(counts)
+        st.dataframe(
+            by_department.round(1).rename(
+                columns=lambda column: column.replace("_", " ").title()
+            ),
+            use_container_width=True,
+        )
+        st.caption(
+            "Shannon and Simpson indexes scaled to 0-100, where 100 is an even "
+            "split across every group; the score averages the gender and "
+            "ethnicity Simpson indexes. Age and tenure depend on when people "
+            "were hired, so they are shown but not scored."
+        )
+
 
 if __name__ == "__main__":
     hr_demographics_dashboard()
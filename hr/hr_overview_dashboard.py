@@ -3,9 +3,12 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
-from ui.style import (apply_styled_dropdown_css, create_multi_bar_chart,
-                      create_pie_chart, create_styled_metric,
-                      create_styled_tabs, display_pie_chart)
+from analytics.workforce import simulate_workforce
+from ui.datasets import load_payroll_ledger
+from ui.style import (apply_styled_dropdown_css, create_export_download,
+                      create_multi_bar_chart, create_pie_chart,
+                      create_styled_metric, create_styled_tabs,
+                      display_pie_chart)
 
 # Full year of dummy data (same as before)
 full_year_data = [
@@ -107,32 +110,43 @@ full_year_data = [
     },
 ]
 
-payroll_data = [
-    {
-        "category": "Base Salary",
-        "value": 70,
-        "description": "Regular wages paid to employees",
-    },
-    {
-        "category": "Overtime",
-        "value": 10,
-        "description": "Additional pay for hours worked beyond regular schedule",
-    },
-    {
-        "category": "Benefits",
-        "value": 15,
-        "description": "Health insurance, retirement plans, and other perks",
-    },
-    {
-        "category": "Bonuses",
-        "value": 5,
-        "description": "Performance-based additional compensation",
-    },
-]
+# What each payroll category covers
+PAY_CATEGORY_DESCRIPTIONS = {
+    "Base Salary": "Regular wages paid to employees",
+    "Overtime": "Additional pay for hours worked beyond regular schedule",
+    "Benefits": "Health insurance, retirement plans, and other perks",
+    "Bonuses": "Performance-based additional compensation",
+}
 
 # Convert to DataFrame
 df = pd.DataFrame(full_year_data)
-payroll_df = pd.DataFrame(payroll_data)
+
+# Current headcount per department, which sums to the latest actual staffing
+DEPARTMENT_HEADCOUNT = {
+    "Engineering": 35,
+    "Sales": 20,
+    "Marketing": 15,
+    "HR": 10,
+    "Finance": 10,
+    "Customer Support": 10,
+}
+
+
+@st.cache_resource(max_entries=32)
+def project_staffing(months, turnover_change, hiring_change):
+    # Scenario rates scale the trailing-year average turnover, and hiring
+    # starts at the rate that replaces the average leavers
+    turnover = df[["voluntary", "involuntary"]].mean()
+    plan = pd.DataFrame(
+        {
+            "department": list(DEPARTMENT_HEADCOUNT),
+            "headcount": list(DEPARTMENT_HEADCOUNT.values()),
+        }
+    )
+    plan["voluntary_rate"] = turnover["voluntary"] * (1 + turnover_change / 100)
+    plan["involuntary_rate"] = turnover["involuntary"] * (1 + turnover_change / 100)
+    plan["hires"] = plan["headcount"] * turnover.sum() / 100 * (1 + hiring_change / 100)
+    return simulate_workforce(plan, months=months)
 
 
 def hr_overview_dashboard():
@@ -222,8 +236,23 @@ def hr_overview_dashboard():
         """
         )
 
+        display_staffing_projection()
+
     with tab3:
         st.subheader("Payroll Distribution")
+        ledger = load_payroll_ledger()
+        periods = {"Last Month": 1, "Last 3 Months": 3, "Last 6 Months": 6}.get(
+            time_period, 12
+        )
+        totals = ledger.by_category(last=periods)
+        payroll_df = pd.DataFrame(
+            {
+                "category": totals.index,
+                "amount": totals.round(2).to_numpy(),
+                "value": (100 * totals / totals.sum()).round(1).to_numpy(),
+                "description": totals.index.map(PAY_CATEGORY_DESCRIPTIONS),
+            }
+        )
         fig = create_pie_chart(
             data=payroll_df,
             names="category",
@@ -234,9 +263,27 @@ def hr_overview_dashboard():
 
         st.subheader("Payroll Distribution Details")
         for _, row in payroll_df.iterrows():
-            create_styled_metric(row["category"], f"{row['value']}%", "💰")
+            create_styled_metric(
+                row["category"], f"{row['value']}% (${row['amount'] / 1e6:,.1f}M)", "💰"
+            )
             st.write(row["description"])
 
+        st.subheader("Payroll by Department")
+        by_department = ledger.by_department(last=periods).reset_index()
+        fig = create_multi_bar_chart(
+            by_department,
+            x="department",
+            y=ledger.categories,
+            labels={category: category for category in ledger.categories},
+            title="Payroll by Department",
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        create_export_download(
+            {"By Category": payroll_df, "By Department": by_department},
+            "payroll_distribution",
+            key="payroll_export",
+        )
+
         st.write(
             """
         The payroll distribution chart shows how the company's total payroll is allocated across different categories. 
@@ -276,5 +323,113 @@ def hr_overview_dashboard():
         )
 
 
+def display_staffing_projection():
+    st.subheader("Projected Staffing")
+    columns = st.columns(4)
+    with columns[0]:
+        months = st.slider("Months ahead", 12, 24, 18, key="projection_months")
+    with columns[1]:
+        turnover_change = st.slider(
+            "Turnover change (%)", -50, 50, 0, step=5, key="projection_turnover"
+        )
+    with columns[2]:
+        hiring_change = st.slider(
+            "Hiring change (%)", -50, 50, 0, step=5, key="projection_hiring"
+        )
+    with columns[3]:
+        department = st.selectbox(
+            "Department",
+            ["All Departments", *DEPARTMENT_HEADCOUNT],
+            key="projection_department",
+        )
+
+    projection = project_staffing(months, turnover_change, hiring_change)
+    departments = None if department == "All Departments" else [department]
+    required = (
+        df["required"].iloc[-1]
+        if departments is None
+        else DEPARTMENT_HEADCOUNT[department]
+    )
+    bands = projection.bands(departments=departments)
+    shortfall = projection.shortfall_probability(required, departments)
+    horizon = pd.date_range(
+        pd.Timestamp.now().normalize(), periods=months + 1, freq="MS"
+    )
+    months_axis = horizon.strftime("%b %Y")
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Scatter(
+            x=months_axis, y=bands["p95"], mode="lines", line_width=0, showlegend=False
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=months_axis,
+            y=bands["p5"],
+            mode="lines",
+            line_width=0,
+            fill="tonexty",
+            fillcolor="rgba(99, 110, 250, 0.15)",
+            name="90% band",
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=months_axis, y=bands["p75"], mode="lines", line_width=0, showlegend=False
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=months_axis,
+            y=bands["p25"],
+            mode="lines",
+            line_width=0,
+            fill="tonexty",
+            fillcolor="rgba(99, 110, 250, 0.3)",
+            name="50% band",
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=months_axis, y=bands["p50"], mode="lines+markers", name="Median Staffing"
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=months_axis,
+            y=[required] * len(months_axis),
+            mode="lines",
+            line_dash="dash",
+            name="Required Staffing",
+        )
+    )
+    fig.update_layout(xaxis_title="Month", yaxis_title="Staffing Level")
+    st.plotly_chart(fig, use_container_width=True)
+
+    columns = st.columns(3)
+    with columns[0]:
+        create_styled_metric(
+            f"Median in {months} months", f"{bands['p50'].iloc[-1]:.0f}", "👥"
+        )
+    with columns[1]:
+        create_styled_metric(
+            "90% range",
+            f"{bands['p5'].iloc[-1]:.0f} - {bands['p95'].iloc[-1]:.0f}",
+            "📊",
+        )
+    with columns[2]:
+        create_styled_metric("Chance of shortfall", f"{shortfall.iloc[-1]:.0%}", "⚠️")
+
+    st.write(
+        f"""
+    The projection simulates {projection.headcount.shape[1]:,} possible paths of monthly
+    leavers and hires per department from the trailing-year turnover rates.
+    - The shaded bands hold the middle 50% and 90% of the simulated paths.
+    - The chance of shortfall is the share of paths below required staffing at the end of the horizon.
+    """
+    )
+
+
 if __name__ == "__main__":
     hr_overview_dashboard()
@@ -3,6 +3,11 @@ import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
+from analytics.employees import generate_employee_records
+from analytics.partitions import PARTITION_COLUMN, PartitionedFrame
+from analytics.skills_index import (CORE_SKILLS, MAX_SKILL_LEVEL, SkillsIndex,
+                                    generate_skill_catalog,
+                                    generate_skill_records)
 from ui.style import (apply_styled_dropdown_css, create_styled_metric,
                       create_styled_tabs)
 
@@ -35,15 +40,44 @@ def create_dummy_data():
 
 training_completion_data = create_dummy_data()
 
-skills_inventory_data = pd.DataFrame(
-    [
-        {"skill": "Project Management", "availability": 75},
-        {"skill": "Data Analysis", "availability": 60},
-        {"skill": "Leadership", "availability": 55},
-        {"skill": "Communication", "availability": 80},
-        {"skill": "Technical Writing", "availability": 45},
-    ]
-)
+NUM_EMPLOYEES = 50_000
+NUM_SKILLS = 2_000
+
+# Target availability (% of employees) for the core skills
+skill_targets = {
+    "Project Management": 80,
+    "Data Analysis": 70,
+    "Leadership": 65,
+    "Communication": 85,
+    "Technical Writing": 60,
+}
+
+
+@st.cache_resource
+def load_employees():
+    return generate_employee_records(
+        NUM_EMPLOYEES, ["Sales", "Marketing", "Engineering", "HR", "Finance"]
+    )
+
+
+@st.cache_resource
+def load_learning_hours():
+    # Per-employee learning hours, sharded by department
+    employees = load_employees()
+    rng = np.random.default_rng(1)
+    learning = employees[["employee_id", PARTITION_COLUMN]].assign(
+        learning_hours=rng.gamma(4.0, 24.5 / 4, len(employees)).round(1)
+    )
+    return PartitionedFrame.from_frame(learning)
+
+
+@st.cache_resource
+def load_skills_index():
+    employees = load_employees()
+    skills = generate_skill_catalog(NUM_SKILLS)
+    return SkillsIndex.from_frame(
+        employees, generate_skill_records(employees, skills), skills
+    )
 
 
 def create_plotly_bar_chart(data, x_column, y_column, x_label, y_label):
@@ -91,6 +125,18 @@ def hr_training_dashboard():
     # Calculate average completion rate for the filtered data
     avg_completion_rate = filtered_data["completionRate"].mean()
 
+    # Learning hours are aggregated per department shard, so a single
+    # department only touches its own rows
+    learning = load_learning_hours().aggregate(
+        PARTITION_COLUMN,
+        {
+            "hours": ("learning_hours", "sum"),
+            "employees": ("learning_hours", "count"),
+        },
+        partitions=None if filter_option == "All Departments" else [filter_option],
+    )
+    avg_learning_hours = learning["hours"].sum() / max(learning["employees"].sum(), 1)
+
     # Create tabs
     tabs = create_styled_tabs(["Overview", "Training Completion", "Skills Inventory"])
 
@@ -99,7 +145,9 @@ def hr_training_dashboard():
 
         with col1:
             create_styled_metric(
-                "Average Learning Hours per Employee", "24.5 hours", "📚"
+                "Average Learning Hours per Employee",
+                f"{avg_learning_hours:.1f} hours",
+                "📚",
             )
 
         with col2:
@@ -139,6 +187,17 @@ def hr_training_dashboard():
     with tabs[2]:
         st.header("Skills Inventory")
 
+        skills_index = load_skills_index()
+        department = None if filter_option == "All Departments" else filter_option
+        min_level = st.selectbox(
+            "Minimum proficiency level:", range(1, MAX_SKILL_LEVEL + 1)
+        )
+
+        availability = skills_index.availability(min_level, department)
+        skills_inventory_data = pd.DataFrame(
+            {"skill": CORE_SKILLS, "availability": availability[CORE_SKILLS].round()}
+        )
+
         # Color coding based on availability
         def get_skill_color(availability):
             if availability >= 75:
@@ -161,7 +220,26 @@ def hr_training_dashboard():
                     unsafe_allow_html=True,
                 )
             with col3:
-                st.write(f"{skill['availability']}%")
+                st.write(f"{skill['availability']:.0f}%")
+
+        st.subheader("Skill Gaps")
+        gaps = skills_index.gap_analysis(skill_targets, min_level, department)
+        if gaps.empty:
+            st.success("All core skills meet their availability targets.")
+        else:
+            st.dataframe(gaps.round(1), use_container_width=True, hide_index=True)
+
+        st.subheader("Find Employees by Skill")
+        selected_skill = st.selectbox("Skill:", skills_index.skills)
+        matches = skills_index.employees_with_skill(
+            selected_skill, min_level, department
+        )
+        create_styled_metric("Matching Employees", f"{len(matches):,}", "🧑‍💼")
+        st.dataframe(
+            pd.DataFrame({"employee_id": matches[:100]}),
+            use_container_width=True,
+            hide_index=True,
+        )
 
 
 if __name__ == "__main__":
@@ -4,25 +4,28 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
+from ui.datasets import load_goal_store
 from ui.style import (create_pie_chart, create_progress_bar,
                       create_styled_bullet_list, create_styled_metric,
                       create_styled_tabs, display_pie_chart)
 
+# The employee's id in the org goal tree
+EMPLOYEE_ID = "EMP002705"
+
 
 def get_overall_performance():
     return np.random.randint(1, 11)
 
 
 def generate_goals():
-    goals = [
-        "Improve coding skills",
-        "Enhance communication",
-        "Complete project X",
-        "Learn new technology Y",
-        "Mentor junior team members",
-    ]
+    # The employee's key results with their current progress
+    store = load_goal_store()
+    key_results = store.children(store.objective_id(EMPLOYEE_ID, "employee"))
     return pd.DataFrame(
-        {"Goal": goals, "Progress": np.random.randint(0, 101, len(goals))}
+        {
+            "Goal": key_results["title"],
+            "Progress": key_results["progress"].round().astype(int),
+        }
     )
 
 
@@ -66,23 +69,27 @@ def ic_perf_and_career_dashboard():
     tabs = create_styled_tabs(tab_labels)
 
     with tabs[0]:
+        store = load_goal_store()
+        goals = store.goal(store.objective_id(EMPLOYEE_ID, "employee"))
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            create_styled_metric("Annual Goals Set", "5", "🎯")
+            create_styled_metric("Annual Goals Set", f"{goals['key_results']}", "🎯")
         with col2:
-            create_styled_metric("Goals Achieved", "2", "✅")
+            create_styled_metric("Goals Achieved", f"{goals['completed']}", "✅")
         with col3:
-            create_styled_metric("Goals in Progress", "3", "🚀")
+            create_styled_metric(
+                "Goals in Progress",
+                f"{goals['key_results'] - goals['completed']}",
+                "🚀",
+            )
         with col4:
-            create_styled_metric("Completion Rate", "40%", "📊")
+            create_styled_metric("Completion Rate", f"{goals['progress']:.0f}%", "📊")
 
         goals_df = generate_goals()
         st.subheader("Goal Progress")
-        for _, row in goals_df.iterrows():
+        for goal, progress in zip(goals_df["Goal"], goals_df["Progress"]):
             create_progress_bar(
-                row["Goal"],
-                row["Progress"],
-                "In Progress" if row["Progress"] < 100 else "Completed",
+                goal, progress, "In Progress" if progress < 100 else "Completed"
             )
 
     with tabs[1]:
@@ -7,7 +7,7 @@ import streamlit as st
 from ui.style import (create_pie_chart, create_styled_bar_chart,
                       create_styled_bullet_list, create_styled_line_chart,
                       create_styled_metric, create_styled_radio_buttons,
-                      create_styled_tabs, display_pie_chart)
+                      display_pie_chart, render_tab_sections)
 
 
 def set_custom_css():
@@ -203,221 +203,218 @@ def ic_productivity_dashboard():
         "Select Duration", ["Quarterly", "Yearly"], "duration_selection"
     )
 
-    # Tabs
-    tab_labels = ["Tasks", "Communication", "Knowledge", "Meetings", "Learning", "Code"]
-    tabs = create_styled_tabs(tab_labels)
-
-    # Tab 1: Tasks
-    with tabs[0]:
-        total_tasks, completed, in_progress, on_track, overdue = generate_task_data()
-
-        col1, col2, col3, col4, col5 = st.columns(5)
-        with col1:
-            create_styled_metric("Total Tasks", total_tasks, "📋")
-        with col2:
-            create_styled_metric("Completed", completed, "✅")
-        with col3:
-            create_styled_metric("In Progress", in_progress, "🔄")
-        with col4:
-            create_styled_metric("On Track", on_track, "🎯")
-        with col5:
-            create_styled_metric("Overdue", overdue, "⏰")
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.header("Task Distribution")
-            task_data = pd.DataFrame(
-                {
-                    "Status": ["Completed", "On Track", "Overdue"],
-                    "Value": [completed, on_track, overdue],
-                }
-            )
-            fig = create_pie_chart(
-                task_data,
-                names="Status",
-                values="Value",
-                title="Task Distribution",
-                height=360,
-                width=360,
-            )
-            display_pie_chart(fig)
-
-        with col2:
-            st.header("Weekly Task Completion Rate")
-            weekly_completion = generate_weekly_task_completion()
-            create_styled_line_chart(weekly_completion, "Weeks", "Tasks Completed")
-
-    # Tab 2: Communication Efficiency
-    with tabs[1]:
-        comm_data = generate_communication_data()
-
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            create_styled_metric(
-                "Avg Email Response Time",
-                f"{comm_data['avg_email_response_time']} hours",
-                "📧",
-            )
-        with col2:
-            create_styled_metric(
-                "Meetings Attended", comm_data["meetings_attended"], "🗓️"
-            )
-        with col3:
-            create_styled_metric(
-                "Feedback Implemented", comm_data["feedback_implemented"], "💡"
-            )
-        with col4:
-            create_styled_metric(
-                "Time in Meetings", f"{comm_data['time_in_meetings']}%", "⏱️"
-            )
+    # Tabs; only the open tab runs
+    render_tab_sections(
+        {
+            "Tasks": (tasks_tab,),
+            "Communication": (communication_tab,),
+            "Knowledge": (knowledge_tab,),
+            "Meetings": (meetings_tab,),
+            "Learning": (learning_tab,),
+            "Code": (code_tab,),
+        },
+        key="ic_productivity_tab",
+    )
 
-        st.header("Email Response Time Trend")
-        email_trend = generate_email_response_trend()
-        create_styled_line_chart(email_trend, "Weeks", "Response Time (hours)")
 
-    # Tab 3: Knowledge
-    with tabs[2]:
-        knowledge_data = generate_knowledge_data()
+def tasks_tab():
+    total_tasks, completed, in_progress, on_track, overdue = generate_task_data()
 
-        col1, col2, col3, col4, col5 = st.columns(5)
-        with col1:
-            create_styled_metric(
-                "Articles Written", knowledge_data["articles_written"], "📝"
-            )
-        with col2:
-            create_styled_metric(
-                "Articles Contributed", knowledge_data["articles_contributed"], "💬"
-            )
-        with col3:
-            create_styled_metric(
-                "Training Sessions", knowledge_data["training_sessions"], "👨‍🏫"
-            )
-        with col4:
-            create_styled_metric(
-                "Mentoring Hours", knowledge_data["mentoring_hours"], "🤝"
-            )
-        with col5:
-            create_styled_metric(
-                "Documentation Edits",
-                knowledge_data["documentation_contributions"],
-                "📚",
-            )
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        create_styled_metric("Total Tasks", total_tasks, "📋")
+    with col2:
+        create_styled_metric("Completed", completed, "✅")
+    with col3:
+        create_styled_metric("In Progress", in_progress, "🔄")
+    with col4:
+        create_styled_metric("On Track", on_track, "🎯")
+    with col5:
+        create_styled_metric("Overdue", overdue, "⏰")
 
-        create_styled_bullet_list(
-            [
-                f"{contrib} - {date.strftime('%Y-%m-%d')}"
-                for contrib, date in generate_recent_contributions()
-            ],
-            title="Recent Contributions",
+    col1, col2 = st.columns(2)
+    with col1:
+        st.header("Task Distribution")
+        task_data = pd.DataFrame(
+            {
+                "Status": ["Completed", "On Track", "Overdue"],
+                "Value": [completed, on_track, overdue],
+            }
+        )
+        fig = create_pie_chart(
+            task_data,
+            names="Status",
+            values="Value",
+            title="Task Distribution",
+            height=360,
+            width=360,
         )
+        display_pie_chart(fig)
+
+    with col2:
+        st.header("Weekly Task Completion Rate")
+        weekly_completion = generate_weekly_task_completion()
+        create_styled_line_chart(weekly_completion, "Weeks", "Tasks Completed")
 
-    # Tab 4: Meetings
-    with tabs[3]:
-        meeting_data = generate_meeting_data()
-
-        col1, col2, col3, col4, col5 = st.columns(5)
-        with col1:
-            create_styled_metric("Organized", meeting_data["organized"], "📅")
-        with col2:
-            create_styled_metric("Attended", meeting_data["attended"], "👥")
-        with col3:
-            create_styled_metric(
-                "Avg Duration", f"{meeting_data['avg_duration']} hours", "⏳"
-            )
-        with col4:
-            create_styled_metric(
-                "Effectiveness", f"{meeting_data['effectiveness']}/10", "📊"
-            )
-        with col5:
-            create_styled_metric(
-                "Weekly Time", f"{meeting_data['weekly_time_percentage']}%", "🕰️"
-            )
 
-        st.header("Role in Meetings (RACI)")
-        raci_data = generate_raci_data()
-        create_styled_bar_chart(
-            list(raci_data.keys()), list(raci_data.values()), "Roles", "Count"
+def communication_tab():
+    comm_data = generate_communication_data()
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        create_styled_metric(
+            "Avg Email Response Time",
+            f"{comm_data['avg_email_response_time']} hours",
+            "📧",
+        )
+    with col2:
+        create_styled_metric("Meetings Attended", comm_data["meetings_attended"], "🗓️")
+    with col3:
+        create_styled_metric(
+            "Feedback Implemented", comm_data["feedback_implemented"], "💡"
+        )
+    with col4:
+        create_styled_metric(
+            "Time in Meetings", f"{comm_data['time_in_meetings']}%", "⏱️"
         )
 
-    # Tab 5: Learning
-    with tabs[4]:
-        learning_data = generate_learning_data()
+    st.header("Email Response Time Trend")
+    email_trend = generate_email_response_trend()
+    create_styled_line_chart(email_trend, "Weeks", "Response Time (hours)")
+
+
+def knowledge_tab():
+    knowledge_data = generate_knowledge_data()
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        create_styled_metric(
+            "Articles Written", knowledge_data["articles_written"], "📝"
+        )
+    with col2:
+        create_styled_metric(
+            "Articles Contributed", knowledge_data["articles_contributed"], "💬"
+        )
+    with col3:
+        create_styled_metric(
+            "Training Sessions", knowledge_data["training_sessions"], "👨‍🏫"
+        )
+    with col4:
+        create_styled_metric("Mentoring Hours", knowledge_data["mentoring_hours"], "🤝")
+    with col5:
+        create_styled_metric(
+            "Documentation Edits",
+            knowledge_data["documentation_contributions"],
+            "📚",
+        )
+
+    create_styled_bullet_list(
+        [
+            f"{contrib} - {date.strftime('%Y-%m-%d')}"
+            for contrib, date in generate_recent_contributions()
+        ],
+        title="Recent Contributions",
+    )
 
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            create_styled_metric(
-                "Learning Hours", learning_data["learning_hours"], "📚"
-            )
-        with col2:
-            create_styled_metric(
-                "Conferences Attended", learning_data["conferences_attended"], "🎤"
-            )
-        with col3:
-            create_styled_metric(
-                "Skill Improvement", f"{learning_data['skill_improvement']}/10", "📈"
-            )
 
-        create_styled_bullet_list(
-            learning_data["courses_completed"], title="Courses Completed"
+def meetings_tab():
+    meeting_data = generate_meeting_data()
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        create_styled_metric("Organized", meeting_data["organized"], "📅")
+    with col2:
+        create_styled_metric("Attended", meeting_data["attended"], "👥")
+    with col3:
+        create_styled_metric(
+            "Avg Duration", f"{meeting_data['avg_duration']} hours", "⏳"
+        )
+    with col4:
+        create_styled_metric(
+            "Effectiveness", f"{meeting_data['effectiveness']}/10", "📊"
         )
-        create_styled_bullet_list(
-            learning_data["certifications"], title="Certifications Achieved"
+    with col5:
+        create_styled_metric(
+            "Weekly Time", f"{meeting_data['weekly_time_percentage']}%", "🕰️"
         )
 
-    # Tab 6: Code
-    with tabs[5]:
-        code_data = generate_code_data()
+    st.header("Role in Meetings (RACI)")
+    raci_data = generate_raci_data()
+    create_styled_bar_chart(
+        list(raci_data.keys()), list(raci_data.values()), "Roles", "Count"
+    )
 
-        col1, col2, col3, col4, col5, col6 = st.columns(6)
-        with col1:
-            create_styled_metric(
-                "Code Quality", f"{code_data['quality_score']}/10", "🏆"
-            )
-        with col2:
-            create_styled_metric("Code Reviews", code_data["peer_reviews"], "👁️")
-        with col3:
-            create_styled_metric(
-                "Refactoring Tasks", code_data["refactoring_tasks"], "🔧"
-            )
-        with col4:
-            create_styled_metric(
-                "Features Developed", code_data["features_developed"], "🚀"
-            )
-        with col5:
-            create_styled_metric("Git Commits", code_data["git_commits"], "🔢")
-        with col6:
-            create_styled_metric(
-                "Bug Fix Rate", f"{code_data['bug_fix_rate']}/week", "🐛"
-            )
 
-        col1, col2 = st.columns(2)
-        with col1:
-            st.header("Bugs Fixed by Criticality")
-            bugs_data = pd.DataFrame(
-                {
-                    "Criticality": code_data["bugs_fixed"].keys(),
-                    "Count": code_data["bugs_fixed"].values(),
-                }
-            )
-            fig = create_pie_chart(
-                bugs_data,
-                names="Criticality",
-                values="Count",
-                title="Bugs Fixed by Criticality",
-                height=360,
-                width=360,
+def learning_tab():
+    learning_data = generate_learning_data()
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        create_styled_metric("Learning Hours", learning_data["learning_hours"], "📚")
+    with col2:
+        create_styled_metric(
+            "Conferences Attended", learning_data["conferences_attended"], "🎤"
+        )
+    with col3:
+        create_styled_metric(
+            "Skill Improvement", f"{learning_data['skill_improvement']}/10", "📈"
+        )
+
+    create_styled_bullet_list(
+        learning_data["courses_completed"], title="Courses Completed"
+    )
+    create_styled_bullet_list(
+        learning_data["certifications"], title="Certifications Achieved"
+    )
+
+
+def code_tab():
+    code_data = generate_code_data()
+
+    col1, col2, col3, col4, col5, col6 = st.columns(6)
+    with col1:
+        create_styled_metric("Code Quality", f"{code_data['quality_score']}/10", "🏆")
+    with col2:
+        create_styled_metric("Code Reviews", code_data["peer_reviews"], "👁️")
+    with col3:
+        create_styled_metric("Refactoring Tasks", code_data["refactoring_tasks"], "🔧")
+    with col4:
+        create_styled_metric(
+            "Features Developed", code_data["features_developed"], "🚀"
+        )
+    with col5:
+        create_styled_metric("Git Commits", code_data["git_commits"], "🔢")
+    with col6:
+        create_styled_metric("Bug Fix Rate", f"{code_data['bug_fix_rate']}/week", "🐛")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.header("Bugs Fixed by Criticality")
+        bugs_data = pd.DataFrame(
+            {
+                "Criticality": code_data["bugs_fixed"].keys(),
+                "Count": code_data["bugs_fixed"].values(),
+            }
+        )
+        fig = create_pie_chart(
+            bugs_data,
+            names="Criticality",
+            values="Count",
+            title="Bugs Fixed by Criticality",
+            height=360,
+            width=360,
+        )
+        display_pie_chart(fig)
+
+    with col2:
+        st.header("Code Quality Trend")
+        code_quality_trend = [
+            random.uniform(
+                code_data["quality_score"] - 1, code_data["quality_score"] + 1
             )
-            display_pie_chart(fig)
-
-        with col2:
-            st.header("Code Quality Trend")
-            code_quality_trend = [
-                random.uniform(
-                    code_data["quality_score"] - 1, code_data["quality_score"] + 1
-                )
-                for _ in range(12)
-            ]
-            create_styled_line_chart(code_quality_trend, "Weeks", "Code Quality Score")
+            for _ in range(12)
+        ]
+        create_styled_line_chart(code_quality_trend, "Weeks", "Code Quality Score")
 
 
 if __name__ == "__main__":
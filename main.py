@@ -65,6 +65,7 @@ def main():
             PERSONA_OPTIONS,
             index=DEFAULT_PERSONA_INDEX,
         )
+        st.session_state["persona"] = persona
 
         # Add navigation options based on selected persona
         if persona in PERSONA_NAVIGATION:
@@ -0,0 +1,250 @@
+import argparse
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from matplotlib import pyplot as plt
+from plotly.offline import get_plotlyjs
+
+from analytics.employees import generate_employee_records
+from ui.style import (build_styled_bar_chart, build_styled_line_chart,
+                      create_multi_bar_chart, create_pie_chart)
+
+NUM_EMPLOYEES = 50_000
+NUM_WEEKS = 12
+DEFAULT_OUTPUT_DIR = "report_bundles"
+
+# Every bundle loads Plotly from its own directory, so bundles open offline
+# and stay readable when archived on their own. The script is written once
+# per run and hard-linked into each bundle (copied where links fail)
+PLOTLY_JS = "plotly.min.js"
+
+# Worker-process state, loaded once per worker by _init_worker
+_employees = None
+_metrics = None
+_weekly_completion = None
+_reports = None
+_plotly_js = None
+
+
+def generate_employee_metrics(employees, seed=0):
+    rng = np.random.default_rng(seed)
+    num_employees = len(employees)
+    total_tasks = rng.integers(50, 101, num_employees)
+    completed = rng.integers(20, total_tasks - 9)
+    overdue = rng.integers(0, total_tasks - completed + 1)
+
+    metrics = pd.DataFrame(
+        {
+            "employee_id": employees["employee_id"].to_numpy(),
+            "productivity_score": rng.uniform(1, 10, num_employees).round(1),
+            "completed": completed,
+            "on_track": total_tasks - completed - overdue,
+            "overdue": overdue,
+        }
+    )
+    weekly_completion = rng.integers(5, 21, (num_employees, NUM_WEEKS))
+    return metrics, weekly_completion
+
+
+def _init_worker(employees, metrics, weekly_completion, plotly_js):
+    global _employees, _metrics, _weekly_completion, _reports, _plotly_js
+    plt.switch_backend("Agg")
+    _plotly_js = plotly_js
+    _employees = employees
+    _metrics = metrics
+    _weekly_completion = weekly_completion
+    _reports = employees.groupby("manager_id", observed=True).indices
+
+
+def _save_png(fig, path):
+    fig.savefig(path, dpi=100)
+    plt.close(fig)
+    return f'<img src="{path.name}" alt="{path.stem}">'
+
+
+def _plotly_html(fig):
+    return fig.to_html(full_html=False, include_plotlyjs=False)
+
+
+def _add_plotly_js(bundle_dir):
+    target = bundle_dir / PLOTLY_JS
+    if target.exists():
+        return
+    try:
+        os.link(_plotly_js, target)
+    except OSError:
+        shutil.copyfile(_plotly_js, target)
+
+
+def _chart_section(title, body):
+    return f"<section><h2>{title}</h2>{body}</section>"
+
+
+def _manager_charts(bundle_dir, team):
+    metrics = _metrics.iloc[team]
+    sections = [
+        _chart_section(
+            "Team Productivity",
+            _save_png(
+                build_styled_bar_chart(
+                    _employees["name"].iloc[team],
+                    metrics["productivity_score"],
+                    "Employee",
+                    "Productivity Score",
+                ),
+                bundle_dir / "team_productivity.png",
+            ),
+        ),
+        _chart_section(
+            "Weekly Task Completion",
+            _save_png(
+                build_styled_line_chart(
+                    _weekly_completion[team].sum(axis=0), "Week", "Tasks Completed"
+                ),
+                bundle_dir / "weekly_task_completion.png",
+            ),
+        ),
+    ]
+    task_distribution = {
+        "Status": ["Completed", "On Track", "Overdue"],
+        "Count": [
+            metrics["completed"].sum(),
+            metrics["on_track"].sum(),
+            metrics["overdue"].sum(),
+        ],
+    }
+    fig = create_pie_chart(
+        task_distribution, "Status", "Count", title="Task Distribution"
+    )
+    sections.append(_chart_section("Task Distribution", _plotly_html(fig)))
+    return sections
+
+
+def _director_charts(bundle_dir, managers):
+    rows = []
+    for manager in managers:
+        team = _reports.get(_employees["employee_id"].iat[manager], [])
+        metrics = _metrics.iloc[team]
+        rows.append(
+            {
+                "manager": _employees["name"].iat[manager],
+                "productivity_score": metrics["productivity_score"].mean(),
+                "completed": metrics["completed"].sum(),
+                "overdue": metrics["overdue"].sum(),
+            }
+        )
+    summary = pd.DataFrame(rows).fillna(0)
+
+    fig = create_multi_bar_chart(
+        summary,
+        x="manager",
+        y=["completed", "overdue"],
+        labels={"completed": "Completed Tasks", "overdue": "Overdue Tasks"},
+        title="Tasks by Team",
+    )
+    return [
+        _chart_section(
+            "Productivity by Team",
+            _save_png(
+                build_styled_bar_chart(
+                    summary["manager"],
+                    summary["productivity_score"],
+                    "Manager",
+                    "Avg Productivity Score",
+                ),
+                bundle_dir / "productivity_by_team.png",
+            ),
+        ),
+        _chart_section("Tasks by Team", _plotly_html(fig)),
+    ]
+
+
+def _render_report(position, output_dir, report_date):
+    employee = _employees.iloc[position]
+    bundle_dir = Path(output_dir) / report_date / employee["employee_id"]
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+
+    direct_reports = _reports.get(employee["employee_id"], [])
+    if employee["role"] == "Director":
+        sections = _director_charts(bundle_dir, direct_reports)
+    else:
+        sections = _manager_charts(bundle_dir, direct_reports)
+    _add_plotly_js(bundle_dir)
+
+    index_path = bundle_dir / "index.html"
+    index_path.write_text(
+        "<html><head><meta charset='utf-8'>"
+        f"<title>{employee['name']} - {report_date}</title>"
+        f"<script src='{PLOTLY_JS}'></script></head><body>"
+        f"<h1>{employee['name']} ({employee['role']}, {employee['department']})</h1>"
+        f"<p>Report date: {report_date}</p>{''.join(sections)}</body></html>",
+        encoding="utf-8",
+    )
+    return employee["employee_id"], employee["name"], employee["role"], index_path
+
+
+def render_reports(
+    employees, metrics, weekly_completion, output_dir, report_date, workers=None
+):
+    recipients = np.flatnonzero(
+        employees["role"].isin(["Manager", "Director"]).to_numpy()
+    )
+    workers = workers or os.cpu_count()
+    run_dir = Path(output_dir) / report_date
+    run_dir.mkdir(parents=True, exist_ok=True)
+    plotly_js = run_dir / PLOTLY_JS
+    plotly_js.write_text(get_plotlyjs(), encoding="utf-8")
+    chunksize = max(1, len(recipients) // (workers * 4))
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(employees, metrics, weekly_completion, plotly_js),
+    ) as executor:
+        rendered = list(
+            executor.map(
+                _render_report,
+                recipients,
+                [output_dir] * len(recipients),
+                [report_date] * len(recipients),
+                chunksize=chunksize,
+            )
+        )
+
+    manifest = pd.DataFrame(
+        rendered, columns=["employee_id", "name", "role", "report_path"]
+    )
+    manifest.to_csv(run_dir / "manifest.csv", index=False)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render dated dashboard report bundles for every manager and director"
+    )
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--date", default=date.today().isoformat())
+    parser.add_argument("--employees", type=int, default=NUM_EMPLOYEES)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    employees = generate_employee_records(args.employees)
+    metrics, weekly_completion = generate_employee_metrics(employees)
+    manifest = render_reports(
+        employees,
+        metrics,
+        weekly_completion,
+        args.output_dir,
+        args.date,
+        args.workers,
+    )
+    print(f"Rendered {len(manifest)} reports to {Path(args.output_dir) / args.date}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,18 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from analytics.compliance import COMPLIANCE_REQUIREMENTS
+from analytics.surveys import ALL_TEAMS, SCORE_LEVELS
+from ui.datasets import (load_compliance_index, load_survey_aggregates,
+                         session_departments)
 from ui.style import (apply_styled_dropdown_css, create_multi_bar_chart,
                       create_pie_chart, create_styled_bullet_list,
                       create_styled_metric, create_styled_tabs,
                       display_pie_chart)
 
+# How much lower compliance was at the previous quarter's snapshot
+PREVIOUS_QUARTER_SHIFT = 0.03
+
 
 def director_engagement_compliance_dashboard():
     st.title("Engagement and Compliance Dashboard")
@@ -14,44 +21,36 @@ def director_engagement_compliance_dashboard():
     # Apply styled dropdown CSS
     apply_styled_dropdown_css()
 
-    # Dummy data (unchanged)
+    # Survey engagement per team as a percentage of the top score
+    aggregates = load_survey_aggregates()
+    to_percent = 100 / SCORE_LEVELS[-1]
+    trends = aggregates.trend() * to_percent
     engagement_data = pd.DataFrame(
         {
-            "team": [
-                "Product Development",
-                "Customer Support",
-                "Sales",
-                "Marketing",
-                "Human Resources",
-            ],
-            "score": [80, 75, 85, 78, 82],
-            "previousScore": [75, 78, 82, 76, 80],
+            "team": trends.columns,
+            "score": trends.iloc[-1].round(1).to_numpy(),
+            "previousScore": trends.iloc[-2].round(1).to_numpy(),
         }
     )
-
-    engagement_trends = pd.DataFrame(
-        {
-            "quarter": ["Q1", "Q2", "Q3", "Q4"],
-            "overall": [76, 78, 79, 80],
-            "productDev": [74, 76, 78, 80],
-            "customerSupport": [75, 77, 76, 75],
-            "sales": [80, 82, 83, 85],
-            "marketing": [75, 76, 77, 78],
-            "hr": [76, 79, 81, 82],
-        }
+    engagement_trends = trends.assign(
+        overall=aggregates.trend(by_team=False)[ALL_TEAMS] * to_percent
+    ).reset_index()
+
+    # Compliance across the session's departments (the whole org without a
+    # department scope) now and at the previous quarter's snapshot
+    departments = session_departments()
+    scope = {} if departments is None else {"department": departments}
+    current_rates = load_compliance_index().compliance_rates(**scope).iloc[0]
+    previous_rates = (
+        load_compliance_index(PREVIOUS_QUARTER_SHIFT, seed=1)
+        .compliance_rates(**scope)
+        .iloc[0]
     )
-
     compliance_data = pd.DataFrame(
         {
-            "category": [
-                "Mandatory Training",
-                "Policy Acknowledgment",
-                "Data Protection",
-                "Code of Conduct",
-                "Ethics Training",
-            ],
-            "compliance": [100, 95, 98, 97, 93],
-            "previousCompliance": [98, 92, 95, 95, 90],
+            "category": [COMPLIANCE_REQUIREMENTS[r] for r in current_rates.index],
+            "compliance": current_rates.round(1).to_numpy(),
+            "previousCompliance": previous_rates.round(1).to_numpy(),
         }
     )
 
@@ -66,7 +65,12 @@ def director_engagement_compliance_dashboard():
             with col1:
                 st.write(row["team"])
             with col2:
-                create_styled_metric(f"{row['score']}%", "Current Score", "📊")
+                if pd.isna(row["score"]):
+                    st.caption(
+                        f"Hidden: fewer than {aggregates.min_respondents} respondents"
+                    )
+                else:
+                    create_styled_metric(f"{row['score']}%", "Current Score", "📊")
 
         st.subheader("Team Engagement Scores Chart")
         fig = create_multi_bar_chart(
@@ -82,7 +86,7 @@ def director_engagement_compliance_dashboard():
         fig = px.line(
             engagement_trends,
             x="quarter",
-            y=["overall", "productDev", "customerSupport", "sales", "marketing", "hr"],
+            y=["overall", *trends.columns],
         )
         fig.update_layout(yaxis_range=[70, 90])
         st.plotly_chart(fig, use_container_width=True)
@@ -123,10 +127,14 @@ def director_engagement_compliance_dashboard():
             )
 
         st.subheader("Actionable Insights")
+        change = compliance_data["compliance"] - compliance_data["previousCompliance"]
+        lowest = compliance_data.loc[compliance_data["compliance"].idxmin()]
+        highest = compliance_data.loc[compliance_data["compliance"].idxmax()]
+        most_improved = compliance_data.loc[change.idxmax()]
         insights = [
-            "Ethics Training compliance is below 95%. Consider sending reminders or scheduling additional sessions.",
-            "Mandatory Training compliance is at 100%. Excellent work maintaining full compliance in this critical area.",
-            "Policy Acknowledgment shows the largest improvement. Consider applying similar strategies to other areas.",
+            f"{lowest['category']} has the lowest compliance at {lowest['compliance']}%. Consider sending reminders or scheduling additional sessions.",
+            f"{highest['category']} compliance is at {highest['compliance']}%. Excellent work maintaining compliance in this critical area.",
+            f"{most_improved['category']} shows the largest improvement. Consider applying similar strategies to other areas.",
         ]
         create_styled_bullet_list(insights, "Key Insights")
 
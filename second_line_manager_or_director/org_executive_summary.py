@@ -4,10 +4,15 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
+from ui.datasets import (load_payroll_ledger, load_shared_dataset,
+                         restrict_for_session)
 from ui.style import (apply_styled_dropdown_css, create_styled_bar_chart,
                       create_styled_bullet_list, create_styled_line_chart,
                       create_styled_metric, create_styled_tabs)
 
+# The director's id in the org payroll ledger
+DIRECTOR_ID = "EMP000001"
+
 
 # Helper functions and data generation
 def generate_random_data(min_val, max_val, decimals=0):
@@ -49,7 +54,6 @@ def generate_data(time_period):
         "turnoverRate": f"{last_period['turnover']}%",
         "engagementScore": last_period["engagement"],
         "staffingLevels": f"{generate_random_data(90, 100)}%",
-        "payrollOverview": f"${generate_random_data(1, 1.5, 1)}M",
     }
 
     return df, kpi_data
@@ -98,7 +102,7 @@ def director_executive_summary_dashboard():
     )
 
     # Generate data based on selected time period
-    df, kpi_data = generate_data(time_period)
+    df, kpi_data = load_shared_dataset("executive_summary", generate_data, time_period)
 
     # KPI tiles using styled metrics
     st.header("Key Performance Indicators")
@@ -115,7 +119,10 @@ def director_executive_summary_dashboard():
         create_styled_metric("Engagement Score", str(kpi_data["engagementScore"]), "😊")
     with col3:
         create_styled_metric("Staffing Levels", kpi_data["staffingLevels"], "👥")
-        create_styled_metric("Payroll Overview", kpi_data["payrollOverview"], "💰")
+        # Latest monthly payroll across the director's organization
+        ledger = load_payroll_ledger()
+        payroll = ledger.subtree(DIRECTOR_ID, last=1).sum()
+        create_styled_metric("Payroll Overview", f"${payroll / 1e6:,.1f}M", "💰")
 
     # Tabs for different sections using styled tabs
     tabs = create_styled_tabs(["Trends", "Team Breakdown", "Risk Assessment"])
@@ -159,6 +166,16 @@ def director_executive_summary_dashboard():
             )
             st.table(team_df)
 
+        st.subheader("Payroll by Department")
+        payroll_df = (
+            restrict_for_session(ledger.by_department(last=1).reset_index())
+            .set_index("department")
+            .sum(axis=1)
+        )
+        create_styled_bar_chart(
+            payroll_df.index, payroll_df, "Department", "Latest Monthly Payroll ($)"
+        )
+
     with tabs[2]:
         st.header("Risk Assessment")
 
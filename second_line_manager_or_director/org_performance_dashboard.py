@@ -6,6 +6,11 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from analytics.employees import generate_employee_records
+from analytics.ranking import PERCENTILE_BANDS, PerformanceRanking
+from ui.datasets import (load_goal_store, load_grouped_stats,
+                         load_shared_dataset, restrict_for_session,
+                         session_departments)
 from ui.style import (apply_styled_dropdown_css, create_pie_chart,
                       create_styled_bar_chart, create_styled_bullet_list,
                       create_styled_line_chart, create_styled_metric,
@@ -76,14 +81,6 @@ all_performance_ratings = [
     },
 ]
 
-departmental_goals = [
-    {"department": "Sales", "achieved": 85, "total": 100},
-    {"department": "Marketing", "achieved": 72, "total": 100},
-    {"department": "Engineering", "achieved": 95, "total": 100},
-    {"department": "Customer Support", "achieved": 88, "total": 100},
-    {"department": "HR", "achieved": 92, "total": 100},
-]
-
 all_performers = [
     {"name": "John Doe", "department": "Sales", "rating": 4.9},
     {"name": "Jane Smith", "department": "Engineering", "rating": 4.8},
@@ -97,6 +94,23 @@ all_performers = [
     {"name": "Ivy Clark", "department": "HR", "rating": 2.5},
 ]
 
+NUM_EMPLOYEES = 80_000
+
+
+@st.cache_resource
+def load_performance_ranking():
+    # The named performers plus a synthetic population rated between them
+    departments = ["Sales", "Marketing", "Engineering", "Customer Support", "HR"]
+    employees = generate_employee_records(NUM_EMPLOYEES, departments)
+    rng = np.random.default_rng(0)
+    population = employees[["name", "department"]].assign(
+        department=lambda df: df["department"].astype(str),
+        rating=rng.normal(3.5, 0.6, len(employees)).clip(2.6, 4.5).round(1),
+    )
+    return PerformanceRanking.from_frame(
+        pd.concat([pd.DataFrame(all_performers), population], ignore_index=True)
+    )
+
 
 # Generate more realistic and varied performance vs training data
 def generate_performance_vs_training_data(departments, num_entries_per_dept=10):
@@ -119,17 +133,36 @@ def generate_performance_vs_training_data(departments, num_entries_per_dept=10):
     return data
 
 
+def load_performance_vs_training_data():
+    return pd.DataFrame(
+        generate_performance_vs_training_data(
+            ["Sales", "Marketing", "Engineering", "Customer Support", "HR"]
+        )
+    )
+
+
 def director_performance_dashboard():
     st.title("Performance Dashboard")
     apply_styled_dropdown_css()
 
     # Convert data to DataFrames
     df_performance_ratings = pd.DataFrame(all_performance_ratings)
-    df_goals = pd.DataFrame(departmental_goals)
-    df_performers = pd.DataFrame(all_performers)
-    departments = ["Sales", "Marketing", "Engineering", "Customer Support", "HR"]
-    df_performance_vs_training = pd.DataFrame(
-        generate_performance_vs_training_data(departments)
+    # Department objectives with their rolled-up progress
+    df_goals = restrict_for_session(load_goal_store().departments())
+    performance_ranking = load_performance_ranking()
+    # Training rows generated once per process, with their running
+    # per-department statistics built alongside
+    df_performance_vs_training = load_shared_dataset(
+        "performance_vs_training", load_performance_vs_training_data
+    )
+    training_stats = load_grouped_stats(
+        "performance_vs_training",
+        load_performance_vs_training_data,
+        None,
+        "trainingHours",
+        "avgPerformance",
+        "department",
+        sum_columns=["employees"],
     )
 
     # Calculate total employees and average performance per department
@@ -144,8 +177,11 @@ def director_performance_dashboard():
         + df_performance_ratings["unsatisfactory"] * 1
     ) / df_performance_ratings["total_employees"]
 
-    # Department selection dropdown with label
-    departments = ["All"] + list(df_performance_ratings["department"])
+    # Department selection dropdown with label; a department-scoped session
+    # gets its own only
+    departments = session_departments() or ["All"] + list(
+        df_performance_ratings["department"]
+    )
     selected_department = st.selectbox(
         "Select Department",
         departments,
@@ -157,16 +193,12 @@ def director_performance_dashboard():
     if selected_department == "All":
         filtered_performance_ratings = df_performance_ratings
         filtered_goals = df_goals
-        filtered_performers = df_performers
         filtered_performance_vs_training = df_performance_vs_training
     else:
         filtered_performance_ratings = df_performance_ratings[
             df_performance_ratings["department"] == selected_department
         ]
         filtered_goals = df_goals[df_goals["department"] == selected_department]
-        filtered_performers = df_performers[
-            df_performers["department"] == selected_department
-        ]
         filtered_performance_vs_training = df_performance_vs_training[
             df_performance_vs_training["department"] == selected_department
         ]
@@ -188,10 +220,17 @@ def director_performance_dashboard():
         goal_achievement_tab(filtered_goals)
 
     with tabs[2]:
-        employee_performance_tab(filtered_performers)
+        employee_performance_tab(
+            performance_ranking,
+            None if selected_department == "All" else [selected_department],
+        )
 
     with tabs[3]:
-        training_impact_tab(filtered_performance_vs_training)
+        training_impact_tab(
+            filtered_performance_vs_training,
+            training_stats,
+            None if selected_department == "All" else [selected_department],
+        )
 
 
 def performance_overview_tab(filtered_performance_ratings, performance_trends):
@@ -264,37 +303,42 @@ def goal_achievement_tab(filtered_goals):
     st.header("Goal Achievement Rates")
 
     # Create a more intuitive list view for goal achievement
-    for _, row in filtered_goals.iterrows():
+    for department, progress, completed, key_results in zip(
+        filtered_goals["department"],
+        filtered_goals["progress"],
+        filtered_goals["completed"],
+        filtered_goals["key_results"],
+    ):
         col1, col2, col3 = st.columns([2, 6, 2])
         with col1:
-            st.subheader(row["department"])
+            st.subheader(department)
         with col2:
-            progress = row["achieved"] / row["total"]
-            st.progress(progress)
+            st.progress(progress / 100)
+            st.caption(f"{completed:,} of {key_results:,} key results completed")
         with col3:
             create_styled_metric(
                 "Achieved",
-                f"{row['achieved']}%",
-                f"{row['achieved'] - row['total']}% from target",
+                f"{progress:.0f}%",
+                f"{progress - 100:.0f}% from target",
             )
 
     # Add a summary chart
     create_styled_bar_chart(
         filtered_goals["department"],
-        filtered_goals["achieved"],
+        filtered_goals["progress"],
         "Department",
         "Achievement (%)",
     )
     st.markdown("**Note:** The red dashed line indicates the 100% target.")
 
 
-def employee_performance_tab(filtered_performers):
+def employee_performance_tab(performance_ranking, departments=None):
     st.header("Top and Bottom Performers")
     col1, col2 = st.columns(2)
 
     with col1:
         st.subheader("Top Performers")
-        top_performers = filtered_performers.nlargest(5, "rating")
+        top_performers = performance_ranking.top(5, departments)
         list = [
             f"{row['name']} ({row['department']}): {row['rating']}"
             for _, row in top_performers.iterrows()
@@ -304,7 +348,7 @@ def employee_performance_tab(filtered_performers):
 
     with col2:
         st.subheader("Bottom Performers")
-        bottom_performers = filtered_performers.nsmallest(5, "rating")
+        bottom_performers = performance_ranking.bottom(5, departments)
         list = [
             f"{row['name']} ({row['department']}): {row['rating']}"
             for _, row in bottom_performers.iterrows()
@@ -312,8 +356,17 @@ def employee_performance_tab(filtered_performers):
         for item in list:
             st.write(f"• {item}")
 
+    # Percentile bands come from the merged department sketches
+    st.subheader("Rating Percentiles")
+    bands = performance_ranking.percentile_bands(PERCENTILE_BANDS, departments)
+    for col, (band, rating) in zip(st.columns(len(bands)), bands.items()):
+        with col:
+            create_styled_metric(f"P{band * 100:.0f}", f"{rating:.1f}", "📊")
 
-def training_impact_tab(filtered_performance_vs_training):
+
+def training_impact_tab(
+    filtered_performance_vs_training, training_stats, departments=None
+):
     st.header("Training Impact")
 
     # Create a more intuitive visualization for training impact
@@ -337,9 +390,7 @@ def training_impact_tab(filtered_performance_vs_training):
     st.subheader("Insights")
 
     # Overall correlation
-    overall_correlation = filtered_performance_vs_training["trainingHours"].corr(
-        filtered_performance_vs_training["avgPerformance"]
-    )
+    overall_correlation = training_stats.correlation(departments)
 
     # Create three columns for a better layout
     col1, col2, col3 = st.columns([1, 1, 1])
@@ -351,23 +402,23 @@ def training_impact_tab(filtered_performance_vs_training):
         )
 
     with col2:
-        max_performance = filtered_performance_vs_training.loc[
-            filtered_performance_vs_training["avgPerformance"].idxmax()
-        ]
+        max_performance, max_performance_department = training_stats.group_maximum(
+            "avgPerformance", departments
+        )
         create_styled_metric(
             "Highest Avg Performance",
-            f"{max_performance['avgPerformance']:.2f}",
-            f"{max_performance['department']}",
+            f"{max_performance:.2f}",
+            f"{max_performance_department}",
         )
 
     with col3:
-        max_training = filtered_performance_vs_training.loc[
-            filtered_performance_vs_training["trainingHours"].idxmax()
-        ]
+        max_training, max_training_department = training_stats.group_maximum(
+            "trainingHours", departments
+        )
         create_styled_metric(
             "Most Training Hours",
-            f"{max_training['trainingHours']}",
-            f"{max_training['department']}",
+            f"{max_training}",
+            f"{max_training_department}",
         )
 
     # Interpretation of correlations
@@ -383,17 +434,18 @@ def training_impact_tab(filtered_performance_vs_training):
 
     # Summary statistics
     st.subheader("Summary Statistics")
-    summary_stats = (
-        filtered_performance_vs_training.groupby("department")
-        .agg(
-            {
-                "trainingHours": ["mean", "min", "max"],
-                "avgPerformance": ["mean", "min", "max"],
-                "employees": "sum",
-            }
-        )
-        .reset_index()
-    )
+    summary_stats = training_stats.group_summary(departments)[
+        [
+            "department",
+            "trainingHours_mean",
+            "trainingHours_min",
+            "trainingHours_max",
+            "avgPerformance_mean",
+            "avgPerformance_min",
+            "avgPerformance_max",
+            "employees_sum",
+        ]
+    ].astype({"employees_sum": int})
     summary_stats.columns = [
         "Department",
         "Avg Training Hours",
@@ -1,16 +1,47 @@
 import random
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+from analytics.project_risk import RISK_THRESHOLDS, RISK_WEIGHTS
+from analytics.projects import PROJECT_STATUSES
+from analytics.velocity import FORECAST_LEVEL
+from ui.charts import cached_chart
+from ui.datasets import (load_grouped_stats, load_project_store,
+                         load_shared_dataset, load_velocity_history,
+                         restrict_for_session, session_departments)
 from ui.style import (apply_styled_dropdown_css, create_pie_chart,
                       create_styled_bar_chart, create_styled_bullet_list,
                       create_styled_line_chart, create_styled_metric,
-                      create_styled_radio_buttons, create_styled_tabs,
-                      display_pie_chart)
+                      create_styled_radio_buttons, display_pie_chart,
+                      render_tab_sections)
+
+# High-risk projects listed by name on the risk tab, and how each risk
+# driver is named there
+HIGH_RISK_LISTED = 10
+RISK_DRIVER_LABELS = {
+    "schedule": "Schedule Slip",
+    "budget": "Budget Burn",
+    "velocity": "Completion Velocity",
+    "staffing": "Staffing Gap",
+}
+
+# Colour of each project status on the status and overview charts
+STATUS_COLORS = {
+    "on-track": "green",
+    "at-risk": "orange",
+    "delayed": "red",
+    "unknown": "gray",
+}
+
+# Sprints forecast on the capacity tab, and teams listed there as the least
+# predictable
+CAPACITY_SPRINTS = 3
+VOLATILE_TEAMS_LISTED = 10
 
 
 # Generate dummy data
@@ -26,52 +57,6 @@ def generate_dummy_data():
         ]
     )
 
-    # Projects data
-    projects_data = pd.DataFrame(
-        [
-            {
-                "id": 1,
-                "name": "Website Redesign",
-                "department": "Marketing",
-                "completion": 75,
-                "status": "on-track",
-                "risk": "low",
-            },
-            {
-                "id": 2,
-                "name": "Mobile App Development",
-                "department": "Engineering",
-                "completion": 40,
-                "status": "delayed",
-                "risk": "medium",
-            },
-            {
-                "id": 3,
-                "name": "CRM Integration",
-                "department": "Sales",
-                "completion": 90,
-                "status": "on-track",
-                "risk": "low",
-            },
-            {
-                "id": 4,
-                "name": "Data Migration",
-                "department": "Engineering",
-                "completion": 60,
-                "status": "on-track",
-                "risk": "high",
-            },
-            {
-                "id": 5,
-                "name": "Security Audit",
-                "department": "Engineering",
-                "completion": 30,
-                "status": "delayed",
-                "risk": "medium",
-            },
-        ]
-    )
-
     # Performance ratings data
     performance_ratings = pd.DataFrame(
         [
@@ -132,7 +117,6 @@ def generate_dummy_data():
 
     return (
         productivity_data,
-        projects_data,
         performance_ratings,
         trends,
         training_impact,
@@ -144,13 +128,29 @@ def org_productivity_dashboard():
     apply_styled_dropdown_css()
 
     # Generate dummy data
-    productivity_data, projects_data, performance_ratings, trends, training_impact = (
-        generate_dummy_data()
+    productivity_data, performance_ratings, trends, training_impact = (
+        load_shared_dataset("org_productivity", generate_dummy_data)
+    )
+    # Latest burn and forecast metrics for every project in the store
+    projects_data = restrict_for_session(load_project_store().metrics())
+
+    # Running training statistics per department, queried instead of the rows
+    training_stats = load_grouped_stats(
+        "org_productivity",
+        generate_dummy_data,
+        3,
+        "trainingHours",
+        "avgPerformance",
+        "department",
+        sum_columns=["employees"],
     )
 
-    # Department selection
-    departments = ["All"] + productivity_data["department"].tolist()
+    # Department selection; a department-scoped session gets its own only
+    departments = (
+        session_departments() or ["All"] + productivity_data["department"].tolist()
+    )
     selected_department = st.selectbox("Select Department", departments)
+    stats_departments = None if selected_department == "All" else [selected_department]
 
     # Filter data based on selected department
     if selected_department != "All":
@@ -167,35 +167,47 @@ def org_productivity_dashboard():
             training_impact["department"] == selected_department
         ]
 
-    # Use styled tabs
-    tabs = create_styled_tabs(
-        [
-            "Overview",
-            "Project Status",
-            "Performance Ratings",
-            "Productivity Trends",
-            "Training Impact",
-            "Risk Assessment",
-        ]
+    # Only the open tab runs; its widgets rerun that tab alone
+    render_tab_sections(
+        {
+            "Overview": (
+                overview_tab,
+                productivity_data,
+                projects_data,
+                performance_ratings,
+            ),
+            "Project Status": (project_status_tab, projects_data),
+            "Performance Ratings": (performance_ratings_tab, performance_ratings),
+            "Productivity Trends": (
+                productivity_trends_tab,
+                trends,
+                selected_department,
+            ),
+            "Training Impact": (
+                training_impact_tab,
+                training_impact,
+                training_stats,
+                stats_departments,
+            ),
+            "Risk Assessment": (risk_assessment_tab, projects_data),
+            "Delivery Capacity": (delivery_capacity_tab, selected_department),
+        },
+        key="org_productivity_tab",
     )
 
-    with tabs[0]:
-        overview_tab(productivity_data, projects_data, performance_ratings)
-
-    with tabs[1]:
-        project_status_tab(projects_data)
 
-    with tabs[2]:
-        performance_ratings_tab(performance_ratings)
-
-    with tabs[3]:
-        productivity_trends_tab(trends, selected_department)
-
-    with tabs[4]:
-        training_impact_tab(training_impact)
-
-    with tabs[5]:
-        risk_assessment_tab(projects_data)
+def build_productivity_heatmap(productivity_data):
+    fig = px.imshow(
+        [productivity_data["productivity"]],
+        x=productivity_data["department"],
+        y=["Productivity Score"],
+        color_continuous_scale="RdYlGn",
+        text_auto=True,
+        aspect="auto",
+        title="Team Productivity Heatmap",
+    )
+    fig.update_layout(height=200)
+    return fig
 
 
 def overview_tab(productivity_data, projects_data, performance_ratings):
@@ -224,27 +236,22 @@ def overview_tab(productivity_data, projects_data, performance_ratings):
 
     # Productivity heatmap
     st.subheader("Departmental Productivity")
-    fig = px.imshow(
-        [productivity_data["productivity"]],
-        x=productivity_data["department"],
-        y=["Productivity Score"],
-        color_continuous_scale="RdYlGn",
-        text_auto=True,
-        aspect="auto",
-        title="Team Productivity Heatmap",
+    fig = cached_chart(
+        "productivity_heatmap", build_productivity_heatmap, productivity_data
     )
-    fig.update_layout(height=200)
     st.plotly_chart(fig, use_container_width=True)
 
     # Project status summary
     st.subheader("Project Status Summary")
-    status_counts = projects_data["status"].value_counts()
-    fig = create_pie_chart(
+    status_counts = projects_data["status"].value_counts(sort=False)
+    fig = cached_chart(
+        "project_status_pie",
+        create_pie_chart,
         status_counts,
         names=status_counts.index,
         values=status_counts.values,
         title="Project Status Distribution",
-        color_sequence=["green", "orange", "red"],
+        color_sequence=[STATUS_COLORS[status] for status in status_counts.index],
     )
     display_pie_chart(fig)
 
@@ -260,14 +267,25 @@ def overview_tab(productivity_data, projects_data, performance_ratings):
 def project_status_tab(projects_data):
     st.header("Project Status")
 
-    # Project selection
-    selected_project = st.selectbox("Select a project", projects_data["name"])
+    # Project selection, narrowed by status first
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        selected_status = st.selectbox(
+            "Filter by status", ["All", *PROJECT_STATUSES], key="project_status_filter"
+        )
+    if selected_status != "All":
+        projects_data = projects_data[projects_data["status"] == selected_status]
+    if projects_data.empty:
+        st.info("No projects with this status.")
+        return
+    with col2:
+        selected_project = st.selectbox("Select a project", projects_data["name"])
     project = projects_data[projects_data["name"] == selected_project].iloc[0]
 
     # Project details
     col1, col2 = st.columns(2)
     with col1:
-        status_color = "green" if project["status"] == "on-track" else "orange"
+        status_color = STATUS_COLORS[project["status"]]
         st.markdown(
             f"**Status:** <span style='color:{status_color};'>●</span> {project['status'].capitalize()}",
             unsafe_allow_html=True,
@@ -282,30 +300,54 @@ def project_status_tab(projects_data):
         )
 
     with col2:
-        st.metric("Completion", f"{project['completion']}%")
+        st.metric("Completion", f"{project['completion']:.0f}%")
         st.progress(project["completion"] / 100)
 
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        burn_rate = project["burn_rate"]
+        st.metric(
+            "Burn Rate",
+            "n/a" if pd.isna(burn_rate) else f"${burn_rate * 30:,.0f}/month",
+        )
+    with col2:
+        st.metric(
+            "Estimate at Completion",
+            f"${project['eac']:,.0f}",
+            f"${project['projected_overrun']:+,.0f} vs budget",
+            delta_color="inverse",
+        )
+    with col3:
+        finish = project["projected_finish"]
+        st.metric(
+            "Projected Finish",
+            "No progress" if pd.isna(finish) else f"{finish:%b %d, %Y}",
+        )
+
     # All projects overview
     st.subheader("All Projects Overview")
-    fig = go.Figure()
-    for _, proj in projects_data.iterrows():
-        fig.add_trace(
-            go.Bar(
-                x=[proj["name"]],
-                y=[proj["completion"]],
-                name=proj["name"],
-                marker_color="green" if proj["status"] == "on-track" else "orange",
-            )
-        )
-    fig.update_layout(
-        title="Project Completion Status",
-        xaxis_title="Project",
-        yaxis_title="Completion (%)",
-        showlegend=False,
+    fig = cached_chart(
+        "project_completion",
+        build_project_completion_chart,
+        projects_data[["completion", "status"]],
     )
     st.plotly_chart(fig, use_container_width=True)
 
 
+def build_project_completion_chart(projects_data):
+    fig = px.histogram(
+        projects_data,
+        x="completion",
+        color="status",
+        nbins=20,
+        category_orders={"status": PROJECT_STATUSES},
+        color_discrete_map=STATUS_COLORS,
+        title="Project Completion Status",
+    )
+    fig.update_layout(xaxis_title="Completion (%)", yaxis_title="Projects")
+    return fig
+
+
 def performance_ratings_tab(performance_ratings):
     st.header("Performance Ratings Distribution")
 
@@ -339,7 +381,9 @@ def performance_ratings_tab(performance_ratings):
     # Create a custom color sequence
     custom_color_sequence = ["#d7191c", "#fdae61", "#ffffbf", "#a6d96a", "#1a9641"]
 
-    fig_ratings = create_pie_chart(
+    fig_ratings = cached_chart(
+        "ratings_pie",
+        create_pie_chart,
         ratings_data,
         names="rating_label",
         values="percentage",
@@ -359,6 +403,22 @@ def performance_ratings_tab(performance_ratings):
     )
 
 
+def build_trends_chart(productivity, performance, names):
+    fig = go.Figure()
+    for series, name, color in zip(
+        (productivity, performance), names, ("blue", "green")
+    ):
+        fig.add_trace(
+            go.Scatter(x=series.index, y=series, name=name, line=dict(color=color))
+        )
+    fig.update_layout(
+        title="Productivity and Performance Trends",
+        xaxis_title="Date",
+        yaxis_title="Score",
+    )
+    return fig
+
+
 def productivity_trends_tab(trends, selected_department):
     st.header("Productivity and Performance Trends")
 
@@ -382,49 +442,22 @@ def productivity_trends_tab(trends, selected_department):
         performance_avg = filtered_trends[
             [col for col in filtered_trends.columns if "performance" in col]
         ].mean(axis=1)
-
-        fig = go.Figure()
-        fig.add_trace(
-            go.Scatter(
-                x=filtered_trends.index,
-                y=productivity_avg,
-                name="Avg Productivity",
-                line=dict(color="blue"),
-            )
-        )
-        fig.add_trace(
-            go.Scatter(
-                x=filtered_trends.index,
-                y=performance_avg,
-                name="Avg Performance",
-                line=dict(color="green"),
-            )
+        fig = cached_chart(
+            "productivity_trends",
+            build_trends_chart,
+            productivity_avg,
+            performance_avg,
+            ["Avg Productivity", "Avg Performance"],
         )
     else:
         # Show trends for selected department
-        fig = go.Figure()
-        fig.add_trace(
-            go.Scatter(
-                x=filtered_trends.index,
-                y=filtered_trends[f"{selected_department}_productivity"],
-                name="Productivity",
-                line=dict(color="blue"),
-            )
-        )
-        fig.add_trace(
-            go.Scatter(
-                x=filtered_trends.index,
-                y=filtered_trends[f"{selected_department}_performance"],
-                name="Performance",
-                line=dict(color="green"),
-            )
+        fig = cached_chart(
+            "productivity_trends",
+            build_trends_chart,
+            filtered_trends[f"{selected_department}_productivity"],
+            filtered_trends[f"{selected_department}_performance"],
+            ["Productivity", "Performance"],
         )
-
-    fig.update_layout(
-        title="Productivity and Performance Trends",
-        xaxis_title="Date",
-        yaxis_title="Score",
-    )
     st.plotly_chart(fig, use_container_width=True)
 
     # Calculate and display metrics
@@ -447,11 +480,13 @@ def productivity_trends_tab(trends, selected_department):
         create_styled_metric("Min Productivity", f"{min_productivity:.2f}", "🔽")
 
 
-def training_impact_tab(training_impact):
+def training_impact_tab(training_impact, training_stats, departments=None):
     st.header("Training Impact Analysis")
 
     # Scatter plot of training hours vs performance
-    fig = px.scatter(
+    fig = cached_chart(
+        "training_scatter",
+        px.scatter,
         training_impact,
         x="trainingHours",
         y="avgPerformance",
@@ -468,18 +503,12 @@ def training_impact_tab(training_impact):
     st.plotly_chart(fig, use_container_width=True)
 
     # Correlation analysis
-    correlation = training_impact["trainingHours"].corr(
-        training_impact["avgPerformance"]
-    )
+    correlation = training_stats.correlation(departments)
     create_styled_metric("Training-Performance Correlation", f"{correlation:.2f}", "📊")
 
     # Training efficiency by department
     st.subheader("Training Efficiency by Department")
-    dept_efficiency = (
-        training_impact.groupby("department")
-        .apply(lambda x: x["avgPerformance"].mean() / x["trainingHours"].mean())
-        .sort_values(ascending=False)
-    )
+    dept_efficiency = training_stats.ratio_of_means(departments)
     create_styled_bar_chart(
         dept_efficiency.index,
         dept_efficiency.values,
@@ -491,16 +520,9 @@ def training_impact_tab(training_impact):
     st.subheader("Key Insights")
 
     # Calculate additional metrics for insights
-    avg_performance = training_impact["avgPerformance"].mean()
-    high_performers = training_impact[
-        training_impact["avgPerformance"] > avg_performance
-    ]
-    low_performers = training_impact[
-        training_impact["avgPerformance"] <= avg_performance
-    ]
-
-    high_perf_avg_hours = high_performers["trainingHours"].mean()
-    low_perf_avg_hours = low_performers["trainingHours"].mean()
+    high_perf_avg_hours, low_perf_avg_hours = training_stats.x_means_split_by_average_y(
+        departments
+    )
 
     most_efficient_dept = dept_efficiency.index[0]
     least_efficient_dept = dept_efficiency.index[-1]
@@ -520,10 +542,12 @@ def risk_assessment_tab(projects_data):
     st.header("Risk Assessment")
 
     # Count projects by risk level
-    risk_counts = projects_data["risk"].value_counts()
+    risk_counts = projects_data["risk"].value_counts(sort=False)
 
     # Create pie chart
-    fig = create_pie_chart(
+    fig = cached_chart(
+        "risk_pie",
+        create_pie_chart,
         risk_counts,
         names=risk_counts.index,
         values=risk_counts.values,
@@ -532,12 +556,33 @@ def risk_assessment_tab(projects_data):
     )
     display_pie_chart(fig)
 
-    # List high-risk projects
-    high_risk_projects = projects_data[projects_data["risk"] == "high"]
+    # List the highest-scoring projects with their main risk driver
+    high_risk_projects = projects_data[projects_data["risk"] == "high"].nlargest(
+        HIGH_RISK_LISTED, "risk_score"
+    )
     if not high_risk_projects.empty:
         st.subheader("High Risk Projects")
-        for project in high_risk_projects["name"].tolist():
-            st.write(f"• {project}")
+        st.caption(
+            f"{(projects_data['risk'] == 'high').sum()} high-risk projects; "
+            f"the {len(high_risk_projects)} with the highest risk score"
+        )
+        drivers = high_risk_projects[list(RISK_WEIGHTS)] * pd.Series(RISK_WEIGHTS)
+        for (_, project), driver in zip(
+            high_risk_projects.iterrows(), drivers.idxmax(axis=1)
+        ):
+            st.write(
+                f"• {project['name']}: score {project['risk_score']:.0f}, "
+                f"mainly {RISK_DRIVER_LABELS[driver].lower()}"
+            )
+
+        # Average weighted contribution of each driver among high-risk projects
+        contributions = 100 * drivers.mean()
+        create_styled_bar_chart(
+            [RISK_DRIVER_LABELS[name] for name in contributions.index],
+            contributions,
+            "Risk Driver",
+            "Average Score Contribution",
+        )
     else:
         st.info("No high-risk projects at the moment.")
 
@@ -555,22 +600,103 @@ def risk_assessment_tab(projects_data):
 
     # Risk vs Completion scatter plot
     st.subheader("Risk vs Project Completion")
-    risk_numeric = {"low": 1, "medium": 2, "high": 3}
-    projects_data["risk_numeric"] = projects_data["risk"].map(risk_numeric)
+    fig = cached_chart(
+        "risk_scatter",
+        build_risk_scatter,
+        projects_data[["name", "department", "completion", "risk_score"]],
+    )
+    st.plotly_chart(fig, use_container_width=True)
 
+
+def build_risk_scatter(projects_data):
     fig = px.scatter(
         projects_data,
         x="completion",
-        y="risk_numeric",
+        y="risk_score",
         color="department",
-        size="risk_numeric",
         hover_name="name",
-        labels={"completion": "Project Completion (%)", "risk_numeric": "Risk Level"},
+        opacity=0.6,
+        render_mode="webgl",
+        labels={"completion": "Project Completion (%)", "risk_score": "Risk Score"},
         title="Project Risk vs Completion",
     )
-    fig.update_yaxes(tickvals=[1, 2, 3], ticktext=["Low", "Medium", "High"])
+    for threshold in RISK_THRESHOLDS:
+        fig.add_hline(y=threshold, line_dash="dot", line_color="gray")
+    return fig
+
+
+def delivery_capacity_tab(selected_department):
+    st.header("Delivery Capacity")
+    history = load_velocity_history()
+    forecast = history.forecast(CAPACITY_SPRINTS)
+    capacity = history.capacity(CAPACITY_SPRINTS)
+    if selected_department != "All":
+        forecast = forecast[forecast["department"] == selected_department]
+        capacity = capacity[capacity["department"] == selected_department]
+    next_sprint = forecast["sprint"].min()
+    upcoming = capacity[capacity["sprint"] == next_sprint]
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        create_styled_metric("Teams", f"{forecast['team'].nunique():,}", "👥")
+    with col2:
+        create_styled_metric(
+            f"Sprint {next_sprint} Forecast",
+            f"{upcoming['forecast'].sum():,.0f} pts",
+            "📈",
+        )
+    with col3:
+        # Department intervals are independent, so their half-widths add in
+        # quadrature
+        spread = np.sqrt(((upcoming["upper"] - upcoming["forecast"]) ** 2).sum())
+        create_styled_metric(
+            f"{FORECAST_LEVEL:.0%} Interval", f"±{spread:,.0f} pts", "📏"
+        )
+
+    fig = go.Figure()
+    for sprint, sprint_capacity in capacity.groupby("sprint"):
+        fig.add_trace(
+            go.Bar(
+                x=sprint_capacity["department"].astype(str),
+                y=sprint_capacity["forecast"],
+                error_y=dict(
+                    type="data",
+                    array=sprint_capacity["upper"] - sprint_capacity["forecast"],
+                    arrayminus=sprint_capacity["forecast"] - sprint_capacity["lower"],
+                ),
+                name=f"Sprint {sprint}",
+            )
+        )
+    fig.update_layout(
+        barmode="group",
+        title="Forecast Story Points by Department",
+        xaxis_title="Department",
+        yaxis_title="Story Points",
+    )
     st.plotly_chart(fig, use_container_width=True)
 
+    # Teams whose next-sprint interval is widest relative to their forecast
+    st.subheader("Least Predictable Teams")
+    upcoming_teams = forecast[forecast["sprint"] == next_sprint]
+    volatile = upcoming_teams.assign(
+        spread=(upcoming_teams["upper"] - upcoming_teams["lower"])
+        / upcoming_teams["forecast"]
+    ).nlargest(VOLATILE_TEAMS_LISTED, "spread")
+    st.dataframe(
+        volatile[["team", "department", "forecast", "lower", "upper", "alpha"]].rename(
+            columns={
+                "team": "Team",
+                "department": "Department",
+                "forecast": "Forecast",
+                "lower": "Lower",
+                "upper": "Upper",
+                "alpha": "Smoothing",
+            }
+        ),
+        hide_index=True,
+        use_container_width=True,
+    )
+
 
 if __name__ == "__main__":
     org_productivity_dashboard()
@@ -2,10 +2,37 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from analytics.allocation import STATUS_PRIORITY, optimize_allocation
+from ui.datasets import (load_project_staffing, load_project_store,
+                         restrict_for_session, session_departments)
 from ui.style import (apply_styled_dropdown_css, create_multi_bar_chart,
                       create_progress_bar, create_styled_metric,
                       create_styled_tabs)
 
+# Projects listed per portfolio, and projects shown on the staffing chart
+WATCHLIST_SIZE = 5
+RESOURCE_GAPS_SHOWN = 15
+
+
+@st.cache_resource(max_entries=16)
+def propose_reallocation(department):
+    # Moves within one department, filling the slots of at-risk and delayed
+    # projects first
+    store = load_project_store()
+    requirements, people, skill_levels = load_project_staffing()
+    projects = store.metrics()
+    projects = projects[projects["department"] == department]
+    people = people[people["department"] == department]
+    priority = (
+        projects.set_index("project_id")["status"].map(STATUS_PRIORITY).astype(float)
+    )
+    return optimize_allocation(
+        requirements[requirements["project_id"].isin(projects["project_id"])],
+        people,
+        skill_levels[skill_levels["employee_id"].isin(people["employee_id"])],
+        priority,
+    )
+
 
 def director_project_portfolio_dashboard():
     st.title("Project and Portfolio Management Dashboard")
@@ -13,49 +40,11 @@ def director_project_portfolio_dashboard():
     # Apply styled dropdown CSS
     apply_styled_dropdown_css()
 
-    # Dummy data (unchanged)
-    portfolio_data = {
-        "Digital Transformation": [
-            {
-                "name": "Cloud Migration",
-                "status": "On Track",
-                "completion": 80,
-                "risk": "Low",
-                "budget": 1000000,
-                "spent": 750000,
-                "wins": "Reduced infrastructure costs by 30%",
-            },
-            {
-                "name": "AI Integration",
-                "status": "At Risk",
-                "completion": 60,
-                "risk": "High",
-                "budget": 1500000,
-                "spent": 1200000,
-                "wins": "Prototype showing 25% efficiency increase",
-            },
-        ],
-        "Customer Experience": [
-            {
-                "name": "Mobile App Redesign",
-                "status": "On Track",
-                "completion": 90,
-                "risk": "Low",
-                "budget": 800000,
-                "spent": 700000,
-                "wins": "User engagement up by 40%",
-            },
-            {
-                "name": "Chatbot Implementation",
-                "status": "Delayed",
-                "completion": 40,
-                "risk": "Medium",
-                "budget": 2000000,
-                "spent": 1000000,
-                "wins": "Successfully handling 30% of queries",
-            },
-        ],
-    }
+    # Latest burn and forecast metrics of every project the session may see,
+    # from the shared store
+    store = load_project_store()
+    projects = restrict_for_session(store.metrics())
+    summary = store.portfolio_summary(departments=session_departments())
 
     team_performance = pd.DataFrame(
         {
@@ -65,19 +54,6 @@ def director_project_portfolio_dashboard():
         }
     )
 
-    resource_allocation = pd.DataFrame(
-        {
-            "name": [
-                "Cloud Migration",
-                "AI Integration",
-                "Mobile App Redesign",
-                "Chatbot Implementation",
-            ],
-            "allocated": [25, 20, 30, 15],
-            "required": [30, 25, 30, 20],
-        }
-    )
-
     development_trends = pd.DataFrame(
         {
             "month": ["Jan", "Feb", "Mar", "Apr"],
@@ -98,45 +74,82 @@ def director_project_portfolio_dashboard():
     )
 
     with tabs[0]:
-        for portfolio, projects in portfolio_data.items():
+        for portfolio, totals in summary.iterrows():
             st.subheader(portfolio)
-            for project in projects:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                create_styled_metric(
+                    f"{totals['projects']:,}",
+                    f"Projects ({totals['delayed']:,} delayed)",
+                    "📁",
+                )
+            with col2:
+                create_styled_metric(
+                    f"${totals['spent'] / 1e6:,.1f}M/{totals['budget'] / 1e6:,.1f}M",
+                    "Budget Spent",
+                    "💰",
+                )
+            with col3:
+                create_styled_metric(
+                    f"${totals['projected_overrun'] / 1e6:+,.1f}M",
+                    "Projected Overrun",
+                    "📉",
+                )
+
+            # The projects forecast to overrun their budget the most
+            watchlist = projects[projects["portfolio"] == portfolio].nlargest(
+                WATCHLIST_SIZE, "projected_overrun"
+            )
+            for _, project in watchlist.iterrows():
                 with st.expander(project["name"]):
                     col1, col2 = st.columns(2)
                     with col1:
                         create_styled_metric(project["status"], "Status", "🚦")
                         create_styled_metric(project["risk"], "Risk", "⚠️")
+                        create_styled_metric(
+                            (
+                                "n/a"
+                                if pd.isna(project["burn_rate"])
+                                else f"${project['burn_rate'] * 30:,.0f}/month"
+                            ),
+                            "Burn Rate",
+                            "🔥",
+                        )
                     with col2:
                         create_styled_metric(
-                            f"{project['completion']}%", "Completion", "🏁"
+                            f"{project['completion']:.0f}%", "Completion", "🏁"
                         )
                         create_styled_metric(
-                            f"${project['spent']:,}/{project['budget']:,}",
+                            f"${project['spent']:,.0f}/{project['budget']:,.0f}",
                             "Budget Spent",
                             "💰",
                         )
-                    st.write(f"**Key Win:** {project['wins']}")
+                        create_styled_metric(
+                            f"${project['eac']:,.0f}", "Estimate at Completion", "🎯"
+                        )
 
     with tabs[1]:
-        df = pd.DataFrame([proj for projs in portfolio_data.values() for proj in projs])
+        df = summary.reset_index()
 
-        st.subheader("Project Performance Overview")
+        st.subheader("Portfolio Performance Overview")
         fig = create_multi_bar_chart(
             df,
-            "name",
-            ["spent", "budget", "completion"],
+            "portfolio",
+            ["spent", "budget", "eac"],
             {
                 "spent": "Budget Spent ($)",
                 "budget": "Total Budget ($)",
-                "completion": "Completion (%)",
+                "eac": "Estimate at Completion ($)",
             },
-            "Project Performance Comparison",
+            "Portfolio Performance Comparison",
         )
         st.plotly_chart(fig, use_container_width=True)
 
-        st.subheader("Project Status Overview")
+        st.subheader("Portfolio Status Overview")
         for _, row in df.iterrows():
-            create_progress_bar(row["name"], row["completion"], row["status"])
+            create_progress_bar(
+                row["portfolio"], int(round(row["completion"])), "In Progress"
+            )
 
     with tabs[2]:
         st.subheader("Team Performance Metrics")
@@ -154,16 +167,60 @@ def director_project_portfolio_dashboard():
 
     with tabs[3]:
         st.subheader("Resource Allocation vs. Requirements")
+        department = st.selectbox(
+            "Department",
+            session_departments() or list(projects["department"].cat.categories),
+            key="resource_department",
+        )
+        plan = propose_reallocation(department)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            create_styled_metric(
+                f"{plan.shortfall_before:,}", "Open Positions (FTEs)", "⚠️"
+            )
+        with col2:
+            create_styled_metric(f"{len(plan.moves):,}", "Proposed Moves", "🔀")
+        with col3:
+            create_styled_metric(
+                f"{plan.shortfall_after:,}", "Open After Moves (FTEs)", "✅"
+            )
+
+        resource_allocation = (
+            plan.by_project()
+            .join(projects.set_index("project_id")["name"])
+            .assign(gap=lambda frame: frame["required"] - frame["allocated"])
+            .nlargest(RESOURCE_GAPS_SHOWN, "gap")
+        )
         fig = create_multi_bar_chart(
             resource_allocation,
             "name",
-            ["allocated", "required"],
-            {"allocated": "Allocated", "required": "Required"},
-            "Resource Allocation Comparison",
+            ["allocated", "proposed", "required"],
+            {"allocated": "Allocated", "proposed": "Proposed", "required": "Required"},
+            "Largest Staffing Gaps",
         )
         st.plotly_chart(fig, use_container_width=True)
         st.write("Resources are measured in full-time equivalents (FTEs).")
 
+        st.subheader("Proposed Moves")
+        names = projects.set_index("project_id")["name"]
+        moves = plan.moves.assign(
+            from_project=plan.moves["from_project"].map(names).fillna("Bench"),
+            to_project=plan.moves["to_project"].map(names),
+        )
+        st.dataframe(
+            moves.rename(
+                columns={
+                    "employee_id": "Employee",
+                    "from_project": "From",
+                    "to_project": "To",
+                    "skill": "Skill",
+                    "level": "Level",
+                }
+            ),
+            hide_index=True,
+            use_container_width=True,
+        )
+
     with tabs[4]:
         st.subheader("Project Development Trends")
         fig = px.line(
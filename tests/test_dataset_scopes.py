@@ -0,0 +1,59 @@
+import pytest
+import streamlit as st
+
+from analytics.dataset_cache import SALARY_COLUMNS
+from analytics.employees import generate_employee_records
+from analytics.payroll import generate_payroll_ledger
+from ui.datasets import PAYROLL_EMPLOYEES, SESSION_SCOPES, load_shared_dataset
+
+HR = "HR Business Partner/HR Head"
+
+
+def load_roster():
+    return generate_employee_records(PAYROLL_EMPLOYEES)
+
+
+def load_pay():
+    # Per-employee pay rows with the employees' reporting lines
+    employees = generate_employee_records(PAYROLL_EMPLOYEES)
+    ledger = generate_payroll_ledger(employees)
+    return ledger.merge(employees[["employee_id", "manager_id", "department"]])
+
+
+def load_as(persona, name, loader):
+    st.session_state["persona"] = persona
+    try:
+        return load_shared_dataset(name, loader)
+    finally:
+        del st.session_state["persona"]
+
+
+@pytest.mark.parametrize("persona", ["Individual Contributor", "First Line Manager"])
+def test_scoped_session_gets_fewer_rows_than_hr(persona):
+    everyone = load_as(HR, "test_roster", load_roster)
+    scoped = load_as(persona, "test_roster", load_roster)
+
+    assert 0 < len(scoped) < len(everyone)
+    ((column, value),) = SESSION_SCOPES[persona].items()
+    assert (scoped[column] == value).all()
+
+
+def test_director_session_sees_its_department():
+    everyone = load_as(HR, "test_roster", load_roster)
+    director = load_as("Second Line Manager/Director", "test_roster", load_roster)
+
+    assert 0 < len(director) < len(everyone)
+    assert set(director["department"]) == {"Customer Support"}
+
+
+def test_pay_is_hidden_below_director():
+    hr_pay = load_as(HR, "test_pay", load_pay)
+    manager_pay = load_as("First Line Manager", "test_pay", load_pay)
+
+    assert "amount" in hr_pay.columns
+    assert not set(SALARY_COLUMNS) & set(manager_pay.columns)
+    assert 0 < len(manager_pay) < len(hr_pay)
+
+
+def test_unknown_persona_gets_no_rows():
+    assert len(load_as("Contractor", "test_roster", load_roster)) == 0
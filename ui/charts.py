@@ -0,0 +1,79 @@
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from matplotlib import pyplot as plt
+
+# Built charts kept per process, least recently used evicted first
+CHART_CACHE_SIZE = 256
+
+_chart_cache = OrderedDict()
+_chart_cache_lock = threading.Lock()
+
+
+def _update_fingerprint(digest, value):
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        digest.update(type(value).__name__.encode())
+        if isinstance(value, pd.DataFrame):
+            digest.update(repr(list(value.columns)).encode())
+            digest.update(repr(value.dtypes).encode())
+        else:
+            digest.update(f"{value.name!r}{value.dtype}".encode())
+        digest.update(pd.util.hash_pandas_object(value).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(f"{value.dtype}{value.shape}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            _update_fingerprint(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f"dict{len(value)}".encode())
+        for key, item in value.items():
+            _update_fingerprint(digest, key)
+            _update_fingerprint(digest, item)
+    else:
+        digest.update(repr(value).encode())
+
+
+def data_fingerprint(*args, **kwargs):
+    digest = hashlib.blake2b(digest_size=16)
+    _update_fingerprint(digest, args)
+    _update_fingerprint(digest, kwargs)
+    return digest.hexdigest()
+
+
+def cached_chart(chart_id, build, *args, **kwargs):
+    # Rebuilds only when the chart's inputs change; switching a filter back
+    # and forth, or between sessions, reuses the built figure
+    key = (chart_id, data_fingerprint(*args, **kwargs))
+    with _chart_cache_lock:
+        if key in _chart_cache:
+            _chart_cache.move_to_end(key)
+            return _chart_cache[key]
+
+    chart = build(*args, **kwargs)
+    with _chart_cache_lock:
+        _chart_cache[key] = chart
+        while len(_chart_cache) > CHART_CACHE_SIZE:
+            _chart_cache.popitem(last=False)
+    return chart
+
+
+def render_png(fig):
+    # Same output as st.pyplot, rasterized once; the figure is closed after
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def display_cached_pyplot(chart_id, build, *args, **kwargs):
+    png = cached_chart(
+        chart_id, lambda *a, **kw: render_png(build(*a, **kw)), *args, **kwargs
+    )
+    return st.image(png)
@@ -0,0 +1,212 @@
+import os
+
+import pandas as pd
+import streamlit as st
+
+from analytics.allocation import generate_project_staffing
+from analytics.compliance import ComplianceIndex, generate_compliance_records
+from analytics.dataset_cache import SharedDatasetCache, restrict_for_persona
+from analytics.demographics import (DemographicsTable,
+                                    generate_demographic_records)
+from analytics.employees import generate_employee_records
+from analytics.goals import GoalStore, generate_goal_tree
+from analytics.interviews import InterviewCalendar, generate_interview_schedule
+from analytics.online_stats import GroupedRunningStats
+from analytics.payroll import PayrollLedger, generate_payroll_ledger
+from analytics.projects import ProjectStore, generate_project_portfolio
+from analytics.recruitment import (RecruitmentEventStore,
+                                   generate_recruitment_events)
+from analytics.schemas import enforce_schema, has_schema
+from analytics.surveys import SurveyAggregates, generate_survey_responses
+from analytics.velocity import VelocityHistory, generate_sprint_history
+
+# Point at a shared-memory directory (e.g. /dev/shm/employee-assistant) when
+# several server processes should reuse each other's loaded datasets
+SHARED_CACHE_DIR = os.environ.get("SHARED_DATASET_CACHE_DIR")
+SHARED_CACHE_TTL = 24 * 60 * 60
+
+COMPLIANCE_EMPLOYEES = 100_000
+RECRUITMENT_REQUISITIONS = 10_000
+SCHEDULED_INTERVIEWS = 30_000
+DEMOGRAPHIC_EMPLOYEES = 200_000
+PAYROLL_EMPLOYEES = 20_000
+PORTFOLIO_PROJECTS = 5_000
+DELIVERY_TEAMS = 500
+
+shared_datasets = SharedDatasetCache(SHARED_CACHE_DIR, ttl=SHARED_CACHE_TTL)
+
+# Whose data each persona's sessions are scoped to. There is no sign-in, so
+# every session of a persona stands in for the person its pages are built
+# around: the IC and first line manager of the goal and payroll views, and
+# the director's department
+SESSION_SCOPES = {
+    "Individual Contributor": {"employee_id": "EMP002705"},
+    "First Line Manager": {"manager_id": "EMP000278"},
+    "Second Line Manager/Director": {"department": "Customer Support"},
+    "HR Business Partner/HR Head": {},
+}
+
+
+def _load_full_dataset(name, loader, *args):
+    if has_schema(name):
+        return shared_datasets.get_or_load(
+            name, lambda *loader_args: enforce_schema(loader(*loader_args), name), *args
+        )
+    return shared_datasets.get_or_load(name, loader, *args)
+
+
+def session_scope():
+    return SESSION_SCOPES.get(st.session_state.get("persona"), {})
+
+
+def session_departments():
+    # The departments a session's pages offer, None for the whole org
+    department = session_scope().get("department")
+    return None if department is None else [department]
+
+
+def restrict_for_session(data, scope=None):
+    # Narrows shared data, or a frame read from a shared store, to what the
+    # session's persona may see; scope defaults to the session's own
+    persona = st.session_state.get("persona")
+    if persona is None:  # a page run on its own, outside main
+        return data
+    return restrict_for_persona(
+        data, persona, session_scope() if scope is None else scope
+    )
+
+
+def load_shared_dataset(name, loader, *args, scope=None):
+    # Loaded once per process (or per shared directory) for every session,
+    # cast to the dataset's registered schema, then narrowed to what the
+    # session's persona may see
+    return restrict_for_session(_load_full_dataset(name, loader, *args), scope)
+
+
+def load_grouped_stats(name, loader, part, x, y, group, **kwargs):
+    # Running per-group statistics over one frame of a shared dataset (part
+    # indexes a multi-frame dataset, None for a single frame), built once per
+    # process from the full rows next to the dataset. Renders only query the
+    # per-group moments; later batches are merged in with update()
+    def build():
+        data = _load_full_dataset(name, loader)
+        rows = data if part is None else data[part]
+        return GroupedRunningStats.from_frame(rows, x, y, group, **kwargs)
+
+    return shared_datasets.get_or_load(f"{name}_stats", build)
+
+
+def load_survey_aggregates():
+    # Every persona reads the same precomputed aggregates; raw responses are
+    # not kept, and groups below the respondent threshold are suppressed
+    return shared_datasets.get_or_load(
+        "engagement_survey_aggregates",
+        lambda: SurveyAggregates.from_responses(
+            enforce_schema(generate_survey_responses(), "engagement_survey")
+        ),
+    )
+
+
+def _build_compliance_index(shift, seed):
+    employees = generate_employee_records(COMPLIANCE_EMPLOYEES)
+    return ComplianceIndex.from_frame(
+        generate_compliance_records(employees, shift=shift, seed=seed)
+    )
+
+
+def load_compliance_index(shift=0.0, seed=0):
+    # Org-wide compliance statuses as bitmaps; shift lowers compliance for an
+    # earlier snapshot
+    return shared_datasets.get_or_load(
+        "compliance_index", _build_compliance_index, shift, seed
+    )
+
+
+def _build_recruitment_store():
+    requisitions, transitions = generate_recruitment_events(RECRUITMENT_REQUISITIONS)
+    store = RecruitmentEventStore(requisitions["date"].min())
+    store.open_requisitions(requisitions)
+    return store.append(transitions)
+
+
+def load_recruitment_events():
+    # About a million candidate stage transitions, counted once per process;
+    # HR pages only
+    return shared_datasets.get_or_load("recruitment_events", _build_recruitment_store)
+
+
+def load_interview_calendar():
+    # Ten weeks of interviews from two weeks back; the ATS feed inserts and
+    # cancels on the shared calendar. HR pages only
+    return shared_datasets.get_or_load(
+        "interview_calendar",
+        lambda: InterviewCalendar.from_frame(
+            generate_interview_schedule(
+                SCHEDULED_INTERVIEWS,
+                start=pd.Timestamp.now().normalize() - pd.Timedelta(days=14),
+                days=70,
+            )
+        ),
+    )
+
+
+def load_demographics():
+    # Raw per-employee demographic records, reduced to bucketed codes once.
+    # Only HR pages read it, and HR sees the whole org
+    return shared_datasets.get_or_load(
+        "demographics",
+        lambda: DemographicsTable(generate_demographic_records(DEMOGRAPHIC_EMPLOYEES)),
+    )
+
+
+def _build_payroll_ledger():
+    employees = generate_employee_records(PAYROLL_EMPLOYEES)
+    ledger = generate_payroll_ledger(employees)
+    return PayrollLedger(employees, ledger["period"].min()).append(ledger)
+
+
+def load_payroll_ledger():
+    # A year of monthly pay for the org, rolled up by department and by
+    # reporting subtree once per process; pages only read the rollups, of
+    # their own subtree or of the departments restrict_for_session keeps
+    return shared_datasets.get_or_load("payroll_ledger", _build_payroll_ledger)
+
+
+def load_project_store():
+    # Every project in the portfolio with a year of spend and completion
+    # snapshots, shared by the portfolio, resource and risk views
+    return shared_datasets.get_or_load(
+        "project_store",
+        lambda: ProjectStore.from_frames(
+            *generate_project_portfolio(PORTFOLIO_PROJECTS)
+        ),
+    )
+
+
+def load_project_staffing():
+    # Skill requirements of every project in the store, the people staffed
+    # on them plus the bench, and everyone's skill levels
+    return shared_datasets.get_or_load(
+        "project_staffing",
+        lambda: generate_project_staffing(load_project_store().projects),
+    )
+
+
+def load_velocity_history():
+    # A year of two-week sprints for every delivery team; managers read
+    # their team's row and directors the department capacity sums
+    return shared_datasets.get_or_load(
+        "velocity_history",
+        lambda: VelocityHistory.from_frame(generate_sprint_history(DELIVERY_TEAMS)),
+    )
+
+
+def load_goal_store():
+    # Goals of the same org as the payroll ledger, rolled up once per
+    # process; check-ins update key results in place
+    return shared_datasets.get_or_load(
+        "goal_store",
+        lambda: GoalStore(
+            generate_goal_tree(generate_employee_records(PAYROLL_EMPLOYEES))
+        ),
+    )
@@ -5,6 +5,10 @@ import plotly.graph_objects as go
 import streamlit as st
 from matplotlib import pyplot as plt
 
+from analytics.export import (EXPORT_FORMATS, available_export_formats,
+                              export_bytes)
+from ui.charts import display_cached_pyplot
+
 
 def create_styled_metric(label, value, icon):
     styled_metric_css = """
@@ -276,6 +280,63 @@ def create_styled_tabs(tab_labels):
     return st.tabs(tab_labels)
 
 
+def create_lazy_tabs(tab_labels, key):
+    # Tab-styled radio: unlike st.tabs, only the selected tab's code runs
+    st.markdown(
+        f"""
+    <style>
+        .st-key-{key} {{
+            background-color: #f1f3f6;
+            padding: 10px 20px 0 20px;
+            border-radius: 10px 10px 0 0;
+            border-bottom: 1px solid #d1d5db;
+            margin-bottom: 20px;
+        }}
+        .st-key-{key} [role="radiogroup"] {{
+            gap: 10px;
+        }}
+        .st-key-{key} [role="radiogroup"] > label {{
+            height: 60px;
+            background-color: #f1f3f6;
+            border-radius: 10px 10px 0 0;
+            padding: 10px 20px;
+            margin: 0;
+        }}
+        .st-key-{key} [role="radiogroup"] > label > div:first-child {{
+            display: none;
+        }}
+        .st-key-{key} [role="radiogroup"] > label:has(input:checked) {{
+            background-color: #ffffff;
+            border: 1px solid #d1d5db;
+            border-bottom: none;
+            font-weight: 600;
+        }}
+        .st-key-{key} [data-testid="stMarkdownContainer"] p {{
+            font-size: 16px;
+            color: #1f2937;
+        }}
+    </style>
+    """,
+        unsafe_allow_html=True,
+    )
+    return st.radio(
+        "Section", tab_labels, horizontal=True, key=key, label_visibility="collapsed"
+    )
+
+
+@st.fragment
+def _tab_section(render, *args):
+    render(*args)
+
+
+def render_tab_sections(sections, key):
+    # sections maps each tab label to (render function, *args). Only the
+    # selected section runs, inside a fragment, so widgets in it rerun that
+    # section alone; other tabs are computed when they are first opened
+    render, *args = sections[create_lazy_tabs(list(sections), key)]
+    _tab_section(render, *args)
+
+
 def create_progress_bar(name, progress, status):
     col1, col2, col3 = st.columns([3, 1, 1])
     with col1:
@@ -339,16 +400,22 @@ def style_line_chart(fig, ax):
     plt.subplots_adjust(bottom=0.2)  # Add more space at the bottom
 
 
-def create_styled_line_chart(data, x_label, y_label):
+def build_styled_line_chart(data, x_label, y_label):
     fig, ax = plt.subplots(figsize=(4, 3))
     ax.plot(range(len(data)), data)
     ax.set_xlabel(x_label, fontsize=9)
     ax.set_ylabel(y_label, fontsize=9)
     style_line_chart(fig, ax)
-    return st.pyplot(fig)
+    return fig
 
 
-def create_styled_bar_chart(x, y, x_label, y_label):
+def create_styled_line_chart(data, x_label, y_label):
+    return display_cached_pyplot(
+        "styled_line_chart", build_styled_line_chart, data, x_label, y_label
+    )
+
+
+def build_styled_bar_chart(x, y, x_label, y_label):
     fig, ax = plt.subplots(figsize=(4, 3))
     colors = plt.cm.Blues(np.linspace(0.4, 0.8, len(x)))  # Use a blue color palette
     bars = ax.bar(x, y, color=colors, alpha=0.8)
@@ -377,7 +444,13 @@ def create_styled_bar_chart(x, y, x_label, y_label):
     ax.set_axisbelow(True)
 
     fig.tight_layout(pad=1)
-    return st.pyplot(fig)
+    return fig
+
+
+def create_styled_bar_chart(x, y, x_label, y_label):
+    return display_cached_pyplot(
+        "styled_bar_chart", build_styled_bar_chart, x, y, x_label, y_label
+    )
 
 
 def apply_styled_dropdown_css():
@@ -455,3 +528,58 @@ def create_multi_bar_chart(
     )
 
     return fig
+
+
+def create_search_selectbox(label, search_index, key, all_label=None, limit=20):
+    # Only the top matches for the typed query are sent to the browser
+    query = st.text_input(
+        label, key=f"{key}_query", placeholder="Search by name, ID or position"
+    )
+    matches = search_index.search(query, limit) if query else None
+
+    options = [] if matches is None else matches["employee_id"].tolist()
+    if all_label is not None:
+        options.append(all_label)
+    if not options:
+        st.caption("No matching employees.")
+        return None
+
+    labels = {}
+    if matches is not None:
+        for _, row in matches.iterrows():
+            labels[row["employee_id"]] = (
+                f"{row['name']} · {row['employee_id']} · {row['position']}"
+            )
+    # Keyed by query so a new search starts from its best match
+    selected = st.selectbox(
+        f"{label} results",
+        options,
+        key=f"{key}_select_{query}",
+        format_func=lambda option: labels.get(option, option),
+        label_visibility="collapsed",
+    )
+    if selected == all_label:
+        return None
+    return search_index.record(selected)
+
+
+def create_export_download(datasets, file_name, key):
+    # datasets maps a row-scope label (e.g. "Filtered", "All") to the raw
+    # DataFrame behind a table; the export is streamed in chunks on request
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        export_format = st.selectbox(
+            "Export format", available_export_formats(), key=f"{key}_format"
+        )
+    with col2:
+        scope = st.selectbox("Rows", list(datasets), key=f"{key}_scope")
+    with col3:
+        if st.button("Prepare export", key=f"{key}_prepare"):
+            extension, mime = EXPORT_FORMATS[export_format]
+            st.download_button(
+                f"Download {export_format}",
+                export_bytes(datasets[scope], export_format),
+                file_name=f"{file_name}.{extension}",
+                mime=mime,
+                key=f"{key}_download",
+            )
@@ -0,0 +1,90 @@
+import re
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Per-cell CSS bloats the payload sent to the grid; above this many cells
+# status colors are shown as glyph badges instead
+STYLER_MAX_CELLS = 10_000
+
+STATUS_COLORS = {
+    "compliant": "#90EE90",
+    "non-compliant": "#FFB6C1",
+    "warning": "#FFFFE0",
+}
+
+STATUS_BADGES = {
+    "compliant": "🟢",
+    "non-compliant": "🔴",
+    "warning": "🟡",
+}
+
+_PYTHON_FORMAT = re.compile(r"\{:(?P<spec>\.?\d*)(?P<kind>[%fd])\}")
+
+
+def to_printf_format(python_format):
+    # "{:.2%}" -> ("%.2f%%", 100); the grid formats numbers client-side
+    match = _PYTHON_FORMAT.search(python_format)
+    if match is None:
+        raise ValueError(f"Unsupported table format: {python_format}")
+
+    prefix = python_format[: match.start()].replace("%", "%%")
+    suffix = python_format[match.end() :].replace("%", "%%")
+    if match["kind"] == "%":
+        return f"{prefix}%{match['spec']}f%%{suffix}", 100
+    return f"{prefix}%{match['spec']}{match['kind']}{suffix}", 1
+
+
+def status_cell_styles(df, status_columns, status_colors=STATUS_COLORS):
+    # One lookup per column: category codes index into the CSS table, with
+    # code -1 (unknown status) landing on the trailing empty style
+    css = np.asarray(
+        [f"background-color: {color}" for color in status_colors.values()] + [""],
+        dtype=object,
+    )
+    styles = pd.DataFrame("", index=df.index, columns=df.columns)
+    for column in status_columns:
+        codes = pd.Categorical(df[column], categories=list(status_colors)).codes
+        styles[column] = css[codes]
+    return styles
+
+
+def status_badges(values, badges=STATUS_BADGES):
+    # Renaming categories touches each distinct status once, not each cell
+    statuses = pd.Categorical(values)
+    return statuses.rename_categories(
+        [f"{badges.get(status, '')} {status}".strip() for status in statuses.categories]
+    )
+
+
+def create_status_table(
+    df,
+    status_columns=(),
+    formats=None,
+    status_colors=STATUS_COLORS,
+    badges=STATUS_BADGES,
+    height=None,
+    **dataframe_kwargs,
+):
+    display_df = df.copy(deep=False)
+    column_config = {}
+    for column, python_format in (formats or {}).items():
+        printf_format, scale = to_printf_format(python_format)
+        if scale != 1:
+            display_df[column] = display_df[column].to_numpy() * scale
+        column_config[column] = st.column_config.NumberColumn(format=printf_format)
+
+    if not status_columns:
+        data = display_df
+    elif df.size <= STYLER_MAX_CELLS:
+        styles = status_cell_styles(display_df, status_columns, status_colors)
+        data = display_df.style.apply(lambda _: styles, axis=None)
+    else:
+        for column in status_columns:
+            display_df[column] = status_badges(display_df[column], badges)
+        data = display_df
+
+    if height is not None:
+        dataframe_kwargs["height"] = height
+    return st.dataframe(data, column_config=column_config, **dataframe_kwargs)